@@ -0,0 +1,251 @@
+"""
+Shared output for the bin/parse_* generators
+
+Every distinct DER certificate is written once to the content-addressed pool
+src/tlstrust/stores/pool.py (keyed by SHA-256 fingerprint), and each store module
+only holds its membership table of SKI -> fingerprint references into the pool
+
+The trust matrix src/tlstrust/stores/matrix.py is derived from the pool and all
+store modules, so it is rebuilt whenever any store is written
+
+src/tlstrust/stores/history.py keeps every version each store was written at,
+the first in full and each later version as a delta from the one before
+"""
+
+import json
+import runpy
+from base64 import b64decode, b64encode
+from calendar import timegm
+from hashlib import sha1, sha256
+from pathlib import Path
+from OpenSSL.crypto import (
+    FILETYPE_ASN1,
+    FILETYPE_PEM,
+    dump_certificate,
+    load_certificate,
+)
+from cryptography.x509 import Certificate, SubjectKeyIdentifier
+from tlstrust.context import STORES
+from tlstrust.stores import (
+    STORE_MODULES,
+    MATRIX_CELLS,
+    PRESENT,
+    DISTRUSTED,
+    subject_hash,
+    subject_key,
+)
+from tlstrust.util import get_cn_or_org, get_key_identifier_hex
+
+STORES_PATH = Path("src/tlstrust/stores")
+POOL_PATH = STORES_PATH / "pool.py"
+MATRIX_PATH = STORES_PATH / "matrix.py"
+HISTORY_PATH = STORES_PATH / "history.py"
+HEADER = '''"""
+Do not modify by hand
+Generated by: bin/{generator}
+"""
+'''
+
+
+def get_ski(certificate: Certificate) -> str:
+    """The root's key in the stores, its subject DN hash when it has no SKI"""
+    return get_key_identifier_hex(
+        certificate, extension=SubjectKeyIdentifier, key="digest"
+    ) or subject_key(certificate.subject)
+
+
+def fingerprint(der: bytes) -> str:
+    return sha256(der).hexdigest()
+
+
+def pem_to_der(pem) -> bytes:
+    if isinstance(pem, str):
+        pem = pem.encode()
+    return dump_certificate(FILETYPE_ASN1, load_certificate(FILETYPE_PEM, pem))
+
+
+def read_module(path: Path) -> dict:
+    if not path.is_file():
+        return {}
+    return runpy.run_path(str(path))
+
+
+def store_modules() -> dict[str, dict]:
+    modules = {}
+    for path in sorted(STORES_PATH.glob("*.py")):
+        if path.stem not in STORE_MODULES.values():
+            continue
+        namespace = read_module(path)
+        if "CERTIFICATES" in namespace:
+            modules[path.stem] = namespace
+    return modules
+
+
+def epoch(value) -> int:
+    return timegm(value.timetuple())
+
+
+def replay(snapshots: list[dict]) -> tuple[dict[str, str], set[str]]:
+    certificates = {}
+    untrusted = set()
+    for snapshot in snapshots:
+        for ski in snapshot["removed"]:
+            certificates.pop(ski, None)
+        certificates.update(snapshot["added"])
+        untrusted.difference_update(snapshot["undistrusted"])
+        untrusted.update(snapshot["distrusted"])
+    return certificates, untrusted
+
+
+def write_history(
+    store_name: str, version: str, certificates: dict[str, str], untrusted: list[str]
+):
+    history = read_module(HISTORY_PATH).get("HISTORY", {})
+    snapshots = history.setdefault(store_name, [])
+    if snapshots and snapshots[-1]["version"] == version:
+        snapshots.pop()
+    previous, previous_untrusted = replay(snapshots)
+    snapshots.append(
+        {
+            "version": version,
+            "added": {
+                ski: fp
+                for ski, fp in sorted(certificates.items())
+                if previous.get(ski) != fp
+            },
+            "removed": sorted(set(previous) - set(certificates)),
+            "distrusted": sorted(set(untrusted) - previous_untrusted),
+            "undistrusted": sorted(previous_untrusted - set(untrusted)),
+        }
+    )
+    HISTORY_PATH.write_text(
+        HEADER.format(generator="store_writer.py") + f"""
+__module__ = "tlstrust.stores.history"
+
+HISTORY = {json.dumps(history, sort_keys=True, indent=4, ensure_ascii=False)}
+""",
+        encoding="utf8",
+    )
+
+
+def write_pool(der_files: dict[str, str]):
+    modules = store_modules()
+    referenced = set()
+    for namespace in modules.values():
+        referenced.update(namespace["CERTIFICATES"].values())
+    # older versions in the history still reference their roots
+    for snapshots in read_module(HISTORY_PATH).get("HISTORY", {}).values():
+        for snapshot in snapshots:
+            referenced.update(snapshot["added"].values())
+    der_files = {fp: der_files[fp] for fp in sorted(referenced) if fp in der_files}
+    POOL_PATH.write_text(
+        HEADER.format(generator="store_writer.py") + f"""
+__module__ = "tlstrust.stores.pool"
+
+DER_FILES = {json.dumps(der_files, indent=4)}
+""",
+        encoding="utf8",
+    )
+    write_matrix(modules, der_files)
+
+
+def write_matrix(modules: dict[str, dict], der_files: dict[str, str]):
+    """
+    One row per SKI, MATRIX_CELLS cells per store column: PRESENT/DISTRUSTED flags
+    and the not_valid_before and not_valid_after epochs of the store's copy of the
+    root (0 when absent). SUBJECTS indexes every root key by subject DN hash
+    """
+    columns = list(STORE_MODULES)
+    parsed = {}
+    for fp, der in der_files.items():
+        parsed[fp] = load_certificate(FILETYPE_ASN1, b64decode(der))
+    rows = {}
+    for index, context_type in enumerate(columns):
+        namespace = modules.get(STORE_MODULES[context_type], {})
+        offset = index * MATRIX_CELLS
+        for ski, fp in namespace.get("CERTIFICATES", {}).items():
+            row = rows.setdefault(ski, [0] * len(columns) * MATRIX_CELLS)
+            certificate = parsed[fp].to_cryptography()
+            row[offset] |= PRESENT
+            row[offset + 1] = epoch(certificate.not_valid_before)
+            row[offset + 2] = epoch(certificate.not_valid_after)
+        for ski in namespace.get("UNTRUSTED", []):
+            row = rows.setdefault(ski, [0] * len(columns) * MATRIX_CELLS)
+            row[offset] |= DISTRUSTED
+    subjects = {}
+    for namespace in modules.values():
+        for ski, fp in namespace.get("CERTIFICATES", {}).items():
+            subject = subject_hash(parsed[fp].to_cryptography().subject)
+            if ski not in subjects.setdefault(subject, []):
+                subjects[subject].append(ski)
+    metadata = {}
+    for context_type in STORES.values():
+        namespace = modules.get(STORE_MODULES[context_type], {})
+        for ski, fp in namespace.get("CERTIFICATES", {}).items():
+            if ski in metadata:
+                continue
+            certificate = parsed[fp]
+            metadata[ski] = [
+                get_cn_or_org(certificate),
+                sha1(dump_certificate(FILETYPE_ASN1, certificate)).hexdigest(),
+                epoch(certificate.to_cryptography().not_valid_after),
+            ]
+    rows_text = "\n".join(
+        f"    {json.dumps(ski)}: {json.dumps(row)},"
+        for ski, row in sorted(rows.items())
+    )
+    metadata_text = "\n".join(
+        f"    {json.dumps(ski)}: {json.dumps(meta, ensure_ascii=False)},"
+        for ski, meta in sorted(metadata.items())
+    )
+    subjects_text = "\n".join(
+        f"    {json.dumps(subject)}: {json.dumps(sorted(keys))},"
+        for subject, keys in sorted(subjects.items())
+    )
+    MATRIX_PATH.write_text(
+        HEADER.format(generator="store_writer.py") + f"""
+__module__ = "tlstrust.stores.matrix"
+
+COLUMNS = {json.dumps(columns)}
+ROWS = {{
+{rows_text}
+}}
+METADATA = {{
+{metadata_text}
+}}
+SUBJECTS = {{
+{subjects_text}
+}}
+""",
+        encoding="utf8",
+    )
+
+
+def write_store(
+    store_name: str,
+    version: str,
+    description: str,
+    untrusted: list[str],
+    pem_files: dict,
+    generator: str,
+):
+    der_files = read_module(POOL_PATH).get("DER_FILES", {})
+    certificates = {}
+    for ski, pem in pem_files.items():
+        der = pem_to_der(pem)
+        certificates[ski] = fingerprint(der)
+        der_files[certificates[ski]] = b64encode(der).decode()
+    store_path = STORES_PATH / f"{store_name}.py"
+    store_path.write_text(
+        HEADER.format(generator=generator) + f"""
+__module__ = "tlstrust.stores.{store_name}"
+__version__ = {json.dumps(version, ensure_ascii=False)}
+__description__ = {json.dumps(description, ensure_ascii=False)}
+
+UNTRUSTED = {json.dumps(sorted(untrusted), indent=4, ensure_ascii=False)}
+CERTIFICATES = {json.dumps(certificates, sort_keys=True, indent=4)}
+""",
+        encoding="utf8",
+    )
+    write_history(store_name, version, certificates, untrusted)
+    write_pool(der_files)
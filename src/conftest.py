@@ -0,0 +1,22 @@
+import pytest
+from tlstrust.registry import REGISTRY, register_store, unregister_store
+
+
+@pytest.fixture(scope="module")
+def store_registry():
+    """
+    register_store for a test module, every store it registers is removed again
+    when the module's tests are done so no other module sees it, unless a test
+    unregistered it itself
+    """
+    registered = []
+
+    def register(context_type: int, name: str, pem_files: dict, **kwargs):
+        descriptor = register_store(context_type, name, pem_files, **kwargs)
+        registered.append(context_type)
+        return descriptor
+
+    yield register
+    for context_type in reversed(registered):
+        if context_type in REGISTRY:
+            unregister_store(context_type)
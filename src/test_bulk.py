@@ -0,0 +1,86 @@
+from datetime import datetime
+from time import time
+import pytest
+from tlstrust import TrustStore, evaluate_many, expired_many, bulk, context, stores
+
+good_ski = "bf5fb7d1cedd1f86f45b55acdcd710c20ea988e7"
+bad_ski = "c4a7b1a47b2c71fadbe14b9075ffc41560858910"
+
+
+def test_evaluate_many():
+    key_identifiers = sorted(stores.load_matrix().ROWS) + [bad_ski]
+    contexts = list(context.STORES.values()) + [None]
+    results = evaluate_many(key_identifiers, contexts)
+    assert results.shape == (len(key_identifiers), len(contexts))
+    assert len(results.tobytes()) == len(key_identifiers) * len(contexts)
+    for ski in key_identifiers:
+        trust_store = TrustStore(ski)
+        for context_type in contexts:
+            assert results[ski, context_type] == trust_store.check_trust(context_type)
+    assert not any(results.row(bad_ski).values())
+    assert results.column(context.SOURCE_CCADB)[-1] is False
+
+
+def test_evaluate_many_as_of():
+    past = evaluate_many([good_ski], [context.SOURCE_CCADB], as_of=0)
+    assert past[good_ski, context.SOURCE_CCADB]
+    future = evaluate_many(
+        [good_ski], [context.SOURCE_CCADB], as_of=datetime(9999, 1, 1)
+    )
+    assert not future[good_ski, context.SOURCE_CCADB]
+
+
+def test_evaluate_many_bad_context():
+    with pytest.raises(AttributeError):
+        evaluate_many([good_ski], [999])
+    with pytest.raises(TypeError):
+        evaluate_many([good_ski], ["ccadb"])
+
+
+def test_expired_many():
+    key_identifiers = sorted(stores.load_matrix().ROWS) + [bad_ski]
+    contexts = list(context.STORES.values())
+    now = time()
+    results = expired_many(key_identifiers, contexts, as_of=now)
+    for ski in key_identifiers:
+        trust_store = TrustStore(ski)
+        for context_type in contexts:
+            try:
+                expected = trust_store.expired_in_store(context_type, as_of=now)
+            except FileExistsError:
+                expected = False
+            assert results[ski, context_type] == expected
+    _, not_valid_after = stores.lookup_validity(good_ski, context.SOURCE_CCADB)
+    assert not expired_many([good_ski], [context.SOURCE_CCADB], as_of=not_valid_after)[
+        good_ski, context.SOURCE_CCADB
+    ]
+    assert expired_many([good_ski], [context.SOURCE_CCADB], as_of=not_valid_after + 1)[
+        good_ski, context.SOURCE_CCADB
+    ]
+    with pytest.raises(TypeError):
+        expired_many([good_ski], [None])
+
+
+def test_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    results = evaluate_many([good_ski, bad_ski])
+    array = results.to_numpy()
+    assert array.dtype == numpy.bool_
+    assert array.shape == results.shape
+    assert array[0].tolist() == list(results.row(good_ski).values())
+
+
+def test_without_numpy(monkeypatch):
+    key_identifiers = sorted(stores.load_matrix().ROWS) + [bad_ski]
+    contexts = list(context.STORES.values())
+    now = time()
+    expected = (
+        evaluate_many(key_identifiers, contexts + [None], as_of=now).tobytes(),
+        expired_many(key_identifiers, contexts, as_of=now).tobytes(),
+    )
+    monkeypatch.setattr(bulk, "numpy", None)
+    assert (
+        evaluate_many(key_identifiers, contexts + [None], as_of=now).tobytes(),
+        expired_many(key_identifiers, contexts, as_of=now).tobytes(),
+    ) == expected
+    assert evaluate_many([], contexts).tobytes() == b""
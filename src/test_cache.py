@@ -0,0 +1,60 @@
+from threading import Thread
+import pytest
+from tlstrust.cache import LRUCache, CacheInfo
+
+
+def test_lru_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert "a" in cache
+    assert "c" in cache
+    assert cache.info() == CacheInfo(
+        hits=1, misses=0, evictions=1, maxsize=2, currsize=2
+    )
+
+
+def test_lru_misses():
+    cache = LRUCache()
+    sentinel = object()
+    assert cache.get("missing") is None
+    assert cache.get("missing", sentinel) is sentinel
+    assert cache.info().misses == 2
+    cache.clear()
+    assert cache.info() == CacheInfo(0, 0, 0, 1024, 0)
+
+
+def test_lru_invalid_maxsize():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_lru_threads():
+    cache = LRUCache(maxsize=64)
+
+    def work(offset: int):
+        for i in range(500):
+            cache.put((offset, i), i)
+            cache.get((offset, i - 1))
+
+    threads = [Thread(target=work, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    info = cache.info()
+    assert info.currsize == 64
+    assert info.evictions == 8 * 500 - 64
+
+
+def test_lru_hit_ratio():
+    cache = LRUCache()
+    assert cache.info().hit_ratio == 0.0
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("b")
+    cache.get("a")
+    assert cache.info().hit_ratio == 2 / 3
@@ -0,0 +1,71 @@
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+import pytest
+from tlstrust import TrustStore
+from tlstrust.cli import __main__ as cli
+
+GOOD_SKI = "bf5fb7d1cedd1f86f45b55acdcd710c20ea988e7"
+
+# the first target is the slowest, so with workers it finishes last
+DELAYS = {"a.example.com": 0.3, "b.example.com": 0.1, "c.example.com": 0}
+
+
+def test_workers_keep_target_order(monkeypatch, tmp_path):
+    finished = []
+
+    def get_certificate_chain(host, port, **_):
+        time.sleep(DELAYS[host])
+        finished.append(host)
+
+    monkeypatch.setattr(cli, "get_certificate_chain", get_certificate_chain)
+    json_file = tmp_path / "results.json"
+    monkeypatch.setattr(
+        sys, "argv", ["tlstrust", *DELAYS, "-w", "3", "-O", str(json_file)]
+    )
+    cli.main()
+    assert finished != list(DELAYS)
+    evaluations = json.loads(json_file.read_text(encoding="utf8"))["evaluations"]
+    assert [data["_query"]["host_name"] for data in evaluations] == list(DELAYS)
+    assert all(
+        data["_query"]["failure"] == cli.FAILURE_HANDSHAKE for data in evaluations
+    )
+
+
+def test_scan_output(monkeypatch, capsys):
+    def get_certificate_chain(host, port, **_):
+        if host == "refused.example.com":
+            raise ConnectionRefusedError("refused")
+        return "leaf", ["leaf"], "192.0.2.1"
+
+    monkeypatch.setattr(cli, "get_certificate_chain", get_certificate_chain)
+    monkeypatch.setattr(
+        cli, "trust_stores_from_chain", lambda *_, **__: [TrustStore(GOOD_SKI)]
+    )
+    monkeypatch.setattr(
+        sys, "argv", ["tlstrust", "trusted.example.com", "refused.example.com:8443"]
+    )
+    cli.main()
+    out = capsys.readouterr().out
+    assert "trusted.example.com:443 (192.0.2.1)" in out
+    assert f"SKI {GOOD_SKI}" in out
+    assert "refused refused.example.com:8443" in out
+    query, evaluations = cli.scan("trusted.example.com", 443)
+    assert query["peer_address"] == "192.0.2.1"
+    assert evaluations[0][1]["_query"] is query
+    assert cli.classify_failure(ConnectionRefusedError()) == (
+        cli.scan("refused.example.com", 443)[0]["failure"]
+    )
+
+
+def test_date_diff():
+    now = datetime.utcnow()
+    assert cli.date_diff(now - timedelta(days=3, hours=-1)) == "Expired 3 days ago"
+    assert cli.date_diff(now - timedelta(hours=12)) == "Expired yesterday"
+    assert cli.date_diff(now + timedelta(days=1, hours=1)) == "Expires tomorrow"
+    assert cli.date_diff(now + timedelta(days=30, hours=1)) == "Expires in 30 days"
+    assert cli.date_diff(now + timedelta(days=800)).endswith("(2 years)")
+    assert cli.date_diff(now + timedelta(hours=1)) == "Expires today"
+    with pytest.raises(TypeError):
+        cli.styled_boolean(None)
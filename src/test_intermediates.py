@@ -0,0 +1,92 @@
+import pytest
+from OpenSSL.crypto import X509
+from cryptography.hazmat.primitives.serialization import Encoding
+from tlstrust import trust_stores_from_chain, util
+from tlstrust.intermediates import IntermediateStore, is_intermediate
+from tlstrust.stores import subject_key
+from test_util import digests, issue
+
+
+@pytest.fixture(scope="module")
+def incomplete_pki(store_registry):
+    """root -> intermediate -> issuing -> leaf, key identifiers on all but legacy"""
+    root = issue("tlstrust intermediates root", ca=True)
+    intermediate = issue("tlstrust intermediates intermediate", root, ca=True)
+    issuing = issue("tlstrust intermediates issuing CA", intermediate, ca=True)
+    leaf = issue("tlstrust-intermediates.test", issuing, ca=False)
+    legacy = issue(
+        "tlstrust intermediates legacy CA", intermediate, key_identifiers=False, ca=True
+    )
+    legacy_leaf = issue(
+        "legacy.tlstrust-intermediates.test", legacy, key_identifiers=False, ca=False
+    )
+    record = util.certificate_record(X509.from_cryptography(root[0]))
+    store_registry(
+        9005,
+        "Intermediates PKI",
+        {record.ski: root[0].public_bytes(Encoding.PEM)},
+    )
+    return {
+        name: X509.from_cryptography(cert)
+        for name, (cert, _) in {
+            "root": root,
+            "intermediate": intermediate,
+            "issuing": issuing,
+            "leaf": leaf,
+            "legacy": legacy,
+            "legacy_leaf": legacy_leaf,
+        }.items()
+    }
+
+
+def test_learn(incomplete_pki, tmp_path):
+    path = str(tmp_path / "intermediates.sqlite3")
+    store = IntermediateStore(path)
+    assert not is_intermediate(incomplete_pki["root"])
+    assert not is_intermediate(incomplete_pki["leaf"])
+    assert store.learn(incomplete_pki.values()) == 3
+    assert store.learn([incomplete_pki["issuing"]]) == 0
+    assert len(store) == 3
+    assert incomplete_pki["issuing"] in store
+    assert incomplete_pki["leaf"] not in store
+    issuing = util.certificate_record(incomplete_pki["issuing"])
+    (found,) = store.issuers(issuing.ski)
+    assert found.digest("sha256") == incomplete_pki["issuing"].digest("sha256")
+    (found,) = store.issuers(
+        subject_key(incomplete_pki["legacy"].to_cryptography().subject)
+    )
+    assert found.digest("sha256") == incomplete_pki["legacy"].digest("sha256")
+    assert store.issuers("noop") == []
+    store.close()
+    assert len(IntermediateStore(path)) == 3
+
+
+def test_eviction(incomplete_pki):
+    store = IntermediateStore(":memory:", maxsize=2)
+    store.learn([incomplete_pki["intermediate"], incomplete_pki["issuing"]])
+    store.issuers(util.certificate_record(incomplete_pki["intermediate"]).ski)
+    store.learn([incomplete_pki["legacy"]])
+    assert len(store) == 2
+    assert incomplete_pki["intermediate"] in store
+    assert incomplete_pki["issuing"] not in store
+    with pytest.raises(ValueError):
+        IntermediateStore(":memory:", maxsize=0)
+
+
+def test_complete_chains(incomplete_pki):
+    leaf, issuing, intermediate, root = [
+        incomplete_pki[name] for name in ("leaf", "issuing", "intermediate", "root")
+    ]
+    store = IntermediateStore(":memory:")
+    assert util.build_chains(leaf, [leaf], intermediates=store) == {}
+    assert trust_stores_from_chain(
+        leaf, [leaf, issuing, intermediate], intermediates=store
+    )
+    graph = util.build_chain_graph(leaf, [leaf], intermediates=store, verify=True)
+    assert digests(graph.paths()) == digests([[leaf, issuing, intermediate, root]])
+    legacy_leaf = incomplete_pki["legacy_leaf"]
+    store.learn([incomplete_pki["legacy"]])
+    graph = util.build_chain_graph(legacy_leaf, [legacy_leaf], intermediates=store)
+    assert digests(graph.paths()) == digests(
+        [[legacy_leaf, incomplete_pki["legacy"], intermediate, root]]
+    )
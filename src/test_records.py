@@ -0,0 +1,69 @@
+from tlstrust import records
+
+DERS = [b"\x30\x82leaf" * 40, b"\x30\x82issuing" * 30]
+
+
+def record(content_type: int, fragment: bytes) -> bytes:
+    return (
+        bytes([content_type])
+        + b"\x03\x03"
+        + len(fragment).to_bytes(2, "big")
+        + fragment
+    )
+
+
+def message(message_type: int, body: bytes) -> bytes:
+    return bytes([message_type]) + len(body).to_bytes(3, "big") + body
+
+
+def server_hello(extensions: bytes = b"") -> bytes:
+    # version, random, empty session id, TLS_AES_128_GCM_SHA256, no compression
+    body = b"\x03\x03" + bytes(32) + b"\x00" + b"\x13\x01" + b"\x00"
+    if extensions:
+        body += len(extensions).to_bytes(2, "big") + extensions
+    return message(records.HANDSHAKE_SERVER_HELLO, body)
+
+
+def certificate(ders: list[bytes]) -> bytes:
+    entries = b"".join(len(der).to_bytes(3, "big") + der for der in ders)
+    return message(
+        records.HANDSHAKE_CERTIFICATE, len(entries).to_bytes(3, "big") + entries
+    )
+
+
+def test_certificates_across_records():
+    flight = server_hello() + certificate(DERS)
+    records_flight = record(records.RECORD_HANDSHAKE, flight[:100]) + record(
+        records.RECORD_HANDSHAKE, flight[100:]
+    )
+    parser = records.ServerFlightParser()
+    # a byte at a time, as the network might deliver it
+    for index in range(len(records_flight) - 1):
+        assert parser.feed(records_flight[index : index + 1]) is None
+    assert parser.feed(records_flight[-1:]) == DERS
+    assert parser.version == 0x0303
+    assert parser.plaintext
+
+
+def test_tls_1_3():
+    supported_versions = b"\x00\x2b\x00\x02\x03\x04"
+    parser = records.ServerFlightParser()
+    parser.feed(record(records.RECORD_HANDSHAKE, server_hello(supported_versions)))
+    assert parser.version == records.TLS_1_3
+    assert not parser.plaintext
+    assert parser.feed(record(23, b"encrypted")) is None
+
+
+def test_not_plaintext():
+    alert = records.ServerFlightParser()
+    assert alert.feed(record(21, b"\x02\x28")) is None
+    assert not alert.plaintext
+    malformed = records.ServerFlightParser()
+    malformed.feed(
+        record(
+            records.RECORD_HANDSHAKE,
+            message(records.HANDSHAKE_CERTIFICATE, b"\xff\xff\xff"),
+        )
+    )
+    assert not malformed.plaintext
+    assert malformed.certificates is None
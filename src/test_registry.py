@@ -0,0 +1,94 @@
+import pytest
+from OpenSSL.crypto import FILETYPE_PEM, dump_certificate
+from tlstrust import TrustStore, context, stores, util
+from tlstrust.registry import (
+    REGISTRY,
+    PackagedStore,
+    SnapshotStore,
+    register_store,
+    unregister_store,
+)
+
+good_ski = "bf5fb7d1cedd1f86f45b55acdcd710c20ea988e7"
+bad_ski = "c4a7b1a47b2c71fadbe14b9075ffc41560858910"
+custom_context = 9001
+unregistered_context = 9006
+
+
+def test_packaged_stores():
+    assert set(REGISTRY) == set(context.STORES.values())
+    descriptor = REGISTRY[context.SOURCE_CCADB]
+    assert isinstance(descriptor, PackagedStore)
+    assert descriptor.version == stores.VERSIONS[context.CCADB]
+    assert good_ski in descriptor
+    assert descriptor.lookup_trust(good_ski) == stores.lookup_trust(
+        good_ski, context.SOURCE_CCADB
+    )
+    assert REGISTRY[context.SOURCE_ANDROID].distrusted_by == stores.android_untrusted()
+    with pytest.raises(AttributeError):
+        REGISTRY[999]
+
+
+def test_register_store(store_registry):
+    certificate = util.get_certificate_from_store(good_ski, context.SOURCE_CCADB)
+    descriptor = store_registry(
+        custom_context,
+        "Custom",
+        {good_ski: dump_certificate(FILETYPE_PEM, certificate).decode()},
+        untrusted=[bad_ski],
+        version="1",
+    )
+    assert REGISTRY[custom_context] is descriptor
+    assert util.valid_context_type(custom_context)
+    assert util.match_certificate(
+        good_ski, util.get_certificate_from_store(good_ski, custom_context)
+    )
+    assert descriptor.lookup_trust(good_ski) == stores.lookup_trust(
+        good_ski, context.SOURCE_CCADB
+    )
+    assert descriptor.lookup_trust(bad_ski) == (stores.DISTRUSTED, 0)
+    assert TrustStore(good_ski).check_trust(custom_context) == TrustStore(
+        good_ski
+    ).check_trust(context.SOURCE_CCADB)
+    assert not TrustStore(bad_ski).check_trust(custom_context)
+    with pytest.raises(ValueError):
+        register_store(custom_context, "Custom", {})
+
+
+def test_unregister_store(store_registry):
+    certificate = util.get_certificate_from_store(good_ski, context.SOURCE_CCADB)
+    pem = dump_certificate(FILETYPE_PEM, certificate).decode()
+    store_registry(unregistered_context, "Custom", {good_ski: pem})
+    assert REGISTRY.root_index()[good_ski][-1] == unregistered_context
+    assert util.get_certificate_from_store(good_ski, unregistered_context)
+    generation = REGISTRY.generation
+    descriptor = unregister_store(unregistered_context)
+    assert descriptor.name == "Custom"
+    assert unregistered_context not in REGISTRY
+    assert REGISTRY.generation > generation
+    assert unregistered_context not in REGISTRY.root_index()[good_ski]
+    with pytest.raises(AttributeError):
+        unregister_store(unregistered_context)
+    # registered again, the old store's roots are not served from cache
+    register_store(unregistered_context, "Custom", {})
+    try:
+        with pytest.raises(FileExistsError):
+            util.get_certificate_from_store(good_ski, unregistered_context)
+    finally:
+        unregister_store(unregistered_context)
+
+
+def test_snapshot_store():
+    version = stores.VERSIONS[context.CCADB]
+    assert (
+        REGISTRY.at_version(context.SOURCE_CCADB, version)
+        is REGISTRY[context.SOURCE_CCADB]
+    )
+    snapshot = SnapshotStore(context.SOURCE_CCADB, "CCADB", version)
+    assert snapshot.version == version
+    assert good_ski in snapshot
+    assert snapshot.lookup_trust(good_ski) == stores.lookup_trust(
+        good_ski, context.SOURCE_CCADB
+    )
+    with pytest.raises(ValueError):
+        REGISTRY.at_version(context.SOURCE_CCADB, "noop")
@@ -0,0 +1,71 @@
+import asyncio
+import socket
+import pytest
+from tlstrust import resolver
+
+V4 = (socket.AF_INET, ("192.0.2.1", 443))
+V6 = (socket.AF_INET6, ("2001:db8::1", 443, 0, 0))
+
+
+@pytest.fixture
+def listener():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        yield (socket.AF_INET, sock.getsockname())
+
+
+@pytest.fixture
+def refused():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return (socket.AF_INET, sock.getsockname())
+
+
+def test_interleave_families():
+    v4_other = (socket.AF_INET, ("192.0.2.2", 443))
+    assert resolver.interleave_families([V6, V4, v4_other]) == [V6, V4, v4_other]
+    assert resolver.interleave_families([V4, v4_other, V6]) == [V4, V6, v4_other]
+    assert resolver.interleave_families([]) == []
+
+
+def test_resolver_ttl(monkeypatch):
+    answers = []
+
+    def getaddrinfo(host, port, type=0):
+        answers.append(host)
+        return [(V6[0], type, 6, "", V6[1]), (V4[0], type, 6, "", V4[1])] * 2
+
+    monkeypatch.setattr(resolver, "getaddrinfo", getaddrinfo)
+    cached = resolver.Resolver(ttl=60)
+    assert cached.resolve("example.test", 443) == [V6, V4]
+    assert cached.resolve("example.test", 443) == [V6, V4]
+    assert answers == ["example.test"]
+    expired = resolver.Resolver(ttl=0)
+    expired.resolve("example.test", 443)
+    expired.resolve("example.test", 443)
+    assert len(answers) == 3
+    with pytest.raises(ValueError):
+        resolver.Resolver(ttl=-1)
+
+
+def test_connect_first(listener, refused):
+    with resolver.connect_first([refused, listener], timeout=3) as sock:
+        assert sock.getpeername() == listener[1]
+        assert sock.getblocking()
+    with pytest.raises(ConnectionRefusedError):
+        resolver.connect_first([refused], timeout=3)
+    with pytest.raises(OSError):
+        resolver.connect_first([], timeout=3)
+
+
+def test_open_connection_first_async(listener, refused):
+    async def connect(addresses):
+        _, writer = await resolver.open_connection_first_async(addresses)
+        peer = writer.get_extra_info("peername")
+        writer.close()
+        return peer
+
+    assert asyncio.run(connect([refused, listener])) == listener[1]
+    with pytest.raises(ConnectionRefusedError):
+        asyncio.run(connect([refused]))
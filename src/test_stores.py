@@ -0,0 +1,254 @@
+import subprocess
+from calendar import timegm
+import sys
+from types import SimpleNamespace
+import pytest
+from tlstrust import context, stores, util
+from tlstrust.stores.tlsdb import InvalidDatabaseError
+
+GOOD_SKI = "bf5fb7d1cedd1f86f45b55acdcd710c20ea988e7"
+
+IMPORT_BUDGET_SECONDS = 0.5
+IMPORT_PROBE = """
+import sys, time
+import OpenSSL.SSL, cryptography.x509, certifi, idna, validators
+start = time.perf_counter()
+import tlstrust
+elapsed = time.perf_counter() - start
+data = set(tlstrust.stores.STORE_MODULES.values()) | {"pool", "matrix"}
+loaded = sorted(m for m in data if f"tlstrust.stores.{m}" in sys.modules)
+print(elapsed, ",".join(loaded))
+"""
+
+
+def test_import_is_lazy():
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    elapsed, loaded = result.stdout.split()[0], result.stdout.split()[1:]
+    assert loaded == []
+    assert float(elapsed) < IMPORT_BUDGET_SECONDS
+
+
+def test_load_store():
+    module = stores.load_store(context.SOURCE_CCADB)
+    assert module.__name__ == "tlstrust.stores.ccadb"
+    assert stores.load_store(context.PLATFORM_FEDORA_LINUX) is module
+    with pytest.raises(AttributeError):
+        stores.load_store(999)
+
+
+def test_versions():
+    assert (
+        stores.VERSIONS[context.CCADB]
+        == stores.load_store(context.SOURCE_CCADB).__version__
+    )
+    assert stores.VERSIONS[context.LINUX_DEBIAN] == stores.VERSIONS[context.CCADB]
+    assert context.PY_REQUESTS in stores.VERSIONS
+
+
+def test_trust_matrix():
+    for context_type in stores.STORE_MODULES:
+        module = stores.load_store(context_type)
+        for ski in module.CERTIFICATES:
+            flags, not_valid_after = stores.lookup_trust(ski, context_type)
+            assert flags & stores.PRESENT
+            assert not_valid_after > 0
+        for ski in module.UNTRUSTED:
+            flags, _ = stores.lookup_trust(ski, context_type)
+            assert flags & stores.DISTRUSTED
+    assert stores.lookup_trust("noop", context.SOURCE_CCADB) == (0, 0)
+
+
+def test_untrusted_sets():
+    android = stores.android_untrusted()
+    assert isinstance(android, frozenset)
+    assert stores.android_untrusted() is android
+    for context_type in stores.ANDROID_STORES:
+        distrusted = stores.untrusted(context_type)
+        assert isinstance(distrusted, frozenset)
+        assert distrusted == set(stores.load_store(context_type).UNTRUSTED)
+        assert distrusted <= android
+    ski = next(iter(android))
+    assert stores.untrusted_members(
+        [ski, GOOD_SKI], context.SOURCE_ANDROID, android_family=True
+    ) == {ski}
+    assert not stores.untrusted_members([GOOD_SKI], context.SOURCE_CCADB)
+
+
+def test_trust_matrix_expiry():
+    ski = GOOD_SKI
+    certificate = util.get_certificate_from_store(ski, context.SOURCE_CCADB)
+    _, not_valid_after = stores.lookup_trust(ski, context.SOURCE_CCADB)
+    assert not_valid_after == timegm(
+        certificate.to_cryptography().not_valid_after.timetuple()
+    )
+    common_name, sha1_fingerprint, _ = stores.lookup_metadata(ski)
+    assert common_name == util.get_cn_or_org(certificate)
+    assert (
+        sha1_fingerprint == certificate.digest("sha1").decode().replace(":", "").lower()
+    )
+
+
+def test_subject_index():
+    certificate = util.get_certificate_from_store(GOOD_SKI, context.SOURCE_CCADB)
+    name_hash = stores.subject_hash(certificate.to_cryptography().subject)
+    assert GOOD_SKI in stores.lookup_subject(name_hash)
+    assert stores.lookup_subject("noop") == ()
+    assert stores.subject_key(certificate.to_cryptography().subject) == (
+        stores.SUBJECT_KEY_PREFIX + name_hash
+    )
+
+
+def test_validity_arrays():
+    certificate = util.get_certificate_from_store(GOOD_SKI, context.SOURCE_CCADB)
+    not_valid_before, not_valid_after = stores.lookup_validity(
+        GOOD_SKI, context.SOURCE_CCADB
+    )
+    assert not_valid_before == timegm(
+        certificate.to_cryptography().not_valid_before.timetuple()
+    )
+    positions, before, after = stores.validity_arrays(context.SOURCE_CCADB)
+    assert stores.validity_arrays(context.SOURCE_CCADB)[0] is positions
+    assert len(positions) == len(before) == len(after)
+    assert set(positions) == set(stores.load_store(context.SOURCE_CCADB).CERTIFICATES)
+    assert before[positions[GOOD_SKI]] == not_valid_before
+    assert after[positions[GOOD_SKI]] == not_valid_after
+    assert stores.lookup_validity("noop", context.SOURCE_CCADB) == (0, 0)
+    with pytest.raises(AttributeError):
+        stores.validity_arrays(999)
+    row = stores.matrix_rows()[GOOD_SKI]
+    flags, before, after = stores.matrix_columns(context.SOURCE_CCADB)
+    assert len(flags) == len(before) == len(after) == len(stores.matrix_rows())
+    assert (flags[row], after[row]) == stores.lookup_trust(
+        GOOD_SKI, context.SOURCE_CCADB
+    )
+    assert before[row] == not_valid_before
+    with pytest.raises(AttributeError):
+        stores.matrix_columns(999)
+
+
+def test_store_history():
+    module = stores.load_store(context.SOURCE_CCADB)
+    assert stores.store_history(context.SOURCE_CCADB)[-1] == module.__version__
+    certificates, untrusted = stores.load_snapshot(
+        context.SOURCE_CCADB, module.__version__
+    )
+    assert certificates == module.CERTIFICATES
+    assert untrusted == stores.untrusted(context.SOURCE_CCADB)
+    with pytest.raises(ValueError):
+        stores.load_snapshot(context.SOURCE_CCADB, "noop")
+
+
+def test_store_history_deltas(monkeypatch):
+    history = SimpleNamespace(
+        HISTORY={
+            "ccadb": [
+                {
+                    "version": "1",
+                    "added": {"aa": "fp-aa", "bb": "fp-bb"},
+                    "removed": [],
+                    "distrusted": ["cc"],
+                    "undistrusted": [],
+                },
+                {
+                    "version": "2",
+                    "added": {"dd": "fp-dd"},
+                    "removed": ["aa"],
+                    "distrusted": ["aa"],
+                    "undistrusted": ["cc"],
+                },
+            ]
+        }
+    )
+    monkeypatch.setattr(stores, "load_history", lambda: history)
+    stores.load_snapshot.cache_clear()
+    try:
+        assert stores.store_history(context.SOURCE_CCADB) == ["1", "2"]
+        assert stores.load_snapshot(context.SOURCE_CCADB, "1") == (
+            {"aa": "fp-aa", "bb": "fp-bb"},
+            {"cc"},
+        )
+        assert stores.load_snapshot(context.SOURCE_CCADB, "2") == (
+            {"bb": "fp-bb", "dd": "fp-dd"},
+            {"aa"},
+        )
+    finally:
+        stores.load_snapshot.cache_clear()
+
+
+def test_tlsdb_roundtrip(tmp_path):
+    path = stores.write_db(tmp_path / "stores.tlsdb")
+    with stores.open_db(path) as database:
+        assert set(database.contexts) == set(stores.STORE_MODULES)
+        for context_type in stores.STORE_MODULES:
+            module = stores.load_store(context_type)
+            for ski, fingerprint in module.CERTIFICATES.items():
+                assert database.lookup_trust(ski, context_type) == stores.lookup_trust(
+                    ski, context_type
+                )
+                der = database.get_der(ski, context_type)
+                assert isinstance(der, memoryview)
+                assert bytes(der) == stores.get_der(fingerprint)
+        assert database.find("noop") is None
+        assert database.lookup_trust("00", context.SOURCE_CCADB) == (0, 0)
+        assert database.get_der(GOOD_SKI, 999) is None
+
+
+def test_tlsdb_subject_keys(tmp_path, monkeypatch):
+    ccadb = stores.load_store(context.SOURCE_CCADB)
+    dn_key = stores.SUBJECT_KEY_PREFIX + "ab" * 20
+    distrusted_dn_key = stores.SUBJECT_KEY_PREFIX + "cd" * 20
+    module = SimpleNamespace(
+        CERTIFICATES={**ccadb.CERTIFICATES, dn_key: ccadb.CERTIFICATES[GOOD_SKI]},
+        UNTRUSTED=[*ccadb.UNTRUSTED, distrusted_dn_key],
+    )
+    monkeypatch.setattr(stores, "load_store", lambda context_type: module)
+    path = stores.write_db(tmp_path / "stores.tlsdb", [context.SOURCE_CCADB])
+    with stores.open_db(path) as database:
+        assert len(database) == len(set(module.CERTIFICATES) | set(module.UNTRUSTED))
+        # the same root under its DN, it shares the SKI record's DER
+        assert database.lookup_trust(
+            dn_key, context.SOURCE_CCADB
+        ) == stores.lookup_trust(GOOD_SKI, context.SOURCE_CCADB)
+        assert bytes(database.get_der(dn_key, context.SOURCE_CCADB)) == bytes(
+            database.get_der(GOOD_SKI, context.SOURCE_CCADB)
+        )
+        assert database.lookup_trust(distrusted_dn_key, context.SOURCE_CCADB) == (
+            stores.DISTRUSTED,
+            0,
+        )
+        # the subject hash bytes alone are not mistaken for an SKI
+        assert database.find("ab" * 20) is None
+    module.CERTIFICATES["dn:noop"] = ccadb.CERTIFICATES[GOOD_SKI]
+    with pytest.raises(ValueError):
+        stores.write_db(tmp_path / "invalid.tlsdb", [context.SOURCE_CCADB])
+
+
+def test_tlsdb_truncated(tmp_path):
+    path = stores.write_db(tmp_path / "stores.tlsdb")
+    assert [entry.name for entry in tmp_path.iterdir()] == ["stores.tlsdb"]
+    data = path.read_bytes()
+    path.write_bytes(data[: len(data) // 2])
+    with pytest.raises(InvalidDatabaseError):
+        stores.open_db(path)
+    path.write_bytes(data[:-1])
+    with pytest.raises(InvalidDatabaseError):
+        stores.open_db(path)
+    # written again over the truncated file, readers see the whole database
+    stores.write_db(path)
+    with stores.open_db(path) as database:
+        assert len(database) > 0
+
+
+def test_tlsdb_invalid(tmp_path):
+    path = tmp_path / "empty.tlsdb"
+    path.write_bytes(b"")
+    with pytest.raises(InvalidDatabaseError):
+        stores.open_db(path)
+    path.write_bytes(b"\x00" * 128)
+    with pytest.raises(InvalidDatabaseError):
+        stores.open_db(path)
@@ -0,0 +1,43 @@
+import pytest
+from tlstrust import timing
+
+
+def test_deadline():
+    deadline = timing.Deadline(60)
+    assert 59 < deadline.remaining <= 60
+    assert deadline.timeout(3) == 3
+    assert deadline.timeout(120) <= 60
+    assert not deadline.expired
+    deadline.expires -= 60
+    assert deadline.expired
+    with pytest.raises(TimeoutError):
+        deadline.timeout(3)
+    with pytest.raises(ValueError):
+        timing.Deadline(0)
+
+
+def test_network_of():
+    assert timing.network_of("192.0.2.77") == "192.0.2.0/24"
+    assert timing.network_of("2001:db8:1:2::1") == "2001:db8:1::/48"
+    assert timing.network_of("fe80::1%eth0") == "fe80::/48"
+
+
+def test_rtt_estimator():
+    rtt = timing.RTTEstimator(default_timeout=3)
+    assert rtt.rtt("192.0.2.1") is None
+    assert rtt.connect_timeout("192.0.2.1") == 3
+    assert rtt.handshake_timeout("192.0.2.1") == 3
+    for _ in range(20):
+        rtt.observe("192.0.2.1", 0.1)
+    # shared across the network, converging on the observed RTT
+    smoothed, variation = rtt.rtt("192.0.2.200")
+    assert smoothed == pytest.approx(0.1)
+    assert variation < 0.01
+    # no shorter than one SYN retransmission, however fast the network
+    assert rtt.connect_timeout("192.0.2.200") == timing.MIN_TIMEOUT == 1
+    assert timing.Deadline(0.5).timeout(rtt.connect_timeout("192.0.2.200")) <= 0.5
+    assert rtt.handshake_timeout("192.0.2.200") == pytest.approx(
+        timing.HANDSHAKE_ROUND_TRIPS * 0.1 + 4 * variation + timing.SERVER_ALLOWANCE
+    )
+    rtt.observe("198.51.100.1", 30)
+    assert rtt.connect_timeout("198.51.100.1") == 3
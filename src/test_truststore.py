@@ -1,7 +1,8 @@
 import pytest
 from OpenSSL.crypto import X509
 from tlstrust import TrustStore, trust_stores_from_chain
-from tlstrust import context, util
+from tlstrust import context, stores, util
+from tlstrust.stores import load_store
 
 rus_ski = "29bdb1aad5d93b21d8dc4c0efe11e7760b2fc0f6"
 good_ski = "bf5fb7d1cedd1f86f45b55acdcd710c20ea988e7"
@@ -131,3 +132,24 @@ def test_result():
     assert ts.dart is False
     assert ts.russia is False
     assert ts.rustls is False
+
+
+def test_legacy_android_exists():
+    ski = next(
+        ski
+        for ski in load_store(context.PLATFORM_ANDROID4_4).CERTIFICATES
+        if ski not in load_store(context.PLATFORM_ANDROID7).CERTIFICATES
+    )
+    ts = TrustStore(authority_key_identifier=ski)
+    assert ts.exists(context_type=context.PLATFORM_ANDROID4_4)
+    assert not ts.exists(context_type=context.PLATFORM_ANDROID7)
+
+
+def test_store_version():
+    version = stores.VERSIONS[context.CCADB]
+    pinned = TrustStore(good_ski, versions={context.SOURCE_CCADB: version})
+    assert pinned.check_trust(context.SOURCE_CCADB) == TrustStore(good_ski).check_trust(
+        context.SOURCE_CCADB
+    )
+    with pytest.raises(ValueError):
+        TrustStore(good_ski, versions={context.SOURCE_CCADB: "noop"})
@@ -1,8 +1,27 @@
+import asyncio
+import socket
+import ssl
+import threading
+import time
+from datetime import datetime, timedelta
+from hashlib import sha256
 import pytest
 from OpenSSL.crypto import X509
+from cryptography import x509
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.hashes import SHA1, SHA256
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+)
 from cryptography.x509.extensions import SubjectKeyIdentifier
-from tlstrust import util
+from cryptography.x509.oid import NameOID
+import tlstrust
+from tlstrust import trust_stores_from_chain, util
 from tlstrust import context
+from tlstrust.stores import get_der, subject_key
+from tlstrust.stores.ccadb import CERTIFICATES
 
 good_ski = "bf5fb7d1cedd1f86f45b55acdcd710c20ea988e7"
 bad_ski = "c4a7b1a47b2c71fadbe14b9075ffc41560858910"
@@ -52,3 +71,644 @@ def test_get_certificate_chain():
 def test_build_chains():
     leaf, chain, _ = util.get_certificate_chain(host, 443)
     assert isinstance(util.build_chains(leaf, chain), dict)
+
+
+def test_certificate_cache():
+    util.CERTIFICATE_CACHE.clear()
+    first = util.get_certificate_from_store(good_ski, context_type=context.SOURCE_CCADB)
+    second = util.get_certificate_from_store(
+        good_ski, context_type=context.SOURCE_CCADB
+    )
+    assert first is second
+    certificate, parsed = util.load_store_certificate(good_ski, context.SOURCE_CCADB)
+    assert certificate is first
+    assert parsed.fingerprint(SHA1()) == first.to_cryptography().fingerprint(SHA1())
+    for _ in range(2):
+        with pytest.raises(FileExistsError):
+            util.get_certificate_from_store(bad_ski, context_type=context.SOURCE_RUSSIA)
+    info = util.CERTIFICATE_CACHE.info()
+    assert info.misses == 2
+    assert info.hits == 3
+
+
+def test_certificate_pool():
+    fingerprint = CERTIFICATES[good_ski]
+    assert sha256(get_der(fingerprint)).hexdigest() == fingerprint
+
+
+def issue(
+    common_name: str,
+    issuer=None,
+    key_identifiers: bool = True,
+    key=None,
+    ca: bool = None,
+):
+    """
+    A certificate for common_name signed by issuer, a (certificate, key) pair. ca
+    adds basic constraints when not None
+    """
+    key = key or ec.generate_private_key(ec.SECP256R1())
+    subject = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, common_name)])
+    issuer_name, issuer_key = (
+        (subject, key) if issuer is None else (issuer[0].subject, issuer[1])
+    )
+    builder = (
+        x509.CertificateBuilder()
+        .subject_name(subject)
+        .issuer_name(issuer_name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(datetime.utcnow() - timedelta(days=1))
+        .not_valid_after(datetime.utcnow() + timedelta(days=30))
+    )
+    if key_identifiers:
+        builder = builder.add_extension(
+            x509.SubjectKeyIdentifier.from_public_key(key.public_key()), critical=False
+        ).add_extension(
+            x509.AuthorityKeyIdentifier.from_issuer_public_key(issuer_key.public_key()),
+            critical=False,
+        )
+    if ca is not None:
+        builder = builder.add_extension(
+            x509.BasicConstraints(ca=ca, path_length=None), critical=True
+        )
+    return builder.sign(issuer_key, SHA256()), key
+
+
+@pytest.fixture(scope="module")
+def private_pki(store_registry):
+    """
+    root and cross_root both sign the one intermediate key, which issues the
+    issuing CA key that signed the leaf
+    """
+    root = issue("tlstrust test root")
+    cross_root = issue("tlstrust test cross root")
+    intermediate = issue("tlstrust test intermediate", root)
+    cross_signed = issue("tlstrust test intermediate", cross_root, key=intermediate[1])
+    issuing = issue("tlstrust test issuing CA", intermediate)
+    leaf = issue("tlstrust.test", issuing)
+    store_registry(
+        9002,
+        "Private PKI",
+        {
+            util.get_key_identifier_hex(
+                cert, extension=SubjectKeyIdentifier, key="digest"
+            ): cert.public_bytes(Encoding.PEM)
+            for cert, _ in (root, cross_root)
+        },
+    )
+    pki = {
+        "root": root,
+        "cross_root": cross_root,
+        "intermediate": intermediate,
+        "cross_signed": cross_signed,
+        "issuing": issuing,
+        "leaf": leaf,
+    }
+    pki.update(
+        {
+            f"{name}_x509": X509.from_cryptography(cert)
+            for name, (cert, _) in pki.items()
+        }
+    )
+    return pki
+
+
+def test_certificate_record(private_pki):
+    root = private_pki["root_x509"]
+    intermediate = private_pki["intermediate_x509"]
+    record = util.certificate_record(intermediate)
+    assert record.certificate is intermediate
+    assert record.common_name == "tlstrust test intermediate"
+    assert record.aki == util.certificate_record(root).ski
+    assert record.issuer == root.to_cryptography().subject
+    assert util.find_root(record.aki).ski == record.aki
+    assert util.find_root("noop") is None
+
+
+def test_build_chains_offline(private_pki):
+    root = private_pki["root_x509"]
+    intermediate = private_pki["intermediate_x509"]
+    issuing = private_pki["issuing_x509"]
+    leaf = private_pki["leaf_x509"]
+    chains = util.build_chains(leaf, [leaf, issuing, intermediate])
+    assert list(chains) == ["0"]
+    assert chains["0"]["common_name"] == "tlstrust test root"
+    assert util.match_certificate(chains["0"]["ski"], root)
+    (link,) = chains["0"]["next"]
+    assert link["common_name"] == "tlstrust test intermediate"
+    assert link["next"][0]["next"][0]["certificate"] is leaf
+
+
+def digests(paths: list[list[X509]]) -> list[list[bytes]]:
+    return [[cert.digest("sha256") for cert in path] for path in paths]
+
+
+def test_chain_graph_shared_subtrees(private_pki):
+    names = ["leaf", "issuing", "intermediate", "cross_signed"]
+    leaf, issuing, intermediate, cross_signed = [
+        private_pki[f"{name}_x509"] for name in names
+    ]
+    graph = util.build_chain_graph(leaf, [leaf, issuing, intermediate, cross_signed])
+    assert len(graph.chains) == 2
+    first, second = graph.chains["0"], graph.chains["1"]
+    assert first["next"][0]["next"] is second["next"][0]["next"]
+    assert digests(graph.paths()) == digests(
+        [
+            [leaf, issuing, intermediate, private_pki["root_x509"]],
+            [leaf, issuing, cross_signed, private_pki["cross_root_x509"]],
+        ]
+    )
+    assert not graph.cycles and not graph.truncated
+
+
+def test_chain_graph_cycles(private_pki):
+    leaf = private_pki["leaf_x509"]
+    issuing = private_pki["issuing_x509"]
+    intermediate = private_pki["intermediate_x509"]
+    # a cross-certificate issued by the intermediate which signs it back, and a
+    # self-issued copy of the intermediate
+    loop = issue("tlstrust test loop", private_pki["intermediate"])
+    back = issue("tlstrust test intermediate", loop, key=private_pki["intermediate"][1])
+    self_issued = issue(
+        "tlstrust test intermediate",
+        private_pki["intermediate"],
+        key=private_pki["intermediate"][1],
+    )
+    bundle = [leaf, issuing, intermediate] + [
+        X509.from_cryptography(cert) for cert, _ in (loop, back, self_issued)
+    ]
+    graph = util.build_chain_graph(leaf, bundle)
+    assert graph.cycles == 2
+    assert digests(graph.paths()) == digests(
+        [[leaf, issuing, intermediate, private_pki["root_x509"]]]
+    )
+    shallow = util.build_chain_graph(leaf, bundle, max_depth=2)
+    assert shallow.truncated
+    assert shallow.paths() == []
+    with pytest.raises(ValueError):
+        util.build_chain_graph(leaf, bundle, max_depth=0)
+
+
+@pytest.fixture(scope="module")
+def legacy_pki(store_registry):
+    """A root with no key identifiers, as kept by the generators under its DN"""
+    root = issue("tlstrust legacy root", key_identifiers=False)
+    intermediate = issue("tlstrust legacy intermediate", root, key_identifiers=False)
+    leaf = issue("legacy.tlstrust.test", intermediate, key_identifiers=False)
+    keyed = issue("tlstrust keyed intermediate", root)
+    keyed_leaf = issue("keyed.tlstrust.test", keyed)
+    store_registry(
+        9003,
+        "Legacy PKI",
+        {subject_key(root[0].subject): root[0].public_bytes(Encoding.PEM)},
+    )
+    return {
+        name: X509.from_cryptography(cert)
+        for name, (cert, _) in {
+            "root": root,
+            "intermediate": intermediate,
+            "leaf": leaf,
+            "keyed": keyed,
+            "keyed_leaf": keyed_leaf,
+        }.items()
+    }
+
+
+def test_subject_index(legacy_pki):
+    root = legacy_pki["root"]
+    key = subject_key(root.to_cryptography().subject)
+    assert util.get_certificate_from_store(key, 9003).digest("sha256") == root.digest(
+        "sha256"
+    )
+    record = util.certificate_record(legacy_pki["intermediate"])
+    assert record.ski is None and record.aki is None
+    assert record.issuer_key == key
+    assert util.find_root(None, record.issuer_hash).key == key
+    assert util.find_root("noop", record.issuer_hash).key == key
+    assert util.find_root(None, "noop") is None
+
+
+def test_build_chains_without_key_identifiers(legacy_pki):
+    leaf, intermediate, keyed, keyed_leaf = [
+        legacy_pki[name] for name in ("leaf", "intermediate", "keyed", "keyed_leaf")
+    ]
+    graph = util.build_chain_graph(leaf, [leaf, intermediate])
+    assert digests(graph.paths()) == digests([[leaf, intermediate, legacy_pki["root"]]])
+    graph = util.build_chain_graph(keyed_leaf, [keyed_leaf, keyed])
+    assert digests(graph.paths()) == digests([[keyed_leaf, keyed, legacy_pki["root"]]])
+
+
+def test_verify_signature(private_pki):
+    root, intermediate = private_pki["root"][0], private_pki["intermediate"][0]
+    util.SIGNATURE_CACHE.clear()
+    assert util.verify_signature(root, intermediate)
+    assert not util.verify_signature(intermediate, root)
+    assert util.verify_signature(root, intermediate)
+    info = util.SIGNATURE_CACHE.info()
+    assert (info.hits, info.misses) == (1, 2)
+    # a self-signed RSA root from the stores
+    store_root = util.get_certificate_from_store(good_ski, context.SOURCE_CCADB)
+    assert util.verify_signature(
+        store_root.to_cryptography(), store_root.to_cryptography()
+    )
+
+
+def test_build_chains_verified(private_pki):
+    leaf, issuing, intermediate = [
+        private_pki[f"{name}_x509"] for name in ("leaf", "issuing", "intermediate")
+    ]
+    # same subject and key identifiers as the issuing CA, signed by another key
+    forger = issue("tlstrust test forger")
+    forged = (
+        x509.CertificateBuilder()
+        .subject_name(private_pki["issuing"][0].subject)
+        .issuer_name(private_pki["intermediate"][0].subject)
+        .public_key(private_pki["issuing"][1].public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(datetime.utcnow() - timedelta(days=1))
+        .not_valid_after(datetime.utcnow() + timedelta(days=30))
+    )
+    for extension in private_pki["issuing"][0].extensions:
+        forged = forged.add_extension(extension.value, extension.critical)
+    forged = X509.from_cryptography(forged.sign(forger[1], SHA256()))
+    bundle = [leaf, forged, intermediate]
+    assert digests(util.build_chain_graph(leaf, bundle).paths()) == digests(
+        [[leaf, forged, intermediate, private_pki["root_x509"]]]
+    )
+    graph = util.build_chain_graph(leaf, bundle, verify=True)
+    assert graph.unverified == 1
+    assert graph.paths() == []
+    assert trust_stores_from_chain(leaf, bundle)
+    assert trust_stores_from_chain(leaf, bundle, verify=True) == []
+    verified = trust_stores_from_chain(leaf, [leaf, issuing, intermediate], verify=True)
+    assert [store.key_identifier for store in verified] == [
+        util.certificate_record(intermediate).aki
+    ]
+
+
+def test_shortest_paths(private_pki, store_registry):
+    leaf, issuing, intermediate, cross_signed = [
+        private_pki[f"{name}_x509"]
+        for name in ("leaf", "issuing", "intermediate", "cross_signed")
+    ]
+    root, cross_root = private_pki["root_x509"], private_pki["cross_root_x509"]
+    # the issuing CA key cross-signed straight by the cross root, one link shorter
+    short_issuing = X509.from_cryptography(
+        issue(
+            "tlstrust test issuing CA",
+            private_pki["cross_root"],
+            key=private_pki["issuing"][1],
+        )[0]
+    )
+    store_registry(
+        9004,
+        "Private PKI root only",
+        {
+            util.certificate_record(root)
+            .ski: root.to_cryptography()
+            .public_bytes(Encoding.PEM)
+        },
+    )
+    bundle = [leaf, issuing, intermediate, cross_signed, short_issuing]
+    graph = util.build_chain_graph(leaf, bundle)
+    paths = graph.shortest_paths(contexts=[9002, 9004])
+    assert digests([paths[9002]]) == digests([[leaf, short_issuing, cross_root]])
+    assert digests([paths[9004]]) == digests([[leaf, issuing, intermediate, root]])
+    assert graph.shortest_paths(contexts=[9004], trusted=lambda *_: False) == {}
+    assert graph.shortest_paths(contexts=[9002], budget=1) == {}
+    assert graph.budget_exhausted
+    with pytest.raises(ValueError):
+        graph.shortest_paths(budget=0)
+    stores = {
+        store.key_identifier: store for store in trust_stores_from_chain(leaf, bundle)
+    }
+    assert list(stores[util.certificate_record(cross_root).ski].paths) == [9002]
+    assert list(stores[util.certificate_record(root).ski].paths) == [9004]
+
+
+def test_chain_cache(private_pki, monkeypatch):
+    leaf, issuing, intermediate = [
+        private_pki[f"{name}_x509"] for name in ("leaf", "issuing", "intermediate")
+    ]
+    # another leaf from the same issuing CA, sharing the rest of the chain
+    other = X509.from_cryptography(
+        issue("other.tlstrust.test", private_pki["issuing"])[0]
+    )
+    util.CHAIN_CACHE.clear()
+    first = trust_stores_from_chain(leaf, [leaf, issuing, intermediate])
+    second = trust_stores_from_chain(other, [other, issuing, intermediate])
+    info = util.CHAIN_CACHE.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    assert info.hit_ratio == 0.5
+    assert [store.key_identifier for store in second] == [
+        store.key_identifier for store in first
+    ]
+    (store,) = second
+    assert store.paths[9002][0] is other
+    for path in store.paths.values():
+        assert digests([path]) == digests(
+            [[other, issuing, intermediate, private_pki["root_x509"]]]
+        )
+    assert second[0] is not first[0]
+    trust_stores_from_chain(leaf, [leaf, issuing, intermediate], verify=True)
+    assert util.CHAIN_CACHE.info().currsize == 1
+    # once the root has expired the chain is searched again
+    later = time.time() + 365 * 86400
+    monkeypatch.setattr(tlstrust, "time", lambda: later)
+    (expired,) = trust_stores_from_chain(other, [other, issuing, intermediate])
+    assert expired.key_identifier == store.key_identifier
+    assert expired.paths == {}
+    (cached,) = trust_stores_from_chain(leaf, [leaf, issuing, intermediate])
+    assert cached.paths == {}
+
+
+@pytest.fixture
+def tls_server(private_pki, tmp_path):
+    """A local TLS server presenting the private PKI chain, (host, port) runner"""
+    leaf, issuing, intermediate = [
+        private_pki[name][0] for name in ("leaf", "issuing", "intermediate")
+    ]
+    chain_file = tmp_path / "chain.pem"
+    chain_file.write_bytes(
+        b"".join(
+            cert.public_bytes(Encoding.PEM) for cert in (leaf, issuing, intermediate)
+        )
+    )
+    key_file = tmp_path / "key.pem"
+    key_file.write_bytes(
+        private_pki["leaf"][1].private_bytes(
+            Encoding.PEM, PrivateFormat.PKCS8, NoEncryption()
+        )
+    )
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(chain_file, key_file)
+
+    async def run(scan, maximum_version=None, handshakes=None):
+        """handshakes collects a writer for each handshake the server completed"""
+
+        async def handle(reader, writer):
+            if handshakes is not None:
+                handshakes.append(writer)
+            try:
+                await reader.read()
+            except (ConnectionError, ssl.SSLError):
+                pass
+            writer.close()
+
+        if maximum_version is not None:
+            server_context.maximum_version = maximum_version
+        server = await asyncio.start_server(handle, "localhost", 0, ssl=server_context)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await scan("localhost", port)
+
+    return run
+
+
+def test_get_certificate_chain_async(private_pki, tls_server, monkeypatch):
+    monkeypatch.setattr(util.validators, "domain", lambda host: True)
+
+    async def scan(host, port):
+        return [
+            await util.get_certificate_chain_async(host, port),
+            # the sync full handshake the CLI uses, off the event loop
+            await asyncio.to_thread(util.get_certificate_chain, host, port),
+        ]
+
+    results = asyncio.run(tls_server(scan))
+    for leaf, chain, peer in results:
+        assert leaf.digest("sha256") == private_pki["leaf_x509"].digest("sha256")
+        assert digests([chain]) == digests(
+            [
+                [
+                    private_pki[f"{name}_x509"]
+                    for name in ("leaf", "leaf", "issuing", "intermediate")
+                ]
+            ]
+        )
+        assert peer == "127.0.0.1"
+    leaf, chain, _ = results[0]
+    assert [store.key_identifier for store in trust_stores_from_chain(leaf, chain)] == [
+        util.certificate_record(private_pki["intermediate_x509"]).aki
+    ]
+
+    async def batch(host, port):
+        return [
+            result
+            async for result in util.iter_certificate_chains_async(
+                [(host, None), *[(host, port)] * 3], concurrency=2
+            )
+        ]
+
+    results = asyncio.run(tls_server(batch))
+    assert len(results) == 4
+    # an invalid target is its own result, the rest of the batch still runs
+    (invalid,) = [result for result in results if result[1] is None]
+    assert isinstance(invalid[2], TypeError)
+    results.remove(invalid)
+    assert all(result[2][2] == "127.0.0.1" for result in results)
+    with pytest.raises(TypeError):
+        asyncio.run(util.get_certificate_chain_async("localhost", None))
+
+
+@pytest.mark.parametrize(
+    "maximum_version", [ssl.TLSVersion.TLSv1_2, ssl.TLSVersion.TLSv1_3]
+)
+def test_certificates_only(private_pki, tls_server, monkeypatch, maximum_version):
+    monkeypatch.setattr(util.validators, "domain", lambda host: True)
+    expected = digests(
+        [
+            [
+                private_pki[f"{name}_x509"]
+                for name in ("leaf", "leaf", "issuing", "intermediate")
+            ]
+        ]
+    )
+
+    async def scan(host, port):
+        return [
+            await util.get_certificate_chain_async(host, port, certificates_only=True),
+            await asyncio.to_thread(
+                util.get_certificate_chain, host, port, certificates_only=True
+            ),
+        ]
+
+    handshakes = []
+    results = asyncio.run(tls_server(scan, maximum_version, handshakes))
+    for leaf, chain, peer in results:
+        assert leaf.digest("sha256") == private_pki["leaf_x509"].digest("sha256")
+        assert digests([chain]) == expected
+        assert peer == "127.0.0.1"
+    # the client never sent its Finished, so the server saw no completed handshake
+    assert handshakes == []
+
+
+def test_ssl_context(private_pki):
+    util.CONTEXT_CACHE.clear()
+    context = util.ssl_context(util.PROTOCOL_METHODS[0])
+    assert util.ssl_context(util.PROTOCOL_METHODS[0]) is context
+    assert util.ssl_context(util.PROTOCOL_METHODS[1]) is not context
+    client = util.ssl_context(util.PROTOCOL_METHODS[0], private_pki["leaf_x509"])
+    assert client is not context
+    assert (
+        util.ssl_context(
+            util.PROTOCOL_METHODS[0],
+            X509.from_cryptography(private_pki["leaf"][0]),
+        )
+        is client
+    )
+    assert util.CONTEXT_CACHE.info().currsize == 3
+
+
+def closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_classify_failure(monkeypatch):
+    monkeypatch.setattr(util.validators, "domain", lambda host: True)
+    port = closed_port()
+    with pytest.raises(ConnectionRefusedError) as refused:
+        util.get_certificate_chain("localhost", port)
+    assert util.classify_failure(refused.value) == util.FAILURE_REFUSED
+    with pytest.raises(ConnectionRefusedError):
+        asyncio.run(util.get_certificate_chain_async("localhost", port))
+    assert util.classify_failure(socket.gaierror()) == util.FAILURE_DNS
+    assert util.classify_failure(TimeoutError()) == util.FAILURE_CONNECT
+    assert util.classify_failure(util.HandshakeTimeoutError()) == util.FAILURE_HANDSHAKE
+    assert util.classify_failure(util.SSL.Error()) == util.FAILURE_HANDSHAKE
+
+
+def test_protocol_fallback(private_pki, tls_server, monkeypatch, capsys):
+    monkeypatch.setattr(util.validators, "domain", lambda host: True)
+    attempts = []
+
+    async def handle(reader, writer):
+        attempts.append(writer)
+        writer.close()
+
+    async def no_tls():
+        server = await asyncio.start_server(handle, "localhost", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return port, await util.get_certificate_chain_async("localhost", port)
+
+    port, result = asyncio.run(no_tls())
+    assert result is None
+    assert len(attempts) == len(util.PROTOCOL_METHODS)
+    assert capsys.readouterr().out == ""
+    assert util.protocol_methods("localhost", port) == list(util.PROTOCOL_METHODS)
+
+    async def scan(host, port):
+        await util.get_certificate_chain_async(host, port)
+        return port
+
+    port = asyncio.run(tls_server(scan))
+    assert util.PROTOCOL_CACHE.get(("localhost", port)) == util.PROTOCOL_METHODS[0]
+    util.PROTOCOL_CACHE.put(("localhost", port), util.PROTOCOL_METHODS[1])
+    assert util.protocol_methods("localhost", port)[:2] == list(
+        util.PROTOCOL_METHODS[1::-1]
+    )
+
+
+def test_unexpected_errors_raise(tls_server, monkeypatch):
+    monkeypatch.setattr(util.validators, "domain", lambda host: True)
+
+    def broken(self, data):
+        raise RuntimeError("bug")
+
+    monkeypatch.setattr(util.ChainFetch, "receive", broken)
+    with pytest.raises(RuntimeError):
+        asyncio.run(tls_server(util.get_certificate_chain_async))
+
+
+def test_get_certificate_chains(private_pki, tls_server, monkeypatch):
+    monkeypatch.setattr(util.validators, "domain", lambda host: True)
+
+    async def every_address(host, port):
+        return await util.get_certificate_chains_async(host, port)
+
+    ((address, (leaf, _, peer)),) = asyncio.run(tls_server(every_address))
+    assert address == peer == "127.0.0.1"
+    assert leaf.digest("sha256") == private_pki["leaf_x509"].digest("sha256")
+
+    async def every_address_sync(host, port):
+        return await asyncio.to_thread(util.get_certificate_chains, host, port)
+
+    ((address, (leaf, _, peer)),) = asyncio.run(tls_server(every_address_sync))
+    assert address == peer == "127.0.0.1"
+    assert leaf.digest("sha256") == private_pki["leaf_x509"].digest("sha256")
+
+    async def pinned(host, port):
+        return await util.get_certificate_chain_async(host, port, address="192.0.2.1")
+
+    with pytest.raises(ValueError):
+        asyncio.run(tls_server(pinned))
+
+
+def test_deadline(monkeypatch):
+    monkeypatch.setattr(util.validators, "domain", lambda host: True)
+    with socket.socket() as silent:
+        # accepts connections through its backlog but never answers a handshake
+        silent.bind(("127.0.0.1", 0))
+        silent.listen(8)
+        port = silent.getsockname()[1]
+        started = time.monotonic()
+        with pytest.raises(util.HandshakeTimeoutError) as timed_out:
+            asyncio.run(util.get_certificate_chain_async("localhost", port, deadline=1))
+        assert time.monotonic() - started < 2
+        assert util.classify_failure(timed_out.value) == util.FAILURE_HANDSHAKE
+        started = time.monotonic()
+        with pytest.raises(util.HandshakeTimeoutError) as timed_out:
+            util.get_certificate_chain("localhost", port, deadline=1)
+        assert time.monotonic() - started < 2
+        assert util.classify_failure(timed_out.value) == util.FAILURE_HANDSHAKE
+        assert util.RTT.rtt("127.0.0.1") is not None
+
+
+def test_handshake_driver(private_pki, tmp_path):
+    cert_file, key_file = tmp_path / "leaf.pem", tmp_path / "key.pem"
+    cert_file.write_bytes(private_pki["leaf"][0].public_bytes(Encoding.PEM))
+    key_file.write_bytes(
+        private_pki["leaf"][1].private_bytes(
+            Encoding.PEM, PrivateFormat.PKCS8, NoEncryption()
+        )
+    )
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(cert_file, key_file)
+    server, silent = socket.socket(), socket.socket()
+    for listener in (server, silent):
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(8)
+
+    held = []
+
+    def serve():
+        for _ in range(3):
+            client, _ = server.accept()
+            held.append(server_context.wrap_socket(client, server_side=True))
+
+    threading.Thread(target=serve, daemon=True).start()
+    connections = []
+    for listener in (server, server, server, silent):
+        sock = socket.create_connection(listener.getsockname())
+        sock.setblocking(False)
+        conn = util.SSL.Connection(util.ssl_context(util.PROTOCOL_METHODS[0]), sock)
+        conn.set_connect_state()
+        connections.append(conn)
+    driver = util.HandshakeDriver()
+    started = time.monotonic()
+    for conn in connections[:3]:
+        driver.add(conn, 3)
+    driver.add(connections[3], 0.5)
+    results = driver.run()
+    assert time.monotonic() - started < 2
+    assert [results[conn] for conn in connections[:3]] == [None, None, None]
+    assert isinstance(results[connections[3]], TimeoutError)
+    assert connections[0].get_peer_certificate().digest("sha256") == private_pki[
+        "leaf_x509"
+    ].digest("sha256")
+    for each in [*connections, *held, server, silent]:
+        each.close()
@@ -0,0 +1,270 @@
+"""
+Trust evaluation for many SKIs at once, without a TrustStore per SKI
+
+The result is columnar: one byte per (SKI, context) cell, SKIs are rows and
+contexts are columns, row-major
+"""
+
+from array import array
+from datetime import datetime
+from calendar import timegm
+from collections.abc import Iterable
+from functools import lru_cache
+from time import time
+from .context import (
+    INVALID_CONTEXT,
+    SOURCE_CCADB,
+    SOURCE_ANDROID,
+    SOURCE_CURL,
+    SOURCE_DART,
+    SOURCE_CERTIFI,
+    SOURCE_JAVA,
+    SOURCE_RUSSIA,
+    SOURCE_RUSTLS,
+)
+from .registry import REGISTRY, PackagedStore
+from .stores import PRESENT, matrix_columns, matrix_rows
+
+try:
+    import numpy
+except ImportError:
+    # optional, the columnar passes fall back to a loop over the gathered rows
+    numpy = None
+
+__module__ = "tlstrust.bulk"
+
+# the stores TrustStore.is_trusted consults when check_trust has no context
+ANY_CONTEXTS = (
+    SOURCE_CCADB,
+    SOURCE_ANDROID,
+    SOURCE_CURL,
+    SOURCE_DART,
+    SOURCE_CERTIFI,
+    SOURCE_JAVA,
+    SOURCE_RUSSIA,
+    SOURCE_RUSTLS,
+)
+
+
+def as_epoch(as_of=None) -> float:
+    if as_of is None:
+        return time()
+    if isinstance(as_of, datetime):
+        if as_of.tzinfo is not None:
+            return as_of.timestamp()
+        return timegm(as_of.timetuple())
+    if isinstance(as_of, (int, float)):
+        return as_of
+    raise TypeError(
+        f"as_of type {type(as_of)} not supported, expected datetime or epoch"
+    )
+
+
+class TrustResults:
+    """Boolean matrix of answers, SKIs by contexts"""
+
+    def __init__(self, key_identifiers: list[str], contexts: list[int], values: array):
+        self.key_identifiers = key_identifiers
+        self.contexts = contexts
+        self.values = values
+        self._rows = {ski: index for index, ski in enumerate(key_identifiers)}
+        self._columns = {ctx: index for index, ctx in enumerate(contexts)}
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.key_identifiers), len(self.contexts)
+
+    def __getitem__(self, cell: tuple[str, int]) -> bool:
+        key_identifier, context_type = cell
+        row = self._rows[key_identifier]
+        column = self._columns[context_type]
+        return bool(self.values[row * len(self.contexts) + column])
+
+    def row(self, key_identifier: str) -> dict[int, bool]:
+        start = self._rows[key_identifier] * len(self.contexts)
+        return {
+            ctx: bool(value)
+            for ctx, value in zip(
+                self.contexts, self.values[start : start + len(self.contexts)]
+            )
+        }
+
+    def column(self, context_type: int) -> list[bool]:
+        column = self._columns[context_type]
+        return [bool(value) for value in self.values[column :: len(self.contexts)]]
+
+    def tobytes(self) -> bytes:
+        return self.values.tobytes()
+
+    def to_numpy(self):
+        """2-D bool ndarray view of the results, requires numpy"""
+        import numpy
+
+        return numpy.frombuffer(self.values, dtype=numpy.bool_).reshape(self.shape)
+
+
+def _gather_rows(key_identifiers: list[str]) -> array:
+    """The matrix row of each SKI, -1 when the matrix does not hold it"""
+    rows = matrix_rows()
+    return array("q", [rows.get(ski, -1) for ski in key_identifiers])
+
+
+@lru_cache(maxsize=None)
+def _trusted_rows(context_type: int) -> array:
+    """1 for each matrix row the packaged store trusts, expiry aside"""
+    flags, _, _ = matrix_columns(context_type)
+    distrusted = REGISTRY[context_type].distrusted_by
+    return array(
+        "B",
+        [
+            flag == PRESENT and ski not in distrusted
+            for ski, flag in zip(matrix_rows(), flags)
+        ],
+    )
+
+
+@lru_cache(maxsize=None)
+def _present_rows(context_type: int) -> array:
+    """1 for each matrix row the packaged store holds"""
+    flags, _, _ = matrix_columns(context_type)
+    return array("B", [bool(flag & PRESENT) for flag in flags])
+
+
+def _matrix_cells(
+    rows: array, mask: array, not_valid_after: array, as_of: float, expired: bool
+) -> array:
+    """
+    1 for each gathered row that is set in mask and whose not_valid_after is
+    before as_of when expired, at or after it otherwise. One vectorised pass
+    with numpy
+    """
+    if not rows:
+        return array("B")
+    if numpy is not None:
+        rows = numpy.frombuffer(rows, dtype=numpy.int64)
+        found = rows >= 0
+        rows = numpy.where(found, rows, 0)
+        after = numpy.frombuffer(not_valid_after, dtype=numpy.int64)[rows]
+        cells = (
+            found
+            & numpy.frombuffer(mask, dtype=numpy.uint8)[rows].astype(numpy.bool_)
+            & ((after < as_of) if expired else (after >= as_of))
+        )
+        return array("B", cells.astype(numpy.uint8).tobytes())
+    cells = array("B", bytes(len(rows)))
+    for index, row in enumerate(rows):
+        if row >= 0 and mask[row] and (not_valid_after[row] < as_of) == expired:
+            cells[index] = 1
+    return cells
+
+
+def _any_cells(columns: list[array], size: int) -> array:
+    """Cell-wise OR of 0/1 columns, as one integer OR per column"""
+    combined = 0
+    for cells in columns:
+        combined |= int.from_bytes(cells.tobytes(), "little")
+    return array("B", combined.to_bytes(size, "little"))
+
+
+def _column_cells(
+    key_identifiers: list[str], rows: array, context_type: int, as_of: float
+) -> array:
+    descriptor = REGISTRY[context_type]
+    if isinstance(descriptor, PackagedStore):
+        _, _, not_valid_after = matrix_columns(context_type)
+        return _matrix_cells(
+            rows, _trusted_rows(context_type), not_valid_after, as_of, expired=False
+        )
+    distrusted = descriptor.distrusted_by
+    cells = array("B", bytes(len(key_identifiers)))
+    for index, ski in enumerate(key_identifiers):
+        flags, not_valid_after = descriptor.lookup_trust(ski)
+        if flags == PRESENT and not_valid_after >= as_of and ski not in distrusted:
+            cells[index] = 1
+    return cells
+
+
+def _validate_contexts(contexts: list[int], allow_any: bool = True):
+    for context_type in contexts:
+        if context_type is None and allow_any:
+            continue
+        if not isinstance(context_type, int):
+            raise TypeError(
+                f"context type {type(context_type)} not supported, expected int"
+            )
+        if context_type not in REGISTRY:
+            raise AttributeError(INVALID_CONTEXT.format(context_type))
+
+
+def evaluate_many(
+    key_identifiers: Iterable[str], contexts: Iterable[int] = None, as_of=None
+) -> TrustResults:
+    """
+    The answer of TrustStore(ski).check_trust(ctx) for every SKI and context, None
+    in contexts is the any-store answer of check_trust(). as_of is a datetime or
+    epoch to evaluate expiry at, default now
+    """
+    key_identifiers = list(key_identifiers)
+    contexts = list(REGISTRY) if contexts is None else list(contexts)
+    _validate_contexts(contexts)
+    as_of = as_epoch(as_of)
+    rows = _gather_rows(key_identifiers)
+    columns = {}
+    for context_type in set(contexts):
+        if context_type is None:
+            continue
+        columns[context_type] = _column_cells(
+            key_identifiers, rows, context_type, as_of
+        )
+    if None in contexts:
+        for context_type in ANY_CONTEXTS:
+            if context_type not in columns:
+                columns[context_type] = _column_cells(
+                    key_identifiers, rows, context_type, as_of
+                )
+        columns[None] = _any_cells(
+            [columns[context_type] for context_type in ANY_CONTEXTS],
+            len(key_identifiers),
+        )
+    values = array("B", bytes(len(key_identifiers) * len(contexts)))
+    for column, context_type in enumerate(contexts):
+        values[column :: len(contexts)] = columns[context_type]
+    return TrustResults(key_identifiers, contexts, values)
+
+
+def _expired_cells(
+    key_identifiers: list[str], rows: array, context_type: int, as_of: float
+) -> array:
+    descriptor = REGISTRY[context_type]
+    if isinstance(descriptor, PackagedStore):
+        _, _, not_valid_after = matrix_columns(context_type)
+        return _matrix_cells(
+            rows, _present_rows(context_type), not_valid_after, as_of, expired=True
+        )
+    cells = array("B", bytes(len(key_identifiers)))
+    for index, ski in enumerate(key_identifiers):
+        flags, not_valid_after = descriptor.lookup_trust(ski)
+        if flags & PRESENT and not_valid_after < as_of:
+            cells[index] = 1
+    return cells
+
+
+def expired_many(
+    key_identifiers: Iterable[str], contexts: Iterable[int] = None, as_of=None
+) -> TrustResults:
+    """
+    Whether each store's copy of each root has expired at as_of (a datetime or
+    epoch, default now), from the precomputed matrix columns. Roots a store does
+    not hold are never expired in it
+    """
+    key_identifiers = list(key_identifiers)
+    contexts = list(REGISTRY) if contexts is None else list(contexts)
+    _validate_contexts(contexts, allow_any=False)
+    as_of = as_epoch(as_of)
+    rows = _gather_rows(key_identifiers)
+    values = array("B", bytes(len(key_identifiers) * len(contexts)))
+    for column, context_type in enumerate(contexts):
+        values[column :: len(contexts)] = _expired_cells(
+            key_identifiers, rows, context_type, as_of
+        )
+    return TrustResults(key_identifiers, contexts, values)
@@ -0,0 +1,71 @@
+from collections import OrderedDict, namedtuple
+from threading import RLock
+
+__module__ = "tlstrust.cache"
+
+
+class CacheInfo(
+    namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+):
+    __slots__ = ()
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups answered from the cache, 0.0 before any lookup"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache:
+    """Bounded, thread-safe least recently used mapping with hit/miss/eviction statistics"""
+
+    def __init__(self, maxsize: int = 1024):
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError(f"maxsize {maxsize} must be a positive int")
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._data),
+            )
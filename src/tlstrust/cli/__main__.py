@@ -4,8 +4,8 @@ import logging
 import argparse
 import json
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from socket import gaierror
 import validators
 from rich.console import Console
 from rich.style import Style
@@ -13,9 +13,16 @@ from rich.logging import RichHandler
 from rich.table import Table
 from rich import box
 from OpenSSL.crypto import FILETYPE_PEM, load_certificate
-from .. import TrustStore, trust_stores_from_chain
-from ..util import get_certificate_chain, get_cn_or_org
+from .. import IntermediateStore, TrustStore, trust_stores_from_chain
+from ..util import (
+    FAILURE_HANDSHAKE,
+    classify_failure,
+    get_certificate_chain,
+    get_cn_or_org,
+)
 from ..context import ALL_DISTINCT
+from ..timing import DEFAULT_DEADLINE
+from ..intermediates import DEFAULT_PATH as DEFAULT_INTERMEDIATES_PATH
 
 __module__ = "tlstrust.cli"
 __version__ = "2.7.3"
@@ -78,6 +85,48 @@ def output(store: TrustStore) -> Table:
     console.print()
 
 
+def scan(
+    host: str,
+    port: int,
+    use_sni: bool = True,
+    intermediates=None,
+    deadline: float = DEFAULT_DEADLINE,
+    certificates_only: bool = False,
+) -> tuple[dict, list[tuple[TrustStore, dict]]]:
+    """Fetch and evaluate one target, the query and each root's store and data"""
+    query = {
+        "host_name": host,
+        "port_number": int(port),
+        "use_sni": use_sni,
+    }
+    try:
+        res = get_certificate_chain(
+            host,
+            int(port),
+            use_sni=use_sni,
+            deadline=deadline,
+            certificates_only=certificates_only,
+        )
+        if not res:
+            query["error"] = f"No supported TLS protocols {host}:{port}"
+            query["failure"] = FAILURE_HANDSHAKE
+            return query, []
+        leaf, chain, peer_addr = res
+    except OSError as ex:
+        query["error"] = f"{str(ex)} {host}:{port}"
+        query["failure"] = classify_failure(ex)
+        return query, []
+    query["peer_address"] = peer_addr
+    evaluations = []
+    for trust_store in trust_stores_from_chain(
+        leaf, chain, intermediates=intermediates
+    ):
+        data = trust_store.to_dict()
+        data["_query"] = query
+        evaluations.append((trust_store, data))
+    return query, evaluations
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -98,6 +147,35 @@ def main():
         dest="disable_sni",
         action="store_true",
     )
+    parser.add_argument(
+        "--intermediates",
+        help=f"path to a local cache of intermediate certificates, learned from every chain and used to complete chains missing them (default {DEFAULT_INTERMEDIATES_PATH} when no path is given)",
+        dest="intermediates",
+        nargs="?",
+        const=DEFAULT_INTERMEDIATES_PATH,
+        default=None,
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        help="number of targets to scan concurrently (default 1), results keep the order of the targets",
+        dest="workers",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--deadline",
+        help=f"seconds each target may take in all, connect and handshake timeouts adapt within it (default {DEFAULT_DEADLINE})",
+        dest="deadline",
+        type=float,
+        default=DEFAULT_DEADLINE,
+    )
+    parser.add_argument(
+        "--certificates-only",
+        help="hang up as soon as the server's certificates arrive instead of completing each handshake",
+        dest="certificates_only",
+        action="store_true",
+    )
     parser.add_argument(
         "-O",
         "--json-file",
@@ -163,6 +241,10 @@ def main():
     if len(args.targets) == 0:
         parser.print_help(sys.stderr)
         sys.exit(1)
+    if args.workers < 1:
+        parser.error(f"--workers {args.workers} must be a positive int")
+    if args.deadline <= 0:
+        parser.error(f"--deadline {args.deadline} must be a positive number")
 
     if args.client_pem:
         client_certificate = load_certificate(
@@ -172,6 +254,10 @@ def main():
             f"client certificate issuer: {client_certificate.get_issuer().commonName}"
         )
 
+    intermediates = None
+    if args.intermediates:
+        intermediates = IntermediateStore(args.intermediates)
+
     evaluation_start = datetime.utcnow()
     domains = []
     for target in args.targets:
@@ -186,34 +272,30 @@ def main():
             raise AttributeError(f"host {host} is invalid")
         domains.append((host, int(port)))
 
+    def scan_target(target: tuple[str, int]):
+        return scan(
+            *target,
+            use_sni=not args.disable_sni,
+            intermediates=intermediates,
+            deadline=args.deadline,
+            certificates_only=args.certificates_only,
+        )
+
     results = []
-    for domain, port in domains:
-        query = {
-            "host_name": domain,
-            "port_number": int(port),
-            "use_sni": not args.disable_sni,
-        }
-        try:
-            res = get_certificate_chain(domain, int(port), use_sni=not args.disable_sni)
-            if not res:
-                query["error"] = f"No supported TLS protocols {host}:{port}"
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        # map yields results in target order, whichever scan finishes first
+        for query, evaluations in executor.map(scan_target, domains):
+            if "error" in query:
                 results.append({"_query": query})
                 console.print(query["error"])
                 continue
-            leaf, chain, peer_addr = res
-        except (TimeoutError, ConnectionRefusedError, gaierror) as ex:
-            query["error"] = f"{str(ex)} {host}:{port}"
-            results.append({"_query": query})
-            console.print(query["error"])
-            continue
-        query["peer_address"] = peer_addr
-        console.print(f"{host}:{port} ({peer_addr})")
-        for trust_store in trust_stores_from_chain(leaf, chain):
-            data = trust_store.to_dict()
-            data["_query"] = query
-            results.append(data)
-            if not args.json_file:
-                output(trust_store)
+            console.print(
+                f"{query['host_name']}:{query['port_number']} ({query['peer_address']})"
+            )
+            for trust_store, data in evaluations:
+                results.append(data)
+                if not args.json_file:
+                    output(trust_store)
 
     execution_duration_seconds = (datetime.utcnow() - evaluation_start).total_seconds()
     if args.json_file:
@@ -0,0 +1,160 @@
+"""
+Intermediate certificates learned from the chains servers present
+
+Servers often leave intermediates out of the chain they send. Every CA
+certificate seen is kept in a local sqlite database, indexed by SKI and subject
+DN hash and bounded by least recently used eviction, so later chains can be
+completed from it without any network fetch
+"""
+
+import os
+import sqlite3
+from hashlib import sha256
+from threading import RLock
+from OpenSSL.crypto import X509, FILETYPE_ASN1, dump_certificate, load_certificate
+from cryptography.x509 import BasicConstraints, ExtensionNotFound
+from .stores import SUBJECT_KEY_PREFIX
+from .util import certificate_record
+
+__module__ = "tlstrust.intermediates"
+
+DEFAULT_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "tlstrust", "intermediates.sqlite3"
+)
+DEFAULT_MAXSIZE = 50000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS intermediates (
+    fingerprint TEXT PRIMARY KEY,
+    ski TEXT,
+    subject_hash TEXT NOT NULL,
+    der BLOB NOT NULL,
+    last_used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS intermediates_ski ON intermediates (ski);
+CREATE INDEX IF NOT EXISTS intermediates_subject ON intermediates (subject_hash);
+CREATE INDEX IF NOT EXISTS intermediates_last_used ON intermediates (last_used);
+"""
+
+
+def is_intermediate(cert: X509) -> bool:
+    """A CA certificate that is not self-issued, the only kind worth learning"""
+    cryptography_cert = cert.to_cryptography()
+    try:
+        constraints = cryptography_cert.extensions.get_extension_for_class(
+            BasicConstraints
+        )
+    except ExtensionNotFound:
+        return False
+    return (
+        constraints.value.ca and cryptography_cert.subject != cryptography_cert.issuer
+    )
+
+
+class IntermediateStore:
+    """
+    Learned intermediates on disk, at most maxsize of them. Lookups and learning
+    a certificate again both count as use for eviction
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, maxsize: int = DEFAULT_MAXSIZE):
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError(f"maxsize {maxsize} must be a positive int")
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.maxsize = maxsize
+        self._lock = RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+        (self._tick,) = self._connection.execute(
+            "SELECT COALESCE(MAX(last_used), 0) FROM intermediates"
+        ).fetchone()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM intermediates"
+            ).fetchone()
+            return count
+
+    def __contains__(self, cert: X509) -> bool:
+        with self._lock:
+            return (
+                self._connection.execute(
+                    "SELECT 1 FROM intermediates WHERE fingerprint = ?",
+                    (_fingerprint(cert),),
+                ).fetchone()
+                is not None
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def learn(self, certificates: list[X509]) -> int:
+        """Keep the intermediates among certificates, returns how many were new"""
+        learned = 0
+        with self._lock, self._connection:
+            for cert in certificates:
+                if not isinstance(cert, X509) or not is_intermediate(cert):
+                    continue
+                der = dump_certificate(FILETYPE_ASN1, cert)
+                fingerprint = sha256(der).hexdigest()
+                self._tick += 1
+                if self._connection.execute(
+                    "UPDATE intermediates SET last_used = ? WHERE fingerprint = ?",
+                    (self._tick, fingerprint),
+                ).rowcount:
+                    continue
+                record = certificate_record(cert)
+                self._connection.execute(
+                    "INSERT INTO intermediates VALUES (?, ?, ?, ?, ?)",
+                    (fingerprint, record.ski, record.subject_hash, der, self._tick),
+                )
+                learned += 1
+            if learned:
+                self._evict()
+            return learned
+
+    def issuers(self, issuer_key: str) -> list[X509]:
+        """
+        The learned certificates with the SKI, or the subject DN hash when
+        issuer_key is a "dn:" key, most recently used first
+        """
+        if issuer_key.startswith(SUBJECT_KEY_PREFIX):
+            where = "subject_hash = ?"
+            value = issuer_key[len(SUBJECT_KEY_PREFIX) :]
+        else:
+            where = "ski = ?"
+            value = issuer_key
+        with self._lock, self._connection:
+            rows = self._connection.execute(
+                f"SELECT fingerprint, der FROM intermediates WHERE {where} "
+                "ORDER BY last_used DESC",
+                (value,),
+            ).fetchall()
+            for fingerprint, _ in rows:
+                self._tick += 1
+                self._connection.execute(
+                    "UPDATE intermediates SET last_used = ? WHERE fingerprint = ?",
+                    (self._tick, fingerprint),
+                )
+        return [load_certificate(FILETYPE_ASN1, der) for _, der in rows]
+
+    def _evict(self) -> int:
+        (count,) = self._connection.execute(
+            "SELECT COUNT(*) FROM intermediates"
+        ).fetchone()
+        if count <= self.maxsize:
+            return 0
+        return self._connection.execute(
+            "DELETE FROM intermediates WHERE fingerprint IN "
+            "(SELECT fingerprint FROM intermediates ORDER BY last_used LIMIT ?)",
+            (count - self.maxsize,),
+        ).rowcount
+
+
+def _fingerprint(cert: X509) -> str:
+    return sha256(dump_certificate(FILETYPE_ASN1, cert)).hexdigest()
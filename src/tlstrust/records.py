@@ -0,0 +1,121 @@
+"""
+Just enough of the TLS record layer to find the server's certificates
+
+Up to TLS 1.2 the server's Certificate handshake message is sent in the clear,
+so the certificate list can be read from the records as they arrive, before
+any key exchange is done on either end. TLS 1.3 encrypts it, which this
+parser reports so the caller can leave the handshake to OpenSSL
+"""
+
+__module__ = "tlstrust.records"
+
+RECORD_HEADER_LENGTH = 5
+RECORD_HANDSHAKE = 22
+HANDSHAKE_HEADER_LENGTH = 4
+HANDSHAKE_SERVER_HELLO = 2
+HANDSHAKE_CERTIFICATE = 11
+EXTENSION_SUPPORTED_VERSIONS = 43
+TLS_1_3 = 0x0304
+
+
+class ServerFlightParser:
+    """
+    Fed the bytes a server sends, in order. certificates is the DER encoded
+    list from its Certificate message once that has arrived, while plaintext
+    goes False for anything that cannot be read in the clear: TLS 1.3, an alert,
+    or records that do not parse
+    """
+
+    def __init__(self):
+        self.certificates: list[bytes] = None
+        self.version: int = None
+        self.plaintext = True
+        self._records = bytearray()
+        self._handshake = bytearray()
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """The certificates, or None while they have not all arrived"""
+        self._records += data
+        try:
+            self._parse_records()
+        except (ValueError, IndexError):
+            self.plaintext = False
+        return self.certificates
+
+    def _parse_records(self):
+        while (
+            self.plaintext
+            and self.certificates is None
+            and len(self._records) >= RECORD_HEADER_LENGTH
+        ):
+            length = int.from_bytes(self._records[3:5], "big")
+            if len(self._records) < RECORD_HEADER_LENGTH + length:
+                return
+            content_type = self._records[0]
+            fragment = bytes(
+                self._records[RECORD_HEADER_LENGTH : RECORD_HEADER_LENGTH + length]
+            )
+            del self._records[: RECORD_HEADER_LENGTH + length]
+            if content_type != RECORD_HANDSHAKE:
+                # alerts and anything after ChangeCipherSpec are OpenSSL's to handle
+                self.plaintext = False
+                return
+            self._handshake += fragment
+            self._parse_messages()
+
+    def _parse_messages(self):
+        while self.plaintext and len(self._handshake) >= HANDSHAKE_HEADER_LENGTH:
+            length = int.from_bytes(self._handshake[1:4], "big")
+            if len(self._handshake) < HANDSHAKE_HEADER_LENGTH + length:
+                return
+            message_type = self._handshake[0]
+            body = bytes(
+                self._handshake[
+                    HANDSHAKE_HEADER_LENGTH : HANDSHAKE_HEADER_LENGTH + length
+                ]
+            )
+            del self._handshake[: HANDSHAKE_HEADER_LENGTH + length]
+            if message_type == HANDSHAKE_SERVER_HELLO:
+                self.version = server_hello_version(body)
+                if self.version >= TLS_1_3:
+                    self.plaintext = False
+            elif message_type == HANDSHAKE_CERTIFICATE:
+                self.certificates = certificate_list(body)
+                return
+
+
+def server_hello_version(body: bytes) -> int:
+    """The version a ServerHello selected, from supported_versions when present"""
+    version = int.from_bytes(body[0:2], "big")
+    # legacy_version, random, then the session id, cipher suite and compression
+    position = 2 + 32
+    position += 1 + body[position]
+    position += 2 + 1
+    if position + 2 > len(body):
+        return version
+    end = position + 2 + int.from_bytes(body[position : position + 2], "big")
+    position += 2
+    while position + 4 <= end:
+        extension_type = int.from_bytes(body[position : position + 2], "big")
+        length = int.from_bytes(body[position + 2 : position + 4], "big")
+        if extension_type == EXTENSION_SUPPORTED_VERSIONS:
+            return int.from_bytes(body[position + 4 : position + 6], "big")
+        position += 4 + length
+    return version
+
+
+def certificate_list(body: bytes) -> list[bytes]:
+    """The DER certificates of a TLS 1.2 (or older) Certificate message body"""
+    end = 3 + int.from_bytes(body[0:3], "big")
+    if end > len(body):
+        raise ValueError("certificate list is longer than its message")
+    certificates = []
+    position = 3
+    while position < end:
+        length = int.from_bytes(body[position : position + 3], "big")
+        position += 3
+        if position + length > end:
+            raise ValueError("certificate is longer than its list")
+        certificates.append(body[position : position + length])
+        position += length
+    return certificates
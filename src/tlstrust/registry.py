@@ -0,0 +1,326 @@
+"""
+One descriptor per trust store context type
+
+Lookups dispatch through REGISTRY by context type instead of branching on every
+store in turn, and extra stores can be registered at runtime with register_store
+"""
+
+from calendar import timegm
+from functools import lru_cache
+from threading import RLock
+from OpenSSL.crypto import X509, FILETYPE_PEM, FILETYPE_ASN1, load_certificate
+from .context import STORES, SOURCE_ANDROID, INVALID_CONTEXT
+from . import stores
+
+__module__ = "tlstrust.registry"
+
+
+@lru_cache(maxsize=None)
+def _load_pooled_certificate(fingerprint: str) -> X509:
+    return load_certificate(FILETYPE_ASN1, stores.get_der(fingerprint))
+
+
+class StoreDescriptor:
+    """
+    A trust store held in memory: PEM encoded roots by SKI, the untrusted SKIs and
+    the store version. Roots are parsed at most once
+    """
+
+    def __init__(
+        self,
+        context_type: int,
+        name: str,
+        pem_files: dict[str, str] = None,
+        untrusted: list[str] = None,
+        version: str = "",
+        description: str = "",
+    ):
+        self.context_type = context_type
+        self.name = name
+        self._version = version
+        self._description = description
+        self._pem_files = dict(pem_files or {})
+        self._untrusted = frozenset(untrusted or [])
+        self._parsed = {}
+        self._lock = RLock()
+
+    @property
+    def version(self) -> str:
+        return self._version
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    @property
+    def untrusted(self) -> frozenset[str]:
+        return self._untrusted
+
+    @property
+    def distrusted_by(self) -> frozenset[str]:
+        """SKIs that are never trusted in this context, beyond the store's own"""
+        return self.untrusted
+
+    def __contains__(self, key_identifier: str) -> bool:
+        return key_identifier in self._pem_files
+
+    def key_identifiers(self) -> list[str]:
+        return list(self._pem_files)
+
+    def certificate(self, key_identifier: str) -> X509:
+        """The parsed root for the SKI, or None when the store does not hold it"""
+        with self._lock:
+            if key_identifier not in self._parsed:
+                pem = self._pem_files.get(key_identifier)
+                self._parsed[key_identifier] = (
+                    None
+                    if pem is None
+                    else load_certificate(
+                        FILETYPE_PEM, pem.encode() if isinstance(pem, str) else pem
+                    )
+                )
+            return self._parsed[key_identifier]
+
+    def lookup_trust(self, key_identifier: str) -> tuple[int, int]:
+        """PRESENT/DISTRUSTED flags and not_valid_after epoch, as in stores.lookup_trust"""
+        flags = 0
+        not_valid_after = 0
+        certificate = self.certificate(key_identifier)
+        if certificate is not None:
+            flags |= stores.PRESENT
+            not_valid_after = timegm(
+                certificate.to_cryptography().not_valid_after.timetuple()
+            )
+        if key_identifier in self.untrusted:
+            flags |= stores.DISTRUSTED
+        return flags, not_valid_after
+
+
+class PackagedStore(StoreDescriptor):
+    """A store module shipped in tlstrust.stores, imported on first use"""
+
+    @property
+    def module(self):
+        return stores.load_store(self.context_type)
+
+    @property
+    def version(self) -> str:
+        return self.module.__version__
+
+    @property
+    def description(self) -> str:
+        return self.module.__description__
+
+    @property
+    def untrusted(self) -> frozenset[str]:
+        return stores.untrusted(self.context_type)
+
+    @property
+    def distrusted_by(self) -> frozenset[str]:
+        if self.context_type == SOURCE_ANDROID:
+            return stores.android_untrusted()
+        return self.untrusted
+
+    def __contains__(self, key_identifier: str) -> bool:
+        return key_identifier in self.module.CERTIFICATES
+
+    def key_identifiers(self) -> list[str]:
+        return list(self.module.CERTIFICATES)
+
+    def certificate(self, key_identifier: str) -> X509:
+        fingerprint = self.module.CERTIFICATES.get(key_identifier)
+        if fingerprint is None:
+            return None
+        return _load_pooled_certificate(fingerprint)
+
+    def lookup_trust(self, key_identifier: str) -> tuple[int, int]:
+        return stores.lookup_trust(key_identifier, self.context_type)
+
+
+class SnapshotStore(PackagedStore):
+    """A packaged store as it was at one recorded version, see stores.store_history"""
+
+    def __init__(self, context_type: int, name: str, version: str):
+        super().__init__(context_type, name)
+        self._version = version
+        self._certificates, self._untrusted = stores.load_snapshot(
+            context_type, version
+        )
+
+    @property
+    def version(self) -> str:
+        return self._version
+
+    @property
+    def untrusted(self) -> frozenset[str]:
+        return self._untrusted
+
+    @property
+    def distrusted_by(self) -> frozenset[str]:
+        # other stores are not versioned together, so only its own untrusted SKIs
+        return self._untrusted
+
+    def __contains__(self, key_identifier: str) -> bool:
+        return key_identifier in self._certificates
+
+    def key_identifiers(self) -> list[str]:
+        return list(self._certificates)
+
+    def certificate(self, key_identifier: str) -> X509:
+        fingerprint = self._certificates.get(key_identifier)
+        if fingerprint is None:
+            return None
+        return _load_pooled_certificate(fingerprint)
+
+    def lookup_trust(self, key_identifier: str) -> tuple[int, int]:
+        return StoreDescriptor.lookup_trust(self, key_identifier)
+
+
+class StoreRegistry:
+    def __init__(self):
+        self._descriptors: dict[int, StoreDescriptor] = {}
+        self._root_index: dict[str, tuple[int, ...]] = None
+        self._subject_index: dict[str, tuple[str, ...]] = None
+        self._lock = RLock()
+        # bumped whenever the registered stores change, for caches keyed on them
+        self.generation = 0
+
+    def __contains__(self, context_type: int) -> bool:
+        return context_type in self._descriptors
+
+    def __iter__(self):
+        return iter(list(self._descriptors))
+
+    def __len__(self) -> int:
+        return len(self._descriptors)
+
+    def __getitem__(self, context_type: int) -> StoreDescriptor:
+        try:
+            return self._descriptors[context_type]
+        except (KeyError, TypeError) as ex:
+            raise AttributeError(INVALID_CONTEXT.format(context_type)) from ex
+
+    def get(self, context_type: int, default=None) -> StoreDescriptor:
+        try:
+            return self._descriptors.get(context_type, default)
+        except TypeError:
+            return default
+
+    def at_version(self, context_type: int, version: str) -> StoreDescriptor:
+        """The store as it was at a recorded version, the current one when version is None"""
+        descriptor = self[context_type]
+        if version is None or version == descriptor.version:
+            return descriptor
+        if not isinstance(descriptor, PackagedStore):
+            raise ValueError(f"{descriptor.name} has no recorded versions")
+        return _snapshot_store(context_type, descriptor.name, version)
+
+    def descriptors(self) -> list[StoreDescriptor]:
+        return list(self._descriptors.values())
+
+    def register(self, descriptor: StoreDescriptor) -> StoreDescriptor:
+        if not isinstance(descriptor.context_type, int):
+            raise TypeError(
+                f"context type {type(descriptor.context_type)} not supported, expected int"
+            )
+        with self._lock:
+            if descriptor.context_type in self._descriptors:
+                raise ValueError(
+                    f"context type {descriptor.context_type} is already registered"
+                )
+            self._descriptors[descriptor.context_type] = descriptor
+            self._changed()
+        return descriptor
+
+    def unregister(self, context_type: int) -> StoreDescriptor:
+        """Remove a store, the descriptor that was registered for it is returned"""
+        with self._lock:
+            descriptor = self[context_type]
+            del self._descriptors[context_type]
+            self._changed()
+        return descriptor
+
+    def _changed(self):
+        self._root_index = None
+        self._subject_index = None
+        self.generation += 1
+
+    def root_index(self) -> dict[str, tuple[int, ...]]:
+        """
+        Root SKI -> every context type holding that root, in registry order. Built
+        once across all stores so an AKI resolves to its root in one lookup
+        """
+        with self._lock:
+            if self._root_index is None:
+                index = {}
+                for context_type, descriptor in self._descriptors.items():
+                    for key_identifier in descriptor.key_identifiers():
+                        index.setdefault(key_identifier, []).append(context_type)
+                self._root_index = {
+                    key_identifier: tuple(contexts)
+                    for key_identifier, contexts in index.items()
+                }
+            return self._root_index
+
+    def subject_index(self) -> dict[str, tuple[str, ...]]:
+        """
+        Subject DN hash -> keys of the roots with that subject across all stores,
+        the fallback for certificates that carry no key identifiers
+        """
+        with self._lock:
+            if self._subject_index is None:
+                index = {
+                    name_hash: list(keys)
+                    for name_hash, keys in stores.load_matrix().SUBJECTS.items()
+                }
+                for descriptor in self._descriptors.values():
+                    if isinstance(descriptor, PackagedStore):
+                        continue
+                    for key_identifier in descriptor.key_identifiers():
+                        name_hash = stores.subject_hash(
+                            descriptor.certificate(key_identifier)
+                            .to_cryptography()
+                            .subject
+                        )
+                        if key_identifier not in index.setdefault(name_hash, []):
+                            index[name_hash].append(key_identifier)
+                self._subject_index = {
+                    name_hash: tuple(keys) for name_hash, keys in index.items()
+                }
+            return self._subject_index
+
+
+@lru_cache(maxsize=64)
+def _snapshot_store(context_type: int, name: str, version: str) -> SnapshotStore:
+    return SnapshotStore(context_type, name, version)
+
+
+REGISTRY = StoreRegistry()
+for _name, _context_type in STORES.items():
+    REGISTRY.register(PackagedStore(_context_type, _name))
+
+
+def register_store(
+    context_type: int,
+    name: str,
+    pem_files: dict[str, str],
+    untrusted: list[str] = None,
+    version: str = "",
+    description: str = "",
+) -> StoreDescriptor:
+    """Add a store that is not packaged with tlstrust, keyed by root SKI"""
+    return REGISTRY.register(
+        StoreDescriptor(
+            context_type,
+            name,
+            pem_files=pem_files,
+            untrusted=untrusted,
+            version=version,
+            description=description,
+        )
+    )
+
+
+def unregister_store(context_type: int) -> StoreDescriptor:
+    """Remove a store added with register_store"""
+    return REGISTRY.unregister(context_type)
@@ -0,0 +1,202 @@
+"""
+Name resolution and connection racing for the chain fetchers
+
+Each name is resolved once per TTL rather than once per protocol attempt, both
+IPv4 and IPv6 addresses are used, and connections race the addresses happy
+eyeballs style (RFC 8305) so one unreachable address does not stall a scan
+"""
+
+import os
+import asyncio
+from errno import EINPROGRESS, EWOULDBLOCK
+from selectors import DefaultSelector, EVENT_WRITE
+from collections.abc import Callable
+from socket import socket, getaddrinfo, SOCK_STREAM, SOL_SOCKET, SO_ERROR
+from time import monotonic
+from .cache import LRUCache
+
+__module__ = "tlstrust.resolver"
+
+# getaddrinfo does not report record TTLs, answers are kept this long instead
+DEFAULT_TTL = 300
+# RFC 8305 recommends 250ms before racing the next address
+DEFAULT_CONNECTION_DELAY = 0.25
+
+
+def interleave_families(addresses: list[tuple[int, tuple]]) -> list[tuple[int, tuple]]:
+    """
+    Alternate address families, starting with the family getaddrinfo preferred,
+    keeping the order within each family
+    """
+    if not addresses:
+        return []
+    first_family = addresses[0][0]
+    preferred = [address for address in addresses if address[0] == first_family]
+    others = [address for address in addresses if address[0] != first_family]
+    interleaved = []
+    for index in range(max(len(preferred), len(others))):
+        interleaved.extend(preferred[index : index + 1])
+        interleaved.extend(others[index : index + 1])
+    return interleaved
+
+
+def address_of(address: tuple[int, tuple]) -> str:
+    """The IP address of a (family, sockaddr) pair, as getpeername reports it"""
+    return address[1][0]
+
+
+class Resolver:
+    """A and AAAA answers by (host, port), each kept for ttl seconds"""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, maxsize: int = 16384):
+        if not isinstance(ttl, (int, float)) or ttl < 0:
+            raise ValueError(f"ttl {ttl} must be a non-negative number")
+        self.ttl = ttl
+        self._cache = LRUCache(maxsize=maxsize)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def cached(self, host: str, port: int) -> list[tuple[int, tuple]]:
+        """The unexpired answer for the name, or None"""
+        entry = self._cache.get((host, port))
+        if entry is None or entry[0] < monotonic():
+            return None
+        return entry[1]
+
+    def resolve(self, host: str, port: int) -> list[tuple[int, tuple]]:
+        """(family, sockaddr) of every address for the name, raises socket.gaierror"""
+        addresses = self.cached(host, port)
+        if addresses is None:
+            addresses = self._store(
+                host, port, getaddrinfo(host, port, type=SOCK_STREAM)
+            )
+        return addresses
+
+    async def resolve_async(self, host: str, port: int) -> list[tuple[int, tuple]]:
+        addresses = self.cached(host, port)
+        if addresses is None:
+            answer = await asyncio.get_running_loop().getaddrinfo(
+                host, port, type=SOCK_STREAM
+            )
+            addresses = self._store(host, port, answer)
+        return addresses
+
+    def _store(self, host: str, port: int, answer: list) -> list[tuple[int, tuple]]:
+        addresses = []
+        for family, _, _, _, sockaddr in answer:
+            if (family, sockaddr) not in addresses:
+                addresses.append((family, sockaddr))
+        addresses = interleave_families(addresses)
+        self._cache.put((host, port), (monotonic() + self.ttl, addresses))
+        return addresses
+
+
+RESOLVER = Resolver()
+
+
+def connect_first(
+    addresses: list[tuple[int, tuple]],
+    timeout: float,
+    delay: float = DEFAULT_CONNECTION_DELAY,
+    observe: Callable[[str, float], None] = None,
+) -> socket:
+    """
+    A blocking socket connected to whichever address accepts first. Another
+    address is tried every delay seconds while earlier attempts are pending, the
+    last failure is raised when all fail, TimeoutError when timeout passes.
+    observe(address, seconds) is told how long each successful connect took
+    """
+    if not addresses:
+        raise OSError("no addresses to connect to")
+    remaining = list(addresses)
+    deadline = monotonic() + timeout
+    selector = DefaultSelector()
+    errors = []
+    connected = None
+    try:
+        while remaining or selector.get_map():
+            if remaining:
+                family, sockaddr = remaining.pop(0)
+                sock = socket(family, SOCK_STREAM)
+                sock.setblocking(False)
+                error = sock.connect_ex(sockaddr)
+                if error in (0, EINPROGRESS, EWOULDBLOCK):
+                    selector.register(sock, EVENT_WRITE, (sockaddr[0], monotonic()))
+                else:
+                    sock.close()
+                    errors.append(OSError(error, os.strerror(error)))
+                    continue
+            wait = deadline - monotonic()
+            if wait <= 0:
+                raise TimeoutError(
+                    f"timed out connecting to {address_of(addresses[0])}"
+                )
+            if remaining:
+                wait = min(wait, delay)
+            for key, _ in selector.select(wait):
+                sock = key.fileobj
+                selector.unregister(sock)
+                error = sock.getsockopt(SOL_SOCKET, SO_ERROR)
+                if error == 0 and observe is not None:
+                    address, started = key.data
+                    observe(address, monotonic() - started)
+                if error == 0 and connected is None:
+                    connected = sock
+                    continue
+                sock.close()
+                if error:
+                    errors.append(OSError(error, os.strerror(error)))
+            if connected is not None:
+                connected.setblocking(True)
+                return connected
+        raise errors[-1]
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+
+
+async def open_connection_first_async(
+    addresses: list[tuple[int, tuple]],
+    delay: float = DEFAULT_CONNECTION_DELAY,
+    observe: Callable[[str, float], None] = None,
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """connect_first for asyncio streams, bound it with asyncio.wait_for"""
+    if not addresses:
+        raise OSError("no addresses to connect to")
+
+    async def attempt(family: int, sockaddr: tuple):
+        started = monotonic()
+        streams = await asyncio.open_connection(sockaddr[0], sockaddr[1], family=family)
+        if observe is not None:
+            observe(sockaddr[0], monotonic() - started)
+        return streams
+
+    remaining = list(addresses)
+    pending = set()
+    errors = []
+    try:
+        while remaining or pending:
+            if remaining:
+                family, sockaddr = remaining.pop(0)
+                pending.add(asyncio.ensure_future(attempt(family, sockaddr)))
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=delay if remaining else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            connected = None
+            for task in done:
+                if task.exception() is not None:
+                    errors.append(task.exception())
+                elif connected is None:
+                    connected = task.result()
+                else:
+                    task.result()[1].close()
+            if connected is not None:
+                return connected
+        raise errors[-1]
+    finally:
+        for task in pending:
+            task.cancel()
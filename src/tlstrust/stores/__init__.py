@@ -1,114 +1,349 @@
+from array import array
+from base64 import b64decode
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from hashlib import sha1
+from importlib import import_module
+from types import ModuleType
 from tlstrust import context
-from .ccadb import __version__ as ccadb_version
-from .java import __version__ as java_version
-from .certifi import __version__ as certifi_version
-from .mintsifry_rossii import __version__ as russia_version
-from .rustls import __version__ as rust_version
-from .curl import __version__ as curl_version
-from .dart import __version__ as dart_version
-from .android_2_2 import __version__ as android2_2_version
-from .android_2_3 import __version__ as android2_3_version
-from .android_3 import __version__ as android3_version
-from .android_4 import __version__ as android4_version
-from .android_4_4 import __version__ as android4_4_version
-from .android_7 import __version__ as android7_version
-from .android_8 import __version__ as android8_version
-from .android_9 import __version__ as android9_version
-from .android_10 import __version__ as android10_version
-from .android_11 import __version__ as android11_version
-from .android_12 import __version__ as android12_version
-from .android_13 import __version__ as android13_version
-from .android_14 import __version__ as android14_version
-from .android_latest import __version__ as android_version
-
+from .tlsdb import TrustDatabase, open_db, write_db
 
 __module__ = "tlstrust.stores"
 
-VERSIONS = {
-    context.CCADB: ccadb_version,
-    context.JAVA_SRE: java_version,
-    context.ANDROID: android_version,
-    context.ANDROID_LATEST: android_version,
-    context.GOOGLE_TRUST_SERVICES: android_version,
-    context.ANDROID_FROYO: android2_2_version,
-    context.ANDROID_GINGERBREAD: android2_3_version,
-    context.ANDROID_HONEYCOMB: android3_version,
-    context.ANDROID_ICE_CREAM_SANDWICH: android4_version,
-    context.ANDROID_KITKAT: android4_4_version,
-    context.ANDROID_NOUGAT: android7_version,
-    context.ANDROID_OREO: android8_version,
-    context.ANDROID_PIE: android9_version,
-    context.ANDROID_QUINCE_TART: android10_version,
-    context.ANDROID_RED_VELVET_CAKE: android11_version,
-    context.ANDROID_SNOW_CONE: android12_version,
-    context.ANDROID_TIRAMISU: android13_version,
-    context.ANDROID_UPSIDE_DOWN_CAKE: android14_version,
-    context.LINUX_ARCH: ccadb_version,
-    context.LINUX_FEDORA: ccadb_version,
-    context.LINUX_DEBIAN: ccadb_version,
-    context.LINUX_UBUNTU: ccadb_version,
-    context.LINUX_ALPINE: ccadb_version,
-    context.LINUX_CENTOS: ccadb_version,
-    context.LINUX_RHEL: ccadb_version,
-    context.OPENBSD: ccadb_version,
-    context.FREEBSD: ccadb_version,
-    context.PYTHON_CERTIFI: certifi_version,
-    context.MINTSIFRY_ROSSII: russia_version,
-    context.RUSTLS: rust_version,
-    context.CURL: curl_version,
-    context.DART: dart_version,
-    context.ELIXIR_WINDOWS: curl_version,
-    context.ELIXIR_LINUX: curl_version,
-    context.ELIXIR_APPLE: curl_version,
-    context.ELIXIR_MINT: curl_version,
-    context.ELIXIR_PHOENIX_WINDOWS: curl_version,
-    context.ELIXIR_PHOENIX_LINUX: curl_version,
-    context.ELIXIR_PHOENIX_MACOS: curl_version,
-    context.PYTHON: certifi_version,
-    context.WINDOWS: ccadb_version,
-    context.APPLE: ccadb_version,
-    context.FIREFOX: ccadb_version,
-    context.TOR: ccadb_version,
-    context.CHROMIUM: ccadb_version,
-    context.CHROME: ccadb_version,
-    context.EDGE: ccadb_version,
-    context.BRAVE: ccadb_version,
-    context.OPERA: ccadb_version,
-    context.VIVALDI: ccadb_version,
-    context.SILK: ccadb_version,
-    context.SAMSUNG: ccadb_version,
-    context.YANDEX: russia_version,
-    context.SAFARI: ccadb_version,
-    context.ROKU: ccadb_version,
-    context.PY_WINDOWS: ccadb_version,
-    context.PY_LINUX: ccadb_version,
-    context.PY_APPLE: ccadb_version,
-    context.PY_CERTIFI: certifi_version,
-    context.PY_URLLIB: certifi_version,
-    context.PY_REQUESTS: certifi_version,
-    context.PY_DJANGO: certifi_version,
-    context.RUST_WINDOWS: rust_version,
-    context.RUST_LINUX: rust_version,
-    context.RUST_APPLE: rust_version,
-    context.RUST_RUSTLS: rust_version,
-    context.RUST_WEBPKI: rust_version,
-    context.ERLANG_WINDOWS: ccadb_version,
-    context.ERLANG_LINUX: ccadb_version,
-    context.ERLANG_APPLE: ccadb_version,
-    context.ERLANG_CERTIFI: certifi_version,
-    context.GO_WINDOWS: ccadb_version,
-    context.GO_LINUX: ccadb_version,
-    context.GO_APPLE: ccadb_version,
-    context.GO_CERTIFI: certifi_version,
-    context.NODE_WINDOWS: ccadb_version,
-    context.NODE_LINUX: ccadb_version,
-    context.NODE_APPLE: ccadb_version,
-    context.NODE_CERTIFI: certifi_version,
-    context.RUBY_WINDOWS: ccadb_version,
-    context.RUBY_LINUX: ccadb_version,
-    context.RUBY_APPLE: ccadb_version,
-    context.RUBY_CERTIFI: certifi_version,
-    context.CURL_WINDOWS: curl_version,
-    context.CURL_LINUX: curl_version,
-    context.CURL_APPLE: curl_version,
+PRESENT = 1
+DISTRUSTED = 2
+# matrix cells per store column: flags, not_valid_before, not_valid_after
+MATRIX_CELLS = 3
+# roots without a SubjectKeyIdentifier are keyed by their subject DN hash
+SUBJECT_KEY_PREFIX = "dn:"
+
+STORE_MODULES = {
+    context.SOURCE_CCADB: "ccadb",
+    context.SOURCE_JAVA: "java",
+    context.SOURCE_ANDROID: "android_latest",
+    context.SOURCE_RUSTLS: "rustls",
+    context.SOURCE_CURL: "curl",
+    context.SOURCE_DART: "dart",
+    context.SOURCE_CERTIFI: "certifi",
+    context.SOURCE_RUSSIA: "mintsifry_rossii",
+    context.PLATFORM_ANDROID2_2: "android_2_2",
+    context.PLATFORM_ANDROID2_3: "android_2_3",
+    context.PLATFORM_ANDROID3: "android_3",
+    context.PLATFORM_ANDROID4: "android_4",
+    context.PLATFORM_ANDROID4_4: "android_4_4",
+    context.PLATFORM_ANDROID7: "android_7",
+    context.PLATFORM_ANDROID8: "android_8",
+    context.PLATFORM_ANDROID9: "android_9",
+    context.PLATFORM_ANDROID10: "android_10",
+    context.PLATFORM_ANDROID11: "android_11",
+    context.PLATFORM_ANDROID12: "android_12",
+    context.PLATFORM_ANDROID13: "android_13",
+    context.PLATFORM_ANDROID14: "android_14",
 }
+ANDROID_STORES = (
+    context.SOURCE_ANDROID,
+    context.PLATFORM_ANDROID2_2,
+    context.PLATFORM_ANDROID2_3,
+    context.PLATFORM_ANDROID3,
+    context.PLATFORM_ANDROID4,
+    context.PLATFORM_ANDROID4_4,
+    context.PLATFORM_ANDROID7,
+    context.PLATFORM_ANDROID8,
+    context.PLATFORM_ANDROID9,
+    context.PLATFORM_ANDROID10,
+    context.PLATFORM_ANDROID11,
+    context.PLATFORM_ANDROID12,
+    context.PLATFORM_ANDROID13,
+    context.PLATFORM_ANDROID14,
+)
+
+
+def load_store(context_type: int) -> ModuleType:
+    """
+    Store modules (and the certificate pool) are only imported the first time
+    they are queried, so `import tlstrust` does not pay for stores it never uses
+    """
+    if context_type not in STORE_MODULES:
+        raise AttributeError(context.INVALID_CONTEXT.format(context_type))
+    return import_module(f"{__name__}.{STORE_MODULES[context_type]}")
+
+
+@lru_cache(maxsize=None)
+def untrusted(context_type: int) -> frozenset[str]:
+    return frozenset(load_store(context_type).UNTRUSTED)
+
+
+@lru_cache(maxsize=None)
+def android_untrusted() -> frozenset[str]:
+    """Union of the untrusted SKIs of every Android store, built once"""
+    return frozenset().union(*(untrusted(ctx) for ctx in ANDROID_STORES))
+
+
+def untrusted_members(
+    key_identifiers: Iterable[str], context_type: int, android_family: bool = False
+) -> frozenset[str]:
+    """
+    The subset of key_identifiers the store distrusts, in one set intersection for
+    bulk callers. android_family uses the union that TrustStore.android checks
+    """
+    distrusted = android_untrusted() if android_family else untrusted(context_type)
+    return distrusted.intersection(key_identifiers)
+
+
+def get_der(fingerprint: str) -> bytes:
+    return b64decode(import_module(f"{__name__}.pool").DER_FILES[fingerprint])
+
+
+def load_matrix() -> ModuleType:
+    return import_module(f"{__name__}.matrix")
+
+
+@lru_cache(maxsize=None)
+def _matrix_offsets() -> dict[int, int]:
+    return {
+        context_type: index * MATRIX_CELLS
+        for index, context_type in enumerate(load_matrix().COLUMNS)
+    }
+
+
+def matrix_offset(context_type: int) -> int:
+    """Index of the store's first cell in every matrix row, None when not a column"""
+    return _matrix_offsets().get(context_type)
+
+
+def lookup_trust(key_identifier: str, context_type: int) -> tuple[int, int]:
+    """
+    PRESENT/DISTRUSTED flags and the not_valid_after epoch of the root in the
+    store, as precomputed by the generators, (0, 0) when the store does not know it
+    """
+    row = load_matrix().ROWS.get(key_identifier)
+    offset = _matrix_offsets().get(context_type)
+    if row is None or offset is None:
+        return 0, 0
+    return row[offset], row[offset + 2]
+
+
+def lookup_validity(key_identifier: str, context_type: int) -> tuple[int, int]:
+    """not_valid_before and not_valid_after epochs of the store's root, (0, 0) when absent"""
+    row = load_matrix().ROWS.get(key_identifier)
+    offset = _matrix_offsets().get(context_type)
+    if row is None or offset is None:
+        return 0, 0
+    return row[offset + 1], row[offset + 2]
+
+
+@lru_cache(maxsize=None)
+def validity_arrays(context_type: int) -> tuple[dict[str, int], array, array]:
+    """
+    Positions of every root the store holds, with its not_valid_before and
+    not_valid_after epochs in parallel int64 arrays, built once per store
+    """
+    offset = _matrix_offsets().get(context_type)
+    if offset is None:
+        raise AttributeError(context.INVALID_CONTEXT.format(context_type))
+    positions = {}
+    not_valid_before = array("q")
+    not_valid_after = array("q")
+    for key_identifier, row in load_matrix().ROWS.items():
+        if not row[offset] & PRESENT:
+            continue
+        positions[key_identifier] = len(positions)
+        not_valid_before.append(row[offset + 1])
+        not_valid_after.append(row[offset + 2])
+    return positions, not_valid_before, not_valid_after
+
+
+@lru_cache(maxsize=None)
+def matrix_rows() -> dict[str, int]:
+    """Row number of every key in the matrix, the order matrix_columns follow"""
+    return {
+        key_identifier: index for index, key_identifier in enumerate(load_matrix().ROWS)
+    }
+
+
+@lru_cache(maxsize=None)
+def matrix_columns(context_type: int) -> tuple[array, array, array]:
+    """
+    The store's flags, not_valid_before and not_valid_after for every matrix row,
+    as parallel arrays for columnar passes over many keys, built once per store
+    """
+    offset = _matrix_offsets().get(context_type)
+    if offset is None:
+        raise AttributeError(context.INVALID_CONTEXT.format(context_type))
+    flags = array("B")
+    not_valid_before = array("q")
+    not_valid_after = array("q")
+    for row in load_matrix().ROWS.values():
+        flags.append(row[offset])
+        not_valid_before.append(row[offset + 1])
+        not_valid_after.append(row[offset + 2])
+    return flags, not_valid_before, not_valid_after
+
+
+def subject_hash(name) -> str:
+    """
+    SHA-1 of a normalized x509.Name: every attribute as its OID and its value
+    case-folded with whitespace collapsed, in order
+    """
+    normalized = "/".join(
+        f"{attribute.oid.dotted_string}={' '.join(str(attribute.value).split()).casefold()}"
+        for attribute in name
+    )
+    return sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def subject_key(name) -> str:
+    return SUBJECT_KEY_PREFIX + subject_hash(name)
+
+
+def lookup_subject(name_hash: str) -> tuple[str, ...]:
+    """Keys of every packaged root whose subject DN hashes to name_hash"""
+    return tuple(load_matrix().SUBJECTS.get(name_hash, ()))
+
+
+def lookup_metadata(key_identifier: str) -> tuple[str, str, int]:
+    """Common name, SHA-1 fingerprint and not_valid_after epoch of the root"""
+    return tuple(load_matrix().METADATA[key_identifier])
+
+
+def load_history() -> ModuleType:
+    return import_module(f"{__name__}.history")
+
+
+def store_history(context_type: int) -> list[str]:
+    """Every recorded version of the store, oldest first"""
+    if context_type not in STORE_MODULES:
+        raise AttributeError(context.INVALID_CONTEXT.format(context_type))
+    snapshots = load_history().HISTORY.get(STORE_MODULES[context_type], [])
+    return [snapshot["version"] for snapshot in snapshots]
+
+
+@lru_cache(maxsize=64)
+def load_snapshot(
+    context_type: int, version: str
+) -> tuple[dict[str, str], frozenset[str]]:
+    """
+    Membership of the store at a recorded version: SKI -> pool fingerprint and the
+    untrusted SKIs, replayed from the first snapshot through the deltas
+    """
+    versions = store_history(context_type)
+    if version not in versions:
+        raise ValueError(
+            f"{version} is not a recorded version of {STORE_MODULES[context_type]}"
+        )
+    snapshots = load_history().HISTORY[STORE_MODULES[context_type]]
+    certificates = {}
+    untrusted = set()
+    for snapshot in snapshots[: versions.index(version) + 1]:
+        for key_identifier in snapshot["removed"]:
+            certificates.pop(key_identifier, None)
+        certificates.update(snapshot["added"])
+        untrusted.difference_update(snapshot["undistrusted"])
+        untrusted.update(snapshot["distrusted"])
+    return certificates, frozenset(untrusted)
+
+
+class StoreVersions(Mapping):
+    def __init__(self, stores: dict[str, int]):
+        self._stores = stores
+
+    def __getitem__(self, name: str) -> str:
+        return load_store(self._stores[name]).__version__
+
+    def __iter__(self):
+        return iter(self._stores)
+
+    def __len__(self) -> int:
+        return len(self._stores)
+
+
+VERSIONS = StoreVersions(
+    {
+        context.CCADB: context.SOURCE_CCADB,
+        context.JAVA_SRE: context.SOURCE_JAVA,
+        context.ANDROID: context.SOURCE_ANDROID,
+        context.ANDROID_LATEST: context.SOURCE_ANDROID,
+        context.GOOGLE_TRUST_SERVICES: context.SOURCE_ANDROID,
+        context.ANDROID_FROYO: context.PLATFORM_ANDROID2_2,
+        context.ANDROID_GINGERBREAD: context.PLATFORM_ANDROID2_3,
+        context.ANDROID_HONEYCOMB: context.PLATFORM_ANDROID3,
+        context.ANDROID_ICE_CREAM_SANDWICH: context.PLATFORM_ANDROID4,
+        context.ANDROID_KITKAT: context.PLATFORM_ANDROID4_4,
+        context.ANDROID_NOUGAT: context.PLATFORM_ANDROID7,
+        context.ANDROID_OREO: context.PLATFORM_ANDROID8,
+        context.ANDROID_PIE: context.PLATFORM_ANDROID9,
+        context.ANDROID_QUINCE_TART: context.PLATFORM_ANDROID10,
+        context.ANDROID_RED_VELVET_CAKE: context.PLATFORM_ANDROID11,
+        context.ANDROID_SNOW_CONE: context.PLATFORM_ANDROID12,
+        context.ANDROID_TIRAMISU: context.PLATFORM_ANDROID13,
+        context.ANDROID_UPSIDE_DOWN_CAKE: context.PLATFORM_ANDROID14,
+        context.LINUX_ARCH: context.SOURCE_CCADB,
+        context.LINUX_FEDORA: context.SOURCE_CCADB,
+        context.LINUX_DEBIAN: context.SOURCE_CCADB,
+        context.LINUX_UBUNTU: context.SOURCE_CCADB,
+        context.LINUX_ALPINE: context.SOURCE_CCADB,
+        context.LINUX_CENTOS: context.SOURCE_CCADB,
+        context.LINUX_RHEL: context.SOURCE_CCADB,
+        context.OPENBSD: context.SOURCE_CCADB,
+        context.FREEBSD: context.SOURCE_CCADB,
+        context.PYTHON_CERTIFI: context.SOURCE_CERTIFI,
+        context.MINTSIFRY_ROSSII: context.SOURCE_RUSSIA,
+        context.RUSTLS: context.SOURCE_RUSTLS,
+        context.CURL: context.SOURCE_CURL,
+        context.DART: context.SOURCE_DART,
+        context.ELIXIR_WINDOWS: context.SOURCE_CURL,
+        context.ELIXIR_LINUX: context.SOURCE_CURL,
+        context.ELIXIR_APPLE: context.SOURCE_CURL,
+        context.ELIXIR_MINT: context.SOURCE_CURL,
+        context.ELIXIR_PHOENIX_WINDOWS: context.SOURCE_CURL,
+        context.ELIXIR_PHOENIX_LINUX: context.SOURCE_CURL,
+        context.ELIXIR_PHOENIX_MACOS: context.SOURCE_CURL,
+        context.PYTHON: context.SOURCE_CERTIFI,
+        context.WINDOWS: context.SOURCE_CCADB,
+        context.APPLE: context.SOURCE_CCADB,
+        context.FIREFOX: context.SOURCE_CCADB,
+        context.TOR: context.SOURCE_CCADB,
+        context.CHROMIUM: context.SOURCE_CCADB,
+        context.CHROME: context.SOURCE_CCADB,
+        context.EDGE: context.SOURCE_CCADB,
+        context.BRAVE: context.SOURCE_CCADB,
+        context.OPERA: context.SOURCE_CCADB,
+        context.VIVALDI: context.SOURCE_CCADB,
+        context.SILK: context.SOURCE_CCADB,
+        context.SAMSUNG: context.SOURCE_CCADB,
+        context.YANDEX: context.SOURCE_RUSSIA,
+        context.SAFARI: context.SOURCE_CCADB,
+        context.ROKU: context.SOURCE_CCADB,
+        context.PY_WINDOWS: context.SOURCE_CCADB,
+        context.PY_LINUX: context.SOURCE_CCADB,
+        context.PY_APPLE: context.SOURCE_CCADB,
+        context.PY_CERTIFI: context.SOURCE_CERTIFI,
+        context.PY_URLLIB: context.SOURCE_CERTIFI,
+        context.PY_REQUESTS: context.SOURCE_CERTIFI,
+        context.PY_DJANGO: context.SOURCE_CERTIFI,
+        context.RUST_WINDOWS: context.SOURCE_RUSTLS,
+        context.RUST_LINUX: context.SOURCE_RUSTLS,
+        context.RUST_APPLE: context.SOURCE_RUSTLS,
+        context.RUST_RUSTLS: context.SOURCE_RUSTLS,
+        context.RUST_WEBPKI: context.SOURCE_RUSTLS,
+        context.ERLANG_WINDOWS: context.SOURCE_CCADB,
+        context.ERLANG_LINUX: context.SOURCE_CCADB,
+        context.ERLANG_APPLE: context.SOURCE_CCADB,
+        context.ERLANG_CERTIFI: context.SOURCE_CERTIFI,
+        context.GO_WINDOWS: context.SOURCE_CCADB,
+        context.GO_LINUX: context.SOURCE_CCADB,
+        context.GO_APPLE: context.SOURCE_CCADB,
+        context.GO_CERTIFI: context.SOURCE_CERTIFI,
+        context.NODE_WINDOWS: context.SOURCE_CCADB,
+        context.NODE_LINUX: context.SOURCE_CCADB,
+        context.NODE_APPLE: context.SOURCE_CCADB,
+        context.NODE_CERTIFI: context.SOURCE_CERTIFI,
+        context.RUBY_WINDOWS: context.SOURCE_CCADB,
+        context.RUBY_LINUX: context.SOURCE_CCADB,
+        context.RUBY_APPLE: context.SOURCE_CCADB,
+        context.RUBY_CERTIFI: context.SOURCE_CERTIFI,
+        context.CURL_WINDOWS: context.SOURCE_CURL,
+        context.CURL_LINUX: context.SOURCE_CURL,
+        context.CURL_APPLE: context.SOURCE_CURL,
+    }
+)
@@ -0,0 +1,761 @@
+"""
+Do not modify by hand
+Generated by: bin/store_writer.py
+"""
+
+__module__ = "tlstrust.stores.matrix"
+
+COLUMNS = [0, 1, 3, 5, 6, 7, 101, 201, 1302, 2302, 303, 304, 1304, 307, 308, 309, 310, 311, 312, 313, 314]
+ROWS = {
+    "00add9a3f679f66e74a97f333d8117d74ccf33de": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1022565600, 2142276180, 1, 1022565600, 2142276180, 1, 1022565600, 2142276180, 1, 1022565600, 2142276180, 1, 1022565600, 2142276180, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "01b92fefbf118660f24fd0416eab731fe7d26e49": [1, 1545298653, 2334217053, 1, 1545298653, 2334217053, 0, 0, 0, 1, 1545298653, 2334217053, 1, 1545298653, 2334217053, 0, 0, 0, 1, 1545298653, 2334217053, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "03252fde6f82013a5c2cdc2ba169b567d48cd3fd": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1124366780, 1755554780, 1, 1124366780, 1755554780, 1, 1124366780, 1755554780, 1, 1124366780, 1755554780, 1, 1124366780, 1755554780, 1, 1124366780, 1755554780, 1, 1124366780, 1755554780, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "035cab738187a8ccb0a6d594e2369649ff05992c": [1, 1553040000, 2405116800, 1, 1553040000, 2405116800, 0, 0, 0, 1, 1553040000, 2405116800, 0, 0, 0, 0, 0, 0, 1, 1553040000, 2405116800, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "03de503556d14cbb66f0a3e21b1bc397b23dd155": [1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 0, 0, 0, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200],
+    "04aa7a47a3e489af1acf0a40a7183f6fefe97dbe": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 999181381, 1472221381, 3, 999181381, 1472221381, 3, 999181381, 1472221381, 3, 999181381, 1472221381, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "069a9b1f537df1f5a4c8d3863ea17359b4f74421": [1, 1556269076, 2345273876, 1, 1556269076, 2345273876, 0, 0, 0, 1, 1556269076, 2345273876, 0, 0, 0, 0, 0, 0, 1, 1556269076, 2345273876, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "071fd2e79cdac26ea240b4b07a50105074c4c8bd": [1, 1264774104, 1924956504, 1, 1264774104, 1924956504, 1, 1264774104, 1924956504, 1, 1264774104, 1924956504, 1, 1264774104, 1924956504, 1, 1264774104, 1924956504, 1, 1264774104, 1924956504, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1264774104, 1924956504, 1, 1264774104, 1924956504, 1, 1264774104, 1924956504, 1, 1264774104, 1924956504, 1, 1264774104, 1924956504, 1, 1264774104, 1924956504, 1, 1264774104, 1924956504, 1, 1264774104, 1924956504, 1, 1264774104, 1924956504, 1, 1264774104, 1924956504],
+    "07c35130a4aae945ae3524faff242c33d0b19d8c": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 982874363, 1771792763, 1, 982874363, 1771792763, 1, 982874363, 1771792763, 3, 982874363, 1771792763, 1, 982874363, 1771792763, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "0876cdcb07ff24f6c5cdedbb90bce284374675f7": [1, 1224677257, 1893413257, 1, 1224677257, 1893413257, 1, 1224677257, 1893413257, 1, 1224677257, 1893413257, 0, 0, 0, 1, 1224677257, 1893413257, 1, 1224677257, 1893413257, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1224677257, 1893413257, 1, 1224677257, 1893413257, 1, 1224677257, 1893413257, 1, 1224677257, 1893413257, 1, 1224677257, 1893413257, 1, 1224677257, 1893413257, 1, 1224677257, 1893413257, 1, 1224677257, 1893413257, 1, 1224677257, 1893413257, 1, 1224677257, 1893413257],
+    "0972064e18430fe5d6ccc36a8b317b788fa883b8": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1069363198, 1511212798, 3, 1069363198, 1511212798, 3, 1069363198, 1511212798, 3, 1069363198, 1511212798, 3, 1069363198, 1511212798, 3, 1069363198, 1511212798, 3, 1069363198, 1511212798, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "09cb597f86b2708f1ac339e3c0d9e9bfbb4db223": [1, 1576709482, 2289337223, 1, 1576709482, 2289337223, 1, 1576709482, 2289337223, 1, 1576709482, 2289337223, 0, 0, 0, 1, 1576709482, 2289337223, 1, 1576709482, 2289337223, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1576709482, 2289337223, 1, 1576709482, 2289337223, 1, 1576709482, 2289337223],
+    "0a4823a660a4920a33ea935bc557ea254dbd12ee": [1, 1613732138, 2370596137, 1, 1613732138, 2370596137, 0, 0, 0, 1, 1613732138, 2370596137, 1, 1613732138, 2370596137, 0, 0, 0, 1, 1613732138, 2370596137, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "0a85a9776505987c4081f80f972c38f10aec3ccf": [1, 1243573239, 1874725239, 1, 1243573239, 1874725239, 1, 1243573239, 1874725239, 1, 1243573239, 1874725239, 0, 0, 0, 1, 1243573239, 1874725239, 1, 1243573239, 1874725239, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1243573239, 1874725239, 1, 1243573239, 1874725239, 1, 1243573239, 1874725239, 1, 1243573239, 1874725239, 1, 1243573239, 1874725239, 1, 1243573239, 1874725239, 1, 1243573239, 1874725239, 1, 1243573239, 1874725239, 1, 1243573239, 1874725239],
+    "0b58e58bc64c1537a440a930a921be47365a56ff": [1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 0, 0, 0, 0, 0, 0, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999],
+    "0d8cb661da44b8d1147dc3be7d5e48f0ceca6ab0": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1221640139, 1852792139, 1, 1221640139, 1852792139, 1, 1221640139, 1852792139, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "12f25a3eea561cbfcd06acf1f125c9a94bd41499": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1288433430, 1923782399, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1288433430, 1923782399, 1, 1288433430, 1923782399, 1, 1288433430, 1923782399, 1, 1288433430, 1923782399, 1, 1288433430, 1923782399, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "1538830f3f2c3f70331ecd46fe078c20e0d7c3b7": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1025057916, 1656029772, 3, 1025057916, 1656029772, 3, 1025057916, 1656029772, 3, 1025057916, 1656029772, 3, 1025057916, 1656029772, 3, 1025057916, 1656029772, 3, 1025057916, 1656029772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "155f35575155fb25b2ad0369fc01a3fabe1155d5": [0, 0, 0, 0, 0, 0, 1, 1194220800, 2147471999, 0, 0, 0, 0, 0, 0, 1, 1194220800, 2147471999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999],
+    "15a69680b1154b31c3c29cf6e7130b4bf318cd86": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1252334324, 1892903924, 1, 1252334324, 1892903924, 1, 1252334324, 1892903924, 1, 1252334324, 1892903924, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "179dcd1e8bd6392b70d35cd4a0b81fb000fcc561": [1, 1496456986, 2285375386, 1, 1496456986, 2285375386, 1, 1496456986, 2285375386, 1, 1496456986, 2285375386, 1, 1496456986, 2285375386, 1, 1496456986, 2285375386, 1, 1496456986, 2285375386, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1496456986, 2285375386, 1, 1496456986, 2285375386, 1, 1496456986, 2285375386, 1, 1496456986, 2285375386],
+    "17a0cdc1e441b63a5b3bcb459dbd1cc298fa8658": [1, 1161765166, 2108536366, 1, 1161765166, 2108536366, 1, 1161765166, 2108536366, 1, 1161765166, 2108536366, 0, 0, 0, 1, 1161765166, 2108536366, 1, 1161765166, 2108536366, 0, 0, 0, 0, 0, 0, 1, 1161765166, 2108536366, 1, 1161765166, 2108536366, 1, 1161765166, 2108536366, 1, 1161765166, 2108536366, 1, 1161765166, 2108536366, 1, 1161765166, 2108536366, 1, 1161765166, 2108536366, 1, 1161765166, 2108536366, 1, 1161765166, 2108536366, 1, 1161765166, 2108536366, 1, 1161765166, 2108536366, 1, 1161765166, 2108536366],
+    "188756e06e77ee24353c4e739a1fd6e1e2797e2b": [1, 1380616347, 2011768347, 1, 1380616347, 2011768347, 1, 1380616347, 2011768347, 1, 1380616347, 2011768347, 0, 0, 0, 1, 1380616347, 2011768347, 1, 1380616347, 2011768347, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1380616347, 2011768347, 1, 1380616347, 2011768347, 1, 1380616347, 2011768347, 1, 1380616347, 2011768347, 1, 1380616347, 2011768347],
+    "1a8462bc484c332504d4eed0f603c41946d1946b": [1, 1164392820, 1953311013, 1, 1164392820, 1953311013, 1, 1164392820, 1953311013, 1, 1164392820, 1953311013, 0, 0, 0, 1, 1164392820, 1953311013, 1, 1164392820, 1953311013, 0, 0, 0, 1, 1164392820, 1953311013, 1, 1164392820, 1953311013, 1, 1164392820, 1953311013, 1, 1164392820, 1953311013, 1, 1164392820, 1953311013, 1, 1164392820, 1953311013, 1, 1164392820, 1953311013, 1, 1164392820, 1953311013, 1, 1164392820, 1953311013, 1, 1164392820, 1953311013, 1, 1164392820, 1953311013, 1, 1164392820, 1953311013, 1, 1164392820, 1953311013],
+    "1aedfe413990b42459be01f252d545f65a39dc11": [1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 0, 0, 0, 0, 0, 0, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985, 1, 1183129985, 1814281985],
+    "1d1c650ea8f2257bb491cfe4b1b1e6bd55746c05": [1, 1197551308, 2144305645, 1, 1197551308, 2144305645, 1, 1197551308, 2144305645, 1, 1197551308, 2144305645, 0, 0, 0, 1, 1197551308, 2144305645, 1, 1197551308, 2144305645, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1197551308, 2144305645, 1, 1197551308, 2144305645, 1, 1197551308, 2144305645, 1, 1197551308, 2144305645, 1, 1197551308, 2144305645, 1, 1197551308, 2144305645, 1, 1197551308, 2144305645, 1, 1197551308, 2144305645, 1, 1197551308, 2144305645],
+    "1e0cf7b667f2e192260945c055392e773f424aa2": [1, 1103509887, 2050194687, 1, 1103509887, 2050194687, 1, 1103509887, 2050194687, 1, 1103509887, 2050194687, 0, 0, 0, 1, 1103509887, 2050194687, 1, 1103509887, 2050194687, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1103509887, 2050194687, 1, 1103509887, 2050194687, 1, 1103509887, 2050194687, 1, 1103509887, 2050194687, 1, 1103509887, 2050194687, 1, 1103509887, 2050194687, 1, 1103509887, 2050194687, 1, 1103509887, 2050194687, 1, 1103509887, 2050194687, 1, 1103509887, 2050194687, 1, 1103509887, 2050194687],
+    "1e824d2865803cc9416eac352e5acbdeeef8395b": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 913231046, 1544384846, 3, 913231046, 1544384846, 3, 913231046, 1544384846, 3, 913231046, 1544384846, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "2130c9fb00d74e98da87aa2ad0a72eb14031a74c": [0, 0, 0, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 0, 0, 0, 0, 0, 0, 1, 1164931200, 1893455999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999, 1, 1164931200, 1893455999],
+    "26951910d9e8a19791ffdc19d9b5043ed2730a6a": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1197565674, 1670976474, 3, 1197565674, 1670976474, 3, 1197565674, 1670976474, 3, 1197565674, 1670976474, 3, 1197565674, 1670976474, 3, 1197565674, 1670976474, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "29c590ab25af11e461bfa3ff886191e60efe9c81": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1198607839, 1513967839, 3, 1198607839, 1513967839, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "2cd5504197158bf08f36615b4afb6bd999c93392": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1164585600, 2099865599, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1164585600, 2099865599, 1, 1164585600, 2099865599, 1, 1164585600, 2099865599, 1, 1164585600, 2099865599, 1, 1164585600, 2099865599, 1, 1164585600, 2099865599, 1, 1164585600, 2099865599, 1, 1164585600, 2099865599, 1, 1164585600, 2099865599, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "2e16a94a18b5cbccf56f50f3235ff85de7acf0c8": [1, 1445240610, 2076392610, 1, 1445240610, 2076392610, 1, 1445240610, 2076392610, 1, 1445240610, 2076392610, 0, 0, 0, 1, 1445240610, 2076392610, 1, 1445240610, 2076392610, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1445240610, 2076392610, 1, 1445240610, 2076392610, 1, 1445240610, 2076392610, 1, 1445240610, 2076392610, 1, 1445240610, 2076392610, 1, 1445240610, 2076392610, 1, 1445240610, 2076392610, 1, 1445240610, 2076392610],
+    "2ee3dbb249d09c54795cfa272afecc4ed2e84e54": [1, 1362485388, 1677845388, 1, 1362485388, 1677845388, 1, 1362485388, 1677845388, 1, 1362485388, 1677845388, 1, 1362485388, 1677845388, 1, 1362485388, 1677845388, 1, 1362485388, 1677845388, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1362485388, 1677845388, 1, 1362485388, 1677845388, 1, 1362485388, 1677845388, 1, 1362485388, 1677845388, 1, 1362485388, 1677845388, 1, 1362485388, 1677845388, 1, 1362485388, 1677845388, 1, 1362485388, 1677845388],
+    "310a908fb6c69dd2444b80b5a2e61fb1124f1b95": [1, 1553040000, 2405116800, 1, 1553040000, 2405116800, 0, 0, 0, 1, 1553040000, 2405116800, 1, 1553040000, 2405116800, 0, 0, 0, 1, 1553040000, 2405116800, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "31c3791bbaf553d717e0897a2d176c0ab32b9d33": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 931522260, 1562716740, 3, 931522260, 1562716740, 3, 931522260, 1562716740, 3, 931522260, 1562716740, 3, 931522260, 1562716740, 3, 931522260, 1562716740, 3, 931522260, 1562716740, 3, 931522260, 1562716740, 3, 931522260, 1562716740, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "330ba066d1eadacede6293042852b5147f3868b7": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1003960800, 1382652000, 3, 1003960800, 1382652000, 3, 1003960800, 1382652000, 3, 1003960800, 1382652000, 3, 1003960800, 1382652000, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "350fc836635ee2a3ecf93b6615ce5152e3919a3d": [1, 1417446032, 2206365031, 1, 1417446032, 2206365031, 1, 1417446032, 2206365031, 1, 1417446032, 2206365031, 1, 1417446032, 2206365031, 1, 1417446032, 2206365031, 1, 1417446032, 2206365031, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1417446032, 2206365031, 1, 1417446032, 2206365031, 1, 1417446032, 2206365031, 1, 1417446032, 2206365031, 1, 1417446032, 2206365031, 1, 1417446032, 2206365031, 1, 1417446032, 2206365031, 1, 1417446032, 2206365031],
+    "354af54daf3fd78238acab716517758c9d5593e6": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1181095952, 2127867152, 1, 1181095952, 2127867152, 1, 1181095952, 2127867152, 1, 1181095952, 2127867152, 1, 1181095952, 2127867152, 1, 1181095952, 2127867152, 1, 1181095952, 2127867152, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "3814e6c8f0a9a403f44e3e22a35bf2d6e0ad4074": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1115647983, 1431180783, 3, 1115647983, 1431180783, 3, 1115647983, 1431180783, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "39958b628b5cc9d480ba580f973f150843cc98a7": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 959683490, 1590835490, 3, 959683490, 1590835490, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "3a9a8507106728b6eff6bd05416e20c194da0fde": [1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 0, 0, 0, 0, 0, 0, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799],
+    "3ae10986d4cf19c29676744976dce035c663639a": [1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 0, 0, 0, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999],
+    "3cd89388c2c08209cc0199069320e99e7009634f": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "3de629489bea07ca21444a26de6eded283d09f59": [1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647],
+    "3f8d9a598bfc7b7b9ca3af38b039ed907180d6c8": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1160735109, 1476354309, 3, 1160735109, 1476354309, 3, 1160735109, 1476354309, 3, 1160735109, 1476354309, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "409a7644977407c4ac14cb1e8d4f3a457c30d761": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 921768979, 1552922779, 3, 921768979, 1552922779, 3, 921768979, 1552922779, 3, 921768979, 1552922779, 3, 921768979, 1552922779, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "4232b616fa04fdfe5d4b7ac3fdf74c401d5a43af": [1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 0, 0, 0, 0, 0, 0, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455, 1, 1162927878, 1893440455],
+    "439c369fb09e304dc6ce5fad10abe503a5faa914": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1064938458, 2137940058, 1, 1064938458, 2137940058, 1, 1064938458, 2137940058, 1, 1064938458, 2137940058, 1, 1064938458, 2137940058, 1, 1064938458, 2137940058, 1, 1064938458, 2137940058, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "446a95675579114f": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1124316000, 1439848800, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "449e48f5cc6d48d4a04b7ffe59242f8397999a86": [3, 1454589153, 1893432487, 1, 1454589153, 1893432487, 1, 1454589153, 1893432487, 0, 0, 0, 0, 0, 0, 1, 1454589153, 1893432487, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1454589153, 1893432487, 1, 1454589153, 1893432487, 1, 1454589153, 1893432487, 1, 1454589153, 1893432487, 1, 1454589153, 1893432487, 1, 1454589153, 1893432487],
+    "45d9a5816e3d884d8d71d246c16e451ef3c4809d": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1308908708, 1940143508, 1, 1308908708, 1940143508, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "45eba2aff492cb82312d518ba7a7219df36dc80f": [1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 0, 0, 0, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 0, 0, 0, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200],
+    "4777c3148b62390cc96fe1504dd01058dc95886d": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1401062400, 2147126400, 1, 1401062400, 2147126400, 1, 1401062400, 2147126400, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "47b8cdffe56feef8b2ec2f4e0ef925b08e3c6bc3": [1, 1288081738, 2234852938, 1, 1288081738, 2234852938, 1, 1288081738, 2234852938, 1, 1288081738, 2234852938, 1, 1288081738, 2234852938, 1, 1288081738, 2234852938, 1, 1288081738, 2234852938, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1288081738, 2234852938, 1, 1288081738, 2234852938, 1, 1288081738, 2234852938, 1, 1288081738, 2234852938, 1, 1288081738, 2234852938, 1, 1288081738, 2234852938, 1, 1288081738, 2234852938, 1, 1288081738, 2234852938, 1, 1288081738, 2234852938],
+    "488714ace3c39e90603ad7ca89eed3ad8cb45066": [1, 1494323314, 2283242313, 1, 1494323314, 2283242313, 1, 1494323314, 2283242313, 1, 1494323314, 2283242313, 1, 1494323314, 2283242313, 1, 1494323314, 2283242313, 1, 1494323314, 2283242313, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1494323314, 2283242313, 1, 1494323314, 2283242313, 1, 1494323314, 2283242313, 1, 1494323314, 2283242313, 1, 1494323314, 2283242313],
+    "48e668f92bd2b295d747d82320104f3398909fd4": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 903804111, 1534956111, 3, 903804111, 1534956111, 3, 903804111, 1534956111, 3, 903804111, 1534956111, 3, 903804111, 1534956111, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "4a78325211db5916365edfc11436406a477c4ca1": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 929937600, 1592712000, 3, 929937600, 1592712000, 3, 929937600, 1592712000, 3, 929937600, 1592712000, 3, 929937600, 1592712000, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "4aa0aa5884d35e3c": [0, 0, 0, 0, 0, 0, 3, 986542180, 1617694180, 0, 0, 0, 0, 0, 0, 3, 986542180, 1617694180, 0, 0, 0, 0, 0, 0, 3, 986542180, 1617694180, 3, 986542180, 1617694180, 3, 986542180, 1617694180, 3, 986542180, 1617694180, 3, 986542180, 1617694180, 3, 986542180, 1617694180, 3, 986542180, 1617694180, 3, 986542180, 1617694180, 3, 986542180, 1617694180, 3, 986542180, 1617694180, 3, 986542180, 1617694180, 3, 986542180, 1617694180, 3, 986542180, 1617694180],
+    "4bc5b4406bad1cb3a51c656e46368987050c0eb6": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1262307601, 2208988741, 1, 1262307601, 2208988741, 1, 1262307601, 2208988741, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "4d262022894bd3d5a40aa16fdee21281c5f13c2e": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1308904694, 1940139494, 1, 1308904694, 1940139494, 1, 1308904694, 1940139494, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "4d45c16838bb73a969a120e7edf522a12314d79e": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1022565600, 2137846080, 1, 1022565600, 2137846080, 1, 1022565600, 2137846080, 1, 1022565600, 2137846080, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "4e0bef1aa4405ba517698730ca346843d041aef2": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1158522396, 2105293596, 1, 1158522396, 2105293596, 1, 1158522396, 2105293596, 1, 1158522396, 2105293596, 1, 1158522396, 2105293596, 1, 1158522396, 2105293596, 1, 1158522396, 2105293596, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "4e2254201895e6e36ee60ffafab912ed06178f39": [1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600],
+    "4e43c81d76ef37537a4ff2586f94f338e2d5bddf": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1162944000, 1478563199, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "509e0beaaf5eb92048a6506acbfdd8207aa78276": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 930140085, 1561292085, 3, 930140085, 1561292085, 3, 930140085, 1561292085, 3, 930140085, 1561292085, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "50afcc078715476f38c5b465d1de95aae9df9ccc": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1161765360, 2108536560, 1, 1161765360, 2108536560, 1, 1161765360, 2108536560, 1, 1161765360, 2108536560, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "51331ced3640af17d325cd6968f2af4e233eb341": [1, 1610668800, 2399587199, 1, 1610668800, 2399587199, 0, 0, 0, 1, 1610668800, 2399587199, 1, 1610668800, 2399587199, 0, 0, 0, 1, 1610668800, 2399587199, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "52d8883ac89f7866ed89f37b387094c9020236d0": [1, 1316690522, 1916306522, 1, 1316690522, 1916306522, 1, 1316690522, 1916306522, 1, 1316690522, 1916306522, 1, 1316690522, 1916306522, 1, 1316690522, 1916306522, 1, 1316690522, 1916306522, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1316690522, 1916306522, 1, 1316690522, 1916306522, 1, 1316690522, 1916306522, 1, 1316690522, 1916306522, 1, 1316690522, 1916306522, 1, 1316690522, 1916306522, 1, 1316690522, 1916306522, 1, 1316690522, 1916306522],
+    "5332d1b3cf7ffae0f1a05d854e92d29e451db44f": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 930250641, 1561403190, 3, 930250641, 1561403190, 3, 930250641, 1561403190, 3, 930250641, 1561403190, 3, 930250641, 1561403190, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "5379bf5aaa2b4acf5480e1d89bc09df2b20366cb": [1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999, 1, 1264982400, 2147471999],
+    "545acb263f71cc94460d9653ea6b48d093fe4275": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1197471600, 1513090800, 3, 1197471600, 1513090800, 3, 1197471600, 1513090800, 3, 1197471600, 1513090800, 3, 1197471600, 1513090800, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "54627063f1758443588ed11620b1c6ac1abcf689": [1, 1533021845, 2321940245, 1, 1533021845, 2321940245, 0, 0, 0, 1, 1533021845, 2321940245, 1, 1533021845, 2321940245, 0, 0, 0, 1, 1533021845, 2321940245, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "54adfac79257aeca359c2e12fbe4ba5d20dc9457": [0, 0, 0, 0, 0, 0, 1, 1384428522, 1857769200, 0, 0, 0, 0, 0, 0, 1, 1384428522, 1857769200, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1384428522, 1857769200, 1, 1384428522, 1857769200, 1, 1384428522, 1857769200, 1, 1384428522, 1857769200, 1, 1384428522, 1857769200, 1, 1384428522, 1857769200, 1, 1384428522, 1857769200, 1, 1384428522, 1857769200],
+    "54b07bad45b8e2407ffb0a6efbbe33c93ca384d5": [1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 0, 0, 0, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647, 1, 1352764800, 2147483647],
+    "55a98489d2c132bd18cb6ca6074ec8e79dbe8290": [1, 1503517003, 2292435403, 1, 1503517003, 2292435403, 1, 1503517003, 2292435403, 1, 1503517003, 2292435403, 1, 1503517003, 2292435403, 0, 0, 0, 1, 1503517003, 2292435403, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1503517003, 2292435403, 1, 1503517003, 2292435403, 1, 1503517003, 2292435403],
+    "55e481d11180bed889b908a331f9a1240916b970": [1, 946057851, 1879596912, 1, 946057851, 1879596912, 1, 946057851, 1879596912, 1, 946057851, 1879596912, 0, 0, 0, 1, 946057851, 1879596912, 1, 946057851, 1879596912, 0, 0, 0, 3, 946057851, 1577211651, 1, 946057851, 1879596912, 1, 946057851, 1879596912, 1, 946057851, 1879596912, 1, 946057851, 1879596912, 1, 946057851, 1879596912, 1, 946057851, 1879596912, 1, 946057851, 1879596912, 1, 946057851, 1879596912, 1, 946057851, 1879596912, 1, 946057851, 1879596912, 1, 946057851, 1879596912, 1, 946057851, 1879596912],
+    "5699071ed3ac0c6964b40c5047de432cbe20c0fb": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1367309221, 1682669221, 1, 1367309221, 1682669221, 1, 1367309221, 1682669221, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "56e7e15b254380e0f68ce171bc8ee5802fc448e2": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1252484127, 1893455999, 1, 1252484127, 1893455999, 1, 1252484127, 1893455999, 1, 1252484127, 1893455999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "5b257b96a465517eb839f3c078665ee83ae7f0ee": [1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 0, 0, 0, 0, 0, 0, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235, 1, 1161765035, 2108536235],
+    "5bca5ee5ded281aacda82d6451b6d9729b97e64f": [1, 1455300923, 2244305723, 1, 1455300923, 2244305723, 1, 1455300923, 2244305723, 1, 1455300923, 2244305723, 1, 1455300923, 2244305723, 1, 1455300923, 2244305723, 1, 1455300923, 2244305723, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1455300923, 2244305723, 1, 1455300923, 2244305723, 1, 1455300923, 2244305723, 1, 1455300923, 2244305723, 1, 1455300923, 2244305723, 1, 1455300923, 2244305723],
+    "5bf84d4fb2a586d43ad2f1639aa0be09f657b7de": [1, 1239166607, 1870318607, 1, 1239166607, 1870318607, 1, 1239166607, 1870318607, 1, 1239166607, 1870318607, 0, 0, 0, 1, 1239166607, 1870318607, 1, 1239166607, 1870318607, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1239166607, 1870318607, 1, 1239166607, 1870318607, 1, 1239166607, 1870318607, 1, 1239166607, 1870318607, 1, 1239166607, 1870318607, 1, 1239166607, 1870318607, 1, 1239166607, 1870318607, 1, 1239166607, 1870318607, 1, 1239166607, 1870318607, 1, 1239166607, 1870318607, 1, 1239166607, 1870318607],
+    "607b661a450d97ca89502f7d04cd34a8fffcfd4b": [1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 0, 0, 0, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600, 1, 904651200, 1832673600],
+    "60b585ec56647e121927671d50154b73ae3bf912": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1044952770, 2117956170, 1, 1044952770, 2117956170, 1, 1044952770, 2117956170, 1, 1044952770, 2117956170, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "64147cfc587216a60a2934156f2acbbcfcafa8ab": [1, 1466057836, 2147408236, 1, 1466057836, 2147408236, 0, 0, 0, 1, 1466057836, 2147408236, 0, 0, 0, 0, 0, 0, 1, 1466057836, 2147408236, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "653fc78a86c63cdd3c545c35f83aed520c4757c8": [1, 1385367955, 2329374355, 1, 1385367955, 2329374355, 1, 1385367955, 2329374355, 1, 1385367955, 2329374355, 0, 0, 0, 1, 1385367955, 2329374355, 1, 1385367955, 2329374355, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1385367955, 2329374355, 1, 1385367955, 2329374355, 1, 1385367955, 2329374355, 1, 1385367955, 2329374355, 1, 1385367955, 2329374355, 1, 1385367955, 2329374355],
+    "65cdebab351e003e7ed574c01cb473470e1a642f": [1, 1242808695, 1924936695, 1, 1411485727, 2093613727, 1, 1242808695, 1924936695, 1, 1411485727, 2093613727, 1, 1411485727, 2093613727, 1, 1242808695, 1924936695, 1, 1411485727, 2093613727, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1242808695, 1924936695, 1, 1242808695, 1924936695, 1, 1242808695, 1924936695, 1, 1242808695, 1924936695, 1, 1242808695, 1924936695, 1, 1242808695, 1924936695, 1, 1242808695, 1924936695, 1, 1242808695, 1924936695, 1, 1242808695, 1924936695, 1, 1242808695, 1924936695, 1, 1242808695, 1924936695],
+    "65f231ad2af7f7dd52960ac702c10eefa6d53b11": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1176707354, 1807859354, 1, 1176707354, 1807859354, 1, 1176707354, 1807859354, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "6890e467a4a65380c78666a4f1f74b43fb84bd6d": [1, 1164659022, 1795812822, 1, 1164659022, 1795812822, 1, 1164659022, 1795812822, 1, 1164659022, 1795812822, 0, 0, 0, 1, 1164659022, 1795812822, 1, 1164659022, 1795812822, 0, 0, 0, 3, 1168024839, 1483645839, 1, 1164659022, 1795812822, 1, 1164659022, 1795812822, 1, 1164659022, 1795812822, 1, 1164659022, 1795812822, 1, 1164659022, 1795812822, 1, 1164659022, 1795812822, 1, 1164659022, 1795812822, 1, 1164659022, 1795812822, 1, 1164659022, 1795812822, 1, 1164659022, 1795812822, 1, 1164659022, 1795812822, 1, 1164659022, 1795812822],
+    "6a385b268dde8b5af24f7a54831918e30835a6ba": [1, 1219908273, 1924963199, 1, 1219908273, 1924963199, 1, 1219908273, 1924963199, 1, 1219908273, 1924963199, 1, 1219908273, 1924963199, 1, 1219908273, 1924963199, 1, 1219908273, 1924963199, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1219908273, 1924963199, 1, 1219908273, 1924963199, 1, 1219908273, 1924963199, 1, 1219908273, 1924963199, 1, 1219908273, 1924963199, 1, 1219908273, 1924963199, 1, 1219908273, 1924963199, 1, 1219908273, 1924963199, 1, 1219908273, 1924963199, 1, 1219908273, 1924963199],
+    "6a39fa4222f7e689004d5e7d3383cbb86e7786af": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1401062400, 2147126400, 1, 1401062400, 2147126400, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "6a72267ad01eef7de73b6951d46c8d9f901266ab": [1, 1246987554, 1922896554, 1, 1246987554, 1922896554, 1, 1246987554, 1922896554, 1, 1246987554, 1922896554, 0, 0, 0, 1, 1246987554, 1922896554, 1, 1246987554, 1922896554, 0, 0, 0, 0, 0, 0, 1, 1246987554, 1922896554, 1, 1246987554, 1922896554, 1, 1246987554, 1922896554, 1, 1246987554, 1922896554, 1, 1246987554, 1922896554, 1, 1246987554, 1922896554, 1, 1246987554, 1922896554, 1, 1246987554, 1922896554, 1, 1246987554, 1922896554, 1, 1246987554, 1922896554, 1, 1246987554, 1922896554, 1, 1246987554, 1922896554],
+    "6a797e91694618130a0277a5595b6098250ea2f8": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 913313423, 1544467223, 3, 913313423, 1544467223, 3, 913313423, 1544467223, 3, 913313423, 1544467223, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "6c6401c7fd856dacc8da9e50088508b53c56a850": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 986488397, 1617642197, 3, 986488397, 1617642197, 3, 986488397, 1617642197, 3, 986488397, 1617642197, 3, 986488397, 1617642197, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "711567c8c8c9bd755d72d038186a9df37124540b": [1, 1436263881, 2224663881, 1, 1436263881, 2224663881, 1, 1436263881, 2224663881, 1, 1436263881, 2224663881, 0, 0, 0, 1, 1436263881, 2224663881, 1, 1436263881, 2224663881, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1436263881, 2224663881, 1, 1436263881, 2224663881, 1, 1436263881, 2224663881, 1, 1436263881, 2224663881, 1, 1436263881, 2224663881, 1, 1436263881, 2224663881, 1, 1436263881, 2224663881],
+    "713836f2023153472b6eba6546a9101558200509": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1078376400, 1551675600, 3, 1078376400, 1551675600, 3, 1078376400, 1551675600, 3, 1078376400, 1551675600, 3, 1078376400, 1551675600, 3, 1078376400, 1551675600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "72ace43379aa4587f6fdac1d9ed6c72f86d82439": [1, 1543492554, 2332410954, 1, 1543492554, 2332410954, 0, 0, 0, 1, 1543492554, 2332410954, 1, 1543492554, 2332410954, 0, 0, 0, 1, 1543492554, 2332410954, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "739110abff55b35a7c0925d5b2ba08a06bab1f6d": [1, 1581414300, 2054799899, 1, 1581414300, 2054799899, 0, 0, 0, 1, 1581414300, 2054799899, 0, 0, 0, 0, 0, 0, 1, 1581414300, 2054799899, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "7571a7194819bc9d9dea4147df94c4487799d379": [1, 1204761600, 2147471999, 1, 1204761600, 2147471999, 1, 1204761600, 2147471999, 1, 1204761600, 2147471999, 0, 0, 0, 1, 1204761600, 2147471999, 1, 1204761600, 2147471999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1204761600, 2147471999, 1, 1204761600, 2147471999, 1, 1204761600, 2147471999, 1, 1204761600, 2147471999, 1, 1204761600, 2147471999, 1, 1204761600, 2147471999, 1, 1204761600, 2147471999, 1, 1204761600, 2147471999, 1, 1204761600, 2147471999, 1, 1204761600, 2147471999, 1, 1204761600, 2147471999],
+    "76f355e1faa436fbf09f5c6271ed3cf44738102b": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1078376400, 1867294800, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1078376400, 1867294800, 1, 1078376400, 1867294800, 3, 1078376400, 1867294800, 1, 1078376400, 1867294800, 1, 1078376400, 1867294800, 1, 1078376400, 1867294800, 1, 1078376400, 1867294800, 1, 1078376400, 1867294800, 1, 1078376400, 1867294800, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "79b459e67bb6e5e40173800888c81a58f6e99b6e": [1, 1433415878, 2064567878, 1, 1433415878, 2064567878, 1, 1433415878, 2064567878, 1, 1433415878, 2064567878, 0, 0, 0, 1, 1433415878, 2064567878, 1, 1433415878, 2064567878, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1433415878, 2064567878, 1, 1433415878, 2064567878, 1, 1433415878, 2064567878, 1, 1433415878, 2064567878, 1, 1433415878, 2064567878, 1, 1433415878, 2064567878, 1, 1433415878, 2064567878],
+    "7b35d340d21c781966ef741028dc3e4fb27804fc": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 994436567, 1625152967, 3, 994436567, 1625152967, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "7b5b45cfafcecb7afd31921a6ab6f346eb574850": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1163721600, 2099865599, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1163721600, 2099865599, 1, 1163721600, 2099865599, 1, 1163721600, 2099865599, 1, 1163721600, 2099865599, 1, 1163721600, 2099865599, 1, 1163721600, 2099865599, 1, 1163721600, 2099865599, 1, 1163721600, 2099865599, 1, 1163721600, 2099865599, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "7c0c321fa7d9307fc47d68a362a8a1ceab075b27": [1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 0, 0, 0, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 0, 0, 0, 0, 0, 0, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799],
+    "7c4296aede4b483bfa92f89e8ccf6d8ba9723795": [1, 1599177600, 2231510400, 1, 1599177600, 2231510400, 0, 0, 0, 1, 1599177600, 2231510400, 0, 0, 0, 0, 0, 0, 1, 1599177600, 2231510400, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "7c5d028413d4cc8a9b81ce171c2e291e9c486342": [1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 0, 0, 0, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000],
+    "7c724b39c7c0db62a54f9baa183492a2ca838259": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1283238685, 1914390685, 1, 1283238685, 1914390685, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "7f100116373aa428e450f8a4f7ec6b32b6fee98b": [1, 1581415200, 2054800799, 1, 1581415200, 2054800799, 0, 0, 0, 1, 1581415200, 2054800799, 1, 1581415200, 2054800799, 0, 0, 0, 1, 1581415200, 2054800799, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "7fd365a7c2ddecbbf03009f34339fa02af333133": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1162944000, 2099865599, 0, 0, 0, 0, 0, 0, 1, 1162944000, 2099865599, 1, 1162944000, 2099865599, 1, 1162944000, 2099865599, 1, 1162944000, 2099865599, 1, 1162944000, 2099865599, 1, 1162944000, 2099865599, 1, 1162944000, 2099865599, 1, 1162944000, 2099865599, 1, 1162944000, 2099865599, 1, 1162944000, 2099865599, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "804cd6eb74ff4936a3d5d8fcb53ec56af0941d8c": [1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 0, 0, 0, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600],
+    "813e37d892b01f779f5cb4ab73aae7f634602ffa": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 959683310, 1590835310, 3, 959683310, 1590835310, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "81c48cccf5e430ffa50c085f8c1567217401dfdf": [1, 1457654400, 2240524800, 1, 1457654400, 2240524800, 1, 1457654400, 2240524800, 1, 1457654400, 2240524800, 0, 0, 0, 1, 1457654400, 2240524800, 1, 1457654400, 2240524800, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1457654400, 2240524800, 1, 1457654400, 2240524800, 1, 1457654400, 2240524800, 1, 1457654400, 2240524800, 1, 1457654400, 2240524800],
+    "82212d66c6d7a0e015ebce4c0977c4609e546e03": [1, 1486373255, 2275291655, 1, 1486373255, 2275291655, 1, 1486373255, 2275291655, 1, 1486373255, 2275291655, 0, 0, 0, 1, 1486373255, 2275291655, 1, 1486373255, 2275291655, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1486373255, 2275291655, 1, 1486373255, 2275291655, 1, 1486373255, 2275291655],
+    "82d1857330e73504d38e0292fbe5a4d1c421e8cd": [1, 1455300843, 2244305643, 1, 1455300843, 2244305643, 1, 1455300843, 2244305643, 1, 1455300843, 2244305643, 1, 1455300843, 2244305643, 1, 1455300843, 2244305643, 1, 1455300843, 2244305643, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1455300843, 2244305643, 1, 1455300843, 2244305643, 1, 1455300843, 2244305643, 1, 1455300843, 2244305643, 1, 1455300843, 2244305643, 1, 1455300843, 2244305643],
+    "8418cc8534ecbc0c94942e08599cc7b2104e0a08": [1, 1432598400, 2147299200, 1, 1432598400, 2147299200, 1, 1432598400, 2147299200, 1, 1432598400, 2147299200, 0, 0, 0, 1, 1432598400, 2147299200, 1, 1432598400, 2147299200, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1432598400, 2147299200, 1, 1432598400, 2147299200, 1, 1432598400, 2147299200, 1, 1432598400, 2147299200, 1, 1432598400, 2147299200, 1, 1432598400, 2147299200, 1, 1432598400, 2147299200],
+    "861ce7fe2da54a8b08fe2811fabea366f860592f": [1, 1466054128, 2147404528, 1, 1466054128, 2147404528, 0, 0, 0, 1, 1466054128, 2147404528, 0, 0, 0, 0, 0, 0, 1, 1466054128, 2147404528, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "87111508d1aac1780cb1afcec6c990efbf3004c0": [1, 1503403626, 2292322026, 1, 1503403626, 2292322026, 1, 1503403626, 2292322026, 1, 1503403626, 2292322026, 1, 1503403626, 2292322026, 1, 1503403626, 2292322026, 1, 1503403626, 2292322026, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1503403626, 2292322026, 1, 1503403626, 2292322026, 1, 1503403626, 2292322026],
+    "8868bfe08e35c43b386b62f7283b8481c80cd74d": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1179335976, 1743445161, 1, 1179335976, 1743445161, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "890ab438931ae6abee9b9118f9f53c3e35d0d382": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1342688816, 2289373616, 1, 1342688816, 2289373616, 1, 1342688816, 2289373616, 1, 1342688816, 2289373616, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "8b4b6dedd329b90619ec3939a9f097846acbefdf": [0, 0, 0, 0, 0, 0, 3, 985026813, 1616006013, 0, 0, 0, 0, 0, 0, 3, 985026813, 1616006013, 0, 0, 0, 0, 0, 0, 3, 985026813, 1616006013, 3, 985026813, 1616006013, 3, 985026813, 1616006013, 3, 985026813, 1616006013, 3, 985026813, 1616006013, 3, 985026813, 1616006013, 3, 985026813, 1616006013, 3, 985026813, 1616006013, 3, 985026813, 1616006013, 3, 985026813, 1616006013, 3, 985026813, 1616006013, 3, 985026813, 1616006013, 3, 985026813, 1616006013],
+    "8cfb1c75bc02d39f4e2e48d9f96054aac4b34ffa": [1, 1521202213, 2310120613, 1, 1521202213, 2310120613, 0, 0, 0, 1, 1521202213, 2310120613, 1, 1521202213, 2310120613, 0, 0, 0, 1, 1521202213, 2310120613, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "8d06667424763af389f7bcd6bd477d2fbc105f4b": [1, 1522049094, 2310967494, 1, 1522049094, 2310967494, 0, 0, 0, 1, 1522049094, 2310967494, 0, 0, 0, 0, 0, 0, 1, 1522049094, 2310967494, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "8db249689d720825b9c027f5509356484671f98f": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1142991574, 1458610774, 3, 1142991574, 1458610774, 3, 1142991574, 1458610774, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "8f81f0daa6cd743cbe66f4156b46a4fe0628ccaa": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1100846391, 1416379191, 3, 1100846391, 1416379191, 3, 1100846391, 1416379191, 3, 1100846391, 1416379191, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "8ff04b7fa82e4524ae4d50fa639a8bdee2dd1bbc": [1, 1237370400, 1868522400, 1, 1237370400, 1868522400, 1, 1237370400, 1868522400, 1, 1237370400, 1868522400, 0, 0, 0, 1, 1237370400, 1868522400, 1, 1237370400, 1868522400, 0, 0, 0, 0, 0, 0, 1, 1237370400, 1868522400, 1, 1237370400, 1868522400, 1, 1237370400, 1868522400, 1, 1237370400, 1868522400, 1, 1237370400, 1868522400, 1, 1237370400, 1868522400, 1, 1237370400, 1868522400, 1, 1237370400, 1868522400, 1, 1237370400, 1868522400, 1, 1237370400, 1868522400, 1, 1237370400, 1868522400, 1, 1237370400, 1868522400],
+    "91683287151d89e2b5f1ac3628348d0b7c6288eb": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1206530297, 1585134190, 3, 1206530297, 1585134190, 3, 1206530297, 1585134190, 3, 1206530297, 1585134190, 3, 1206530297, 1585134190, 3, 1206530297, 1585134190, 3, 1206530297, 1585134190, 3, 1206530297, 1585134190, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "92a4752ca49ebe8144eb79fc8ac595a5eb107573": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1143042868, 1767221999, 1, 1143042868, 1767221999, 1, 1143042868, 1767221999, 1, 1143042868, 1767221999, 1, 1143042868, 1767221999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "95b1b4f094b6bdc7dad1110921bec1af49fd107b": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 959683111, 1590835111, 3, 959683111, 1590835111, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "974621572135da3655c7f3f13770e508f69329b6": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1401093950, 2147126400, 1, 1401093950, 2147126400, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "9839cdbed8b28cf7b2abe1ad24af7b7ca1db1fcf": [1, 1533022004, 2321940404, 1, 1533022004, 2321940404, 0, 0, 0, 1, 1533022004, 2321940404, 0, 0, 0, 0, 0, 0, 1, 1533022004, 2321940404, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "99e019670d62db76b3da3db85be8fd42d2310e87": [1, 1503516852, 2292435252, 1, 1503516852, 2292435252, 1, 1503516852, 2292435252, 1, 1503516852, 2292435252, 1, 1503516852, 2292435252, 0, 0, 0, 1, 1503516852, 2292435252, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1503516852, 2292435252, 1, 1503516852, 2292435252, 1, 1503516852, 2292435252],
+    "9aaf297ac011353526513000c36afe40d5aed63c": [1, 1264774824, 2240576424, 1, 1264774824, 2240576424, 1, 1264774824, 2240576424, 1, 1264774824, 2240576424, 1, 1264774824, 2240576424, 1, 1264774824, 2240576424, 1, 1264774824, 2240576424, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1264774824, 2240576424, 1, 1264774824, 2240576424, 1, 1264774824, 2240576424, 1, 1264774824, 2240576424, 1, 1264774824, 2240576424, 1, 1264774824, 2240576424, 1, 1264774824, 2240576424, 1, 1264774824, 2240576424, 1, 1264774824, 2240576424, 1, 1264774824, 2240576424],
+    "9ad8003000e76b7f8518ee8bb6ce8a0cf811e1bb": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1194220800, 2147471999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "9be20757671c1ec06a06de59b49a2ddfdc19862e": [0, 0, 0, 0, 0, 0, 3, 1166169600, 1639555200, 0, 0, 0, 0, 0, 0, 3, 1166169600, 1639555200, 0, 0, 0, 0, 0, 0, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200],
+    "9c5f00dfaa01d7302b3888a2b86d4a9cf2119183": [1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 0, 0, 0, 0, 0, 0, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799, 1, 1251763200, 2145916799],
+    "9c5fd06c63a35f93ca939808ad8c87a52c5cc137": [1, 1567591238, 2198311238, 1, 1567591238, 2198311238, 0, 0, 0, 1, 1567591238, 2198311238, 1, 1567591238, 2198311238, 0, 0, 0, 1, 1567591238, 2198311238, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "9d93c6538b5ecaaf3f9f1e0fe59995bc24f6948f": [1, 1264773966, 1924956366, 1, 1264773966, 1924956366, 1, 1264773966, 1924956366, 1, 1264773966, 1924956366, 0, 0, 0, 1, 1264773966, 1924956366, 1, 1264773966, 1924956366, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1264773966, 1924956366, 1, 1264773966, 1924956366, 1, 1264773966, 1924956366, 1, 1264773966, 1924956366, 1, 1264773966, 1924956366, 1, 1264773966, 1924956366, 1, 1264773966, 1924956366, 1, 1264773966, 1924956366, 1, 1264773966, 1924956366, 1, 1264773966, 1924956366],
+    "9dc067a60c22d926f545aba665521127d845ac63": [1, 1264774236, 2240575836, 1, 1264774236, 2240575836, 1, 1264774236, 2240575836, 1, 1264774236, 2240575836, 0, 0, 0, 1, 1264774236, 2240575836, 1, 1264774236, 2240575836, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1264774236, 2240575836, 1, 1264774236, 2240575836, 1, 1264774236, 2240575836, 1, 1264774236, 2240575836, 1, 1264774236, 2240575836, 1, 1264774236, 2240575836, 1, 1264774236, 2240575836, 1, 1264774236, 2240575836, 1, 1264774236, 2240575836, 1, 1264774236, 2240575836],
+    "9f38c45623c339e8a0716ce8544ce4e83ab1bf67": [1, 1432725076, 2145526876, 1, 1432725076, 2145526876, 1, 1432725076, 2145526876, 1, 1432725076, 2145526876, 0, 0, 0, 1, 1432725076, 2145526876, 1, 1432725076, 2145526876, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1432725076, 2145526876, 1, 1432725076, 2145526876, 1, 1432725076, 2145526876, 1, 1432725076, 2145526876],
+    "9fee44b394d5fa914f2ed9559a0456db2dc4dba5": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1167910368, 1483529568, 3, 1167910368, 1483529568, 3, 1167910368, 1483529568, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "a0110a233e96f107ece2af29ef82a57fd030a4b4": [1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 0, 0, 0, 0, 0, 0, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999],
+    "a073499968dc855b65e39b282f579fbd33bc0748": [1, 1064895649, 1696047649, 1, 1064895649, 1696047649, 1, 1064895649, 1696047649, 1, 1064895649, 1696047649, 0, 0, 0, 1, 1064895649, 1696047649, 1, 1064895649, 1696047649, 0, 0, 0, 1, 1064895649, 1696047649, 1, 1064895649, 1696047649, 1, 1064895649, 1696047649, 1, 1064895649, 1696047649, 1, 1064895649, 1696047649, 1, 1064895649, 1696047649, 1, 1064895649, 1696047649, 1, 1064895649, 1696047649, 1, 1064895649, 1696047649, 1, 1064895649, 1696047649, 1, 1064895649, 1696047649, 1, 1064895649, 1696047649, 1, 1064895649, 1696047649],
+    "a0c38b44aa37a545bf97805ad1f178a29be95d8d": [0, 0, 0, 1, 1041980400, 1925593199, 1, 1041980400, 1925593199, 0, 0, 0, 0, 0, 0, 1, 1041980400, 1925593199, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1041980400, 1925593199, 1, 1041980400, 1925593199, 1, 1041980400, 1925593199, 1, 1041980400, 1925593199, 1, 1041980400, 1925593199, 1, 1041980400, 1925593199, 1, 1041980400, 1925593199, 1, 1041980400, 1925593199],
+    "a1725f261b289843955d0737d585969d4bd2c345": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 931543842, 1562696362, 3, 931543842, 1562696362, 3, 931543842, 1562696362, 3, 931543842, 1562696362, 3, 931543842, 1562696362, 3, 931543842, 1562696362, 3, 931543842, 1562696362, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "a1e19e4525794d06d902179282d53089722514a0": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1230789600, 1546322400, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "a3052f186050c2890add2b214fff8e4ea8303136": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1039789763, 1602944962, 3, 1039789763, 1602944962, 3, 1039789763, 1602944962, 3, 1039789763, 1602944962, 3, 1039789763, 1602944962, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "a34106ac906dd14aeb75a54a1099b3b1a18b4af7": [1, 1503516910, 2292435310, 1, 1503516910, 2292435310, 1, 1503516910, 2292435310, 1, 1503516910, 2292435310, 0, 0, 0, 0, 0, 0, 1, 1503516910, 2292435310, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1503516910, 2292435310, 1, 1503516910, 2292435310, 1, 1503516910, 2292435310],
+    "a397d6f35ea210e1ab459f3c17643cee01709ccc": [1, 1326389264, 2273160464, 1, 1326389264, 2273160464, 1, 1326389264, 2273160464, 1, 1326389264, 2273160464, 0, 0, 0, 1, 1326389264, 2273160464, 1, 1326389264, 2273160464, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1326389264, 2273160464, 1, 1326389264, 2273160464, 1, 1326389264, 2273160464, 1, 1326389264, 2273160464, 1, 1326389264, 2273160464, 1, 1326389264, 2273160464, 1, 1326389264, 2273160464, 1, 1326389264, 2273160464],
+    "a69142fd13614a239e08a429e5d8130423ee4125": [0, 0, 0, 1, 1323179392, 1953899392, 1, 1323179392, 1953899392, 0, 0, 0, 0, 0, 0, 1, 1323179392, 1953899392, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1323179392, 1953899392, 1, 1323179392, 1953899392, 1, 1323179392, 1953899392, 1, 1323179392, 1953899392, 1, 1323179392, 1953899392, 1, 1323179392, 1953899392, 1, 1323179392, 1953899392, 1, 1323179392, 1953899392, 1, 1323179392, 1953899392],
+    "a6b3e12b2b49b6d773a1aa94f501e773654cac50": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1208535862, 1839255862, 1, 1208535862, 1839255862, 1, 1208535862, 1839255862, 1, 1208535862, 1839255862, 1, 1208535862, 1839255862, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "a7a506b12ca60960eed197e970aebc3b196cdb21": [1, 1310050710, 1924991999, 1, 1310050710, 1924991999, 1, 1310050710, 1924991999, 1, 1310050710, 1924991999, 1, 1310050710, 1924991999, 1, 1310050710, 1924991999, 1, 1310050710, 1924991999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1310050710, 1924991999, 1, 1310050710, 1924991999, 1, 1310050710, 1924991999, 1, 1310050710, 1924991999, 1, 1310050710, 1924991999, 1, 1310050710, 1924991999, 1, 1310050710, 1924991999, 1, 1310050710, 1924991999],
+    "a87debbc63a474137400ec96e0d334c12cbf6cf8": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1040117029, 1450257338, 3, 1040117029, 1450257338, 3, 1040117029, 1450257338, 3, 1040117029, 1450257338, 3, 1040117029, 1450257338, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "a8c1c09b91a843157c5d0627b42a51d8970b81b1": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1401062400, 2147126400, 1, 1401062400, 2147126400, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "aafdd55aa3f6878b3285fdd1325b804593f303b8": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1415408338, 2362179538, 1, 1415408338, 2362179538, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "abb6dbd7069e37ac3086079170c79cc419b178c0": [1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 0, 0, 0, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200],
+    "ad6caa94609cede4fffa3e0a742b6303f7b659bf": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1207094400, 2143324799, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "adbd987a34b426f7fac42654ef03bde024cb541a": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 959683718, 1590835718, 3, 959683718, 1590835718, 3, 959683718, 1590835718, 3, 959683718, 1590835718, 3, 959683718, 1590835718, 3, 959683718, 1590835718, 3, 959683718, 1590835718, 3, 959683718, 1590835718, 3, 959683718, 1590835718, 3, 959683718, 1590835718, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "ae6c05a39313e2a2e7e2d71cd6c7f07fc86753a0": [1, 1418169600, 2049321600, 1, 1418169600, 2049321600, 1, 1418169600, 2049321600, 1, 1418169600, 2049321600, 0, 0, 0, 1, 1418169600, 2049321600, 1, 1418169600, 2049321600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1418169600, 2049321600, 1, 1418169600, 2049321600, 1, 1418169600, 2049321600, 1, 1418169600, 2049321600, 1, 1418169600, 2049321600],
+    "af4404c2417e4883db4e3902ecec847ae6cec9a4": [1, 1162928548, 1893441126, 1, 1162928548, 1893441126, 1, 1162928548, 1893441126, 1, 1162928548, 1893441126, 0, 0, 0, 1, 1162928548, 1893441126, 1, 1162928548, 1893441126, 0, 0, 0, 0, 0, 0, 1, 1162928548, 1893441126, 1, 1162928548, 1893441126, 1, 1162928548, 1893441126, 1, 1162928548, 1893441126, 1, 1162928548, 1893441126, 1, 1162928548, 1893441126, 1, 1162928548, 1893441126, 1, 1162928548, 1893441126, 1, 1162928548, 1893441126, 1, 1162928548, 1893441126, 1, 1162928548, 1893441126, 1, 1162928548, 1893441126],
+    "b00cf04c30f405580248fd33e552af4b84e36652": [1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200],
+    "b13ec36903f8bf4701d498261a0802ef63642bc3": [1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 0, 0, 0, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 0, 0, 0, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200, 1, 1163116800, 1952035200],
+    "b2b4aee62df726d5aa752d764bc01b5321d048ef": [1, 1584522437, 2372922437, 1, 1584522437, 2372922437, 0, 0, 0, 1, 1584522437, 2372922437, 0, 0, 0, 0, 0, 0, 1, 1584522437, 2372922437, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "b3037eae36bcb079d1dc9426b611be21b2698694": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1134317024, 2144160591, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1134317024, 2144160591, 1, 1134317024, 2144160591, 1, 1134317024, 2144160591, 1, 1134317024, 2144160591, 1, 1134317024, 2144160591, 1, 1134317024, 2144160591, 1, 1134317024, 2144160591, 1, 1134317024, 2144160591, 1, 1134317024, 2144160591, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "b31691fdeea66ee4b52e498f87788180ece5b1b5": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1194220800, 2147471999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 1, 1194220800, 2147471999, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "b3db48a4f9a1c5d8ae3641cc1163696229bc4bc6": [1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 0, 0, 0, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600],
+    "b4220b829924010e9cbbe40efdbffb972093992a": [1, 1436265432, 2224665432, 1, 1436265432, 2224665432, 1, 1436265432, 2224665432, 1, 1436265432, 2224665432, 1, 1436265432, 2224665432, 1, 1436265432, 2224665432, 1, 1436265432, 2224665432, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1436265432, 2224665432, 1, 1436265432, 2224665432, 1, 1436265432, 2224665432, 1, 1436265432, 2224665432, 1, 1436265432, 2224665432, 1, 1436265432, 2224665432, 1, 1436265432, 2224665432],
+    "b503f7763b61826a12aa1853eb032194bffececa": [1, 1222856996, 2011823999, 1, 1222856996, 2011823999, 1, 1222856996, 2011823999, 1, 1222856996, 2011823999, 0, 0, 0, 1, 1222856996, 2011823999, 1, 1222856996, 2011823999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1222856996, 2011823999, 1, 1222856996, 2011823999, 1, 1222856996, 2011823999, 1, 1222856996, 2011823999, 1, 1222856996, 2011823999, 1, 1222856996, 2011823999, 1, 1222856996, 2011823999, 1, 1222856996, 2011823999, 1, 1222856996, 2011823999],
+    "b599f8afb094f5e320d60aadce4e56a42e6e42ed": [1, 1342689330, 2289374130, 1, 1342689330, 2289374130, 1, 1342689330, 2289374130, 1, 1342689330, 2289374130, 1, 1342689330, 2289374130, 1, 1342689330, 2289374130, 1, 1342689330, 2289374130, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1342689330, 2289374130, 1, 1342689330, 2289374130, 1, 1342689330, 2289374130, 1, 1342689330, 2289374130, 1, 1342689330, 2289374130, 1, 1342689330, 2289374130, 1, 1342689330, 2289374130, 1, 1342689330, 2289374130],
+    "b6087b0d7accac204c8656325ecfab6e852d7057": [0, 0, 0, 0, 0, 0, 3, 1166169600, 1639555200, 0, 0, 0, 0, 0, 0, 3, 1166169600, 1639555200, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200, 3, 1166169600, 1639555200],
+    "b677fa6948479f5312d5c2ea07327607d1970719": [0, 0, 0, 0, 0, 0, 1, 1207094400, 2143324799, 0, 0, 0, 0, 0, 0, 1, 1207094400, 2143324799, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799],
+    "b6a1543902c3a03f8e8abcfad4f81ca6d13a0efd": [1, 1317890396, 2422427996, 1, 1317890396, 2422427996, 1, 1317890396, 2422427996, 1, 1317890396, 2422427996, 1, 1317890396, 2422427996, 1, 1317890396, 2422427996, 1, 1317890396, 2422427996, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1317890396, 2422427996, 1, 1317890396, 2422427996, 1, 1317890396, 2422427996, 1, 1317890396, 2422427996, 1, 1317890396, 2422427996, 1, 1317890396, 2422427996, 1, 1317890396, 2422427996, 1, 1317890396, 2422427996],
+    "b763e71add8de908a65583a4e06a504165114249": [1, 1355844336, 2144764536, 1, 1355844336, 2144764536, 1, 1355844336, 2144764536, 1, 1355844336, 2144764536, 1, 1355844336, 2144764536, 1, 1355844336, 2144764536, 1, 1355844336, 2144764536, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1355844336, 2144764536, 1, 1355844336, 2144764536, 1, 1355844336, 2144764536, 1, 1355844336, 2144764536, 1, 1355844336, 2144764536, 1, 1355844336, 2144764536, 1, 1355844336, 2144764536, 1, 1355844336, 2144764536, 1, 1355844336, 2144764536],
+    "b909ca9c1edbd36c3a6baeed54f15b9306352e5e": [0, 0, 0, 0, 0, 0, 1, 1217593900, 2164192300, 0, 0, 0, 0, 0, 0, 1, 1217593900, 2164192300, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1217593900, 2164192300, 1, 1217593900, 2164192300, 1, 1217593900, 2164192300, 1, 1217593900, 2164192300, 1, 1217593900, 2164192300, 1, 1217593900, 2164192300, 1, 1217593900, 2164192300, 1, 1217593900, 2164192300, 1, 1217593900, 2164192300, 1, 1217593900, 2164192300, 1, 1217593900, 2164192300],
+    "bafa7125798b57412521860b71ebb2640e8b2167": [0, 0, 0, 0, 0, 0, 1, 1072181646, 1705837014, 0, 0, 0, 0, 0, 0, 1, 1072181646, 1705837014, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1072181646, 1705837014, 1, 1072181646, 1705837014, 1, 1072181646, 1705837014, 1, 1072181646, 1705837014, 1, 1072181646, 1705837014, 1, 1072181646, 1705837014, 1, 1072181646, 1705837014, 1, 1072181646, 1705837014],
+    "bbaf7e023dfaa6f13c848eadee3898ecd93232d4": [1, 1263859200, 2147471999, 1, 1263859200, 2147471999, 1, 1263859200, 2147471999, 1, 1263859200, 2147471999, 0, 0, 0, 1, 1263859200, 2147471999, 1, 1263859200, 2147471999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1263859200, 2147471999, 1, 1263859200, 2147471999, 1, 1263859200, 2147471999, 1, 1263859200, 2147471999, 1, 1263859200, 2147471999, 1, 1263859200, 2147471999, 1, 1263859200, 2147471999, 1, 1263859200, 2147471999],
+    "bbffca8e239f4f99cadbe268a6a51527171ed90e": [1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 0, 0, 0, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600],
+    "bd8887c98ff6a40a0baaebc5fe91239dab4a8a32": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1187955427, 1503315427, 3, 1187955427, 1503315427, 3, 1187955427, 1503315427, 3, 1187955427, 1503315427, 3, 1187955427, 1503315427, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "bea8a07472506b44b7c923d8fba8ffb3576b686c": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 929937600, 1592712000, 3, 929937600, 1592712000, 3, 929937600, 1592712000, 3, 929937600, 1592712000, 3, 929937600, 1592712000, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "bf5920360079a0a0226b8cd5f261d2b82ccb824a": [1, 1222857614, 2011823999, 1, 1222857614, 2011823999, 1, 1222857614, 2011823999, 1, 1222857614, 2011823999, 0, 0, 0, 1, 1222857614, 2011823999, 1, 1222857614, 2011823999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1222857614, 2011823999, 1, 1222857614, 2011823999, 1, 1222857614, 2011823999, 1, 1222857614, 2011823999, 1, 1222857614, 2011823999, 1, 1222857614, 2011823999, 1, 1222857614, 2011823999, 1, 1222857614, 2011823999],
+    "bf5fb7d1cedd1f86f45b55acdcd710c20ea988e7": [1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 0, 0, 0, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556, 1, 1088530756, 2035215556],
+    "bfb627d8035a76654c6101415631e58b7b3ad9cc": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1124870746, 1756022746, 1, 1124870746, 1756022746, 1, 1124870746, 1756022746, 1, 1124870746, 1756022746, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "c07a98688d89fbab05640c117daa7d65b8cacc4e": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1021953600, 1653105600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1021953600, 1653105600, 3, 1021953600, 1653105600, 3, 1021953600, 1653105600, 3, 1021953600, 1653105600, 3, 1021953600, 1653105600, 3, 1021953600, 1653105600, 3, 1021953600, 1653105600, 3, 1021953600, 1653105600, 3, 1021953600, 1653105600, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "c14bed70b6f73e7c003b008fc73e0e459f1e5dec": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1080128240, 1868367896, 1, 1080128240, 1868367896, 1, 1080128240, 1868367896, 1, 1080128240, 1868367896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "c151455059ab3ee72c5afa2022120780887c116a": [1, 1610668800, 2399587199, 1, 1610668800, 2399587199, 0, 0, 0, 1, 1610668800, 2399587199, 0, 0, 0, 0, 0, 0, 1, 1610668800, 2399587199, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "c1f126baa02dae8581cfd3f12a12bdb80a67fdbc": [1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600],
+    "c479ca8ea14e031d1cdc6bdb315b943e3f307f2d": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1207094400, 2143324799, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 1, 1207094400, 2143324799, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "c4a7b1a47b2c71fadbe14b9075ffc41560858910": [0, 0, 0, 0, 0, 0, 3, 970348339, 1633010475, 0, 0, 0, 0, 0, 0, 3, 970348339, 1633010475, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 970348339, 1633010475, 3, 970348339, 1633010475, 3, 970348339, 1633010475, 3, 970348339, 1633010475, 3, 970348339, 1633010475, 3, 970348339, 1633010475, 3, 970348339, 1633010475, 3, 970348339, 1633010475, 3, 970348339, 1633010475, 3, 970348339, 1633010475, 3, 970348339, 1633010475, 3, 970348339, 1633010475],
+    "c57b58bdedda2569d2f75916a8b332c07b275bf4": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1072915200, 1861919999, 1, 1072915200, 1861919999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "c617d0bca8ea0243f21b06995d2b9020b9d79ce4": [1, 1326399992, 2273171192, 1, 1326399992, 2273171192, 1, 1326399992, 2273171192, 1, 1326399992, 2273171192, 0, 0, 0, 1, 1326399992, 2273171192, 1, 1326399992, 2273171192, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1326399992, 2273171192, 1, 1326399992, 2273171192, 1, 1326399992, 2273171192, 1, 1326399992, 2273171192, 1, 1326399992, 2273171192, 1, 1326399992, 2273171192, 1, 1326399992, 2273171192, 1, 1326399992, 2273171192],
+    "c64fa23d066384099cce62e404ac8d5cb5e9b61b": [1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 0, 0, 0, 0, 0, 0, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639, 1, 1099329244, 2051242639],
+    "c7a04975166184db314b84d2f1374090ef4edcf7": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1112790524, 1491481724, 3, 1112790524, 1491481724, 3, 1112790524, 1491481724, 3, 1112790524, 1491481724, 3, 1112790524, 1491481724, 3, 1112790524, 1491481724, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "c8cb997270520cf8e6beb20457292acf4210ed35": [1, 1576710405, 2289338164, 1, 1576710405, 2289338164, 1, 1576710405, 2289338164, 1, 1576710405, 2289338164, 1, 1576710405, 2289338164, 1, 1576710405, 2289338164, 1, 1576710405, 2289338164, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1576710405, 2289338164, 1, 1576710405, 2289338164, 1, 1576710405, 2289338164],
+    "c91b538112fe04d516d1aabc9a6fb7a095196eca": [1, 1613732470, 2370596469, 1, 1613732470, 2370596469, 0, 0, 0, 1, 1613732470, 2370596469, 0, 0, 0, 0, 0, 0, 1, 1613732470, 2370596469, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "c98077e0629282f5469cf3baf74cc3deb8a3ad39": [1, 1288082283, 2234853483, 1, 1288082283, 2234853483, 1, 1288082283, 2234853483, 1, 1288082283, 2234853483, 0, 0, 0, 1, 1288082283, 2234853483, 1, 1288082283, 2234853483, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1288082283, 2234853483, 1, 1288082283, 2234853483, 1, 1288082283, 2234853483, 1, 1288082283, 2234853483, 1, 1288082283, 2234853483, 1, 1288082283, 2234853483, 1, 1288082283, 2234853483, 1, 1288082283, 2234853483, 1, 1288082283, 2234853483],
+    "cb0fc6df4243cc3dcbb54823a11a7aa62abb3468": [1, 1245151818, 1893324618, 1, 1245151818, 1893324618, 1, 1245151818, 1893324618, 1, 1245151818, 1893324618, 1, 1245151818, 1893324618, 1, 1245151818, 1893324618, 1, 1245151818, 1893324618, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1245151818, 1893324618, 1, 1245151818, 1893324618, 1, 1245151818, 1893324618, 1, 1245151818, 1893324618, 1, 1245151818, 1893324618, 1, 1245151818, 1893324618, 1, 1245151818, 1893324618, 1, 1245151818, 1893324618, 1, 1245151818, 1893324618, 1, 1245151818, 1893324618, 1, 1245151818, 1893324618],
+    "cbd0bda9e1980551a14d37a28379ce8d1d2ae484": [1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 0, 0, 0, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600],
+    "ccccefcc2960a43bb192b63cfa32628fac25153b": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1039094613, 1985865813, 0, 0, 0, 0, 0, 0, 1, 1039094613, 1985865813, 1, 1039094613, 1985865813, 1, 1039094613, 1985865813, 1, 1039094613, 1985865813, 1, 1039094613, 1985865813, 1, 1039094613, 1985865813, 1, 1039094613, 1985865813, 1, 1039094613, 1985865813, 1, 1039094613, 1985865813, 1, 1039094613, 1985865813, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "ccfa6793f0b6b8d0a5c01ef353fd8c53df83d796": [1, 1229008101, 1859728101, 1, 1229008101, 1859728101, 1, 1229008101, 1859728101, 1, 1229008101, 1859728101, 0, 0, 0, 1, 1229008101, 1859728101, 1, 1229008101, 1859728101, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1229008101, 1859728101, 1, 1229008101, 1859728101, 1, 1229008101, 1859728101, 1, 1229008101, 1859728101, 1, 1229008101, 1859728101, 1, 1229008101, 1859728101, 1, 1229008101, 1859728101, 1, 1229008101, 1859728101, 1, 1229008101, 1859728101, 1, 1229008101, 1859728101, 1, 1229008101, 1859728101],
+    "cec34ab99955f2b8db60bfa97ebd56b59736a7d6": [1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600],
+    "d287b4e3df37279355f656ea81e536cc8c1e3fbd": [1, 1304588257, 1924940257, 1, 1304588257, 1924940257, 1, 1304588257, 1924940257, 1, 1304588257, 1924940257, 0, 0, 0, 1, 1304588257, 1924940257, 1, 1304588257, 1924940257, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1304588257, 1924940257, 1, 1304588257, 1924940257, 1, 1304588257, 1924940257, 1, 1304588257, 1924940257, 1, 1304588257, 1924940257, 1, 1304588257, 1924940257, 1, 1304588257, 1924940257, 1, 1304588257, 1924940257, 1, 1304588257, 1924940257],
+    "d29f88dfa1cd2cbdecf53b0101933327b2eb604b": [1, 1503046722, 2134252799, 1, 1503046722, 2134252799, 1, 1503046722, 2134252799, 1, 1503046722, 2134252799, 0, 0, 0, 0, 0, 0, 1, 1503046722, 2134252799, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1503046722, 2134252799, 1, 1503046722, 2134252799, 1, 1503046722, 2134252799],
+    "d2c4b0d291d44c1171b361cb3da1fedda86ad4e3": [1, 1088528780, 2035213580, 1, 1088528780, 2035213580, 1, 1088528780, 2035213580, 1, 1088528780, 2035213580, 0, 0, 0, 1, 1088528780, 2035213580, 1, 1088528780, 2035213580, 0, 0, 0, 1, 1088528780, 2035213580, 1, 1088528780, 2035213580, 1, 1088528780, 2035213580, 1, 1088528780, 2035213580, 1, 1088528780, 2035213580, 1, 1088528780, 2035213580, 1, 1088528780, 2035213580, 1, 1088528780, 2035213580, 1, 1088528780, 2035213580, 1, 1088528780, 2035213580, 1, 1088528780, 2035213580, 1, 1088528780, 2035213580, 1, 1088528780, 2035213580],
+    "d3948a4c62132a192eccaf728a7d36d79a1cdc67": [1, 1257411046, 1888563046, 1, 1257411046, 1888563046, 1, 1257411046, 1888563046, 1, 1257411046, 1888563046, 0, 0, 0, 1, 1257411046, 1888563046, 1, 1257411046, 1888563046, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1257411046, 1888563046, 1, 1257411046, 1888563046, 1, 1257411046, 1888563046, 1, 1257411046, 1888563046, 1, 1257411046, 1888563046, 1, 1257411046, 1888563046, 1, 1257411046, 1888563046, 1, 1257411046, 1888563046, 1, 1257411046, 1888563046],
+    "d3ecc73a656ecce1da769a56fb9cf3866d57e581": [1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200, 1, 1432598400, 2221603200],
+    "d4a2fc9fb3c3d803d3575c07a4d024a7c0f200d4": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1137076917, 1767221999, 1, 1137076917, 1767221999, 1, 1137076917, 1767221999, 1, 1137076917, 1767221999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "d937b34e05fdd9cf9f1216aeb6892feb253a881c": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1131358077, 1442398077, 3, 1131358077, 1442398077, 3, 1131358077, 1442398077, 3, 1131358077, 1442398077, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "d9743ae4303d0df712dc7e5a059f1e349af7e114": [1, 1426204800, 2177366400, 1, 1426204800, 2177366400, 1, 1426204800, 2177366400, 1, 1426204800, 2177366400, 1, 1426204800, 2177366400, 1, 1426204800, 2177366400, 1, 1426204800, 2177366400, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1426204800, 2177366400, 1, 1426204800, 2177366400, 1, 1426204800, 2177366400, 1, 1426204800, 2177366400, 1, 1426204800, 2177366400],
+    "d9fe21406e949ebc9b3d9c7d982019e58c3062b2": [3, 1454589143, 2051198799, 1, 1454589143, 2051198799, 1, 1454589143, 2051198799, 0, 0, 0, 0, 0, 0, 1, 1454589143, 2051198799, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1454589143, 2051198799, 1, 1454589143, 2051198799, 1, 1454589143, 2051198799, 1, 1454589143, 2051198799, 1, 1454589143, 2051198799, 1, 1454589143, 2051198799],
+    "da836302798eda4cc63c2314d88fc320ab286059": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1401062400, 2147126400, 1, 1401062400, 2147126400, 1, 1401062400, 2147126400, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "dabb2eaab00cb8882651745c6d03d3c0d88f7ad6": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1078376400, 1867294800, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1078376400, 1867294800, 1, 1078376400, 1867294800, 1, 1078376400, 1867294800, 1, 1078376400, 1867294800, 1, 1078376400, 1867294800, 1, 1078376400, 1867294800, 1, 1078376400, 1867294800, 1, 1078376400, 1867294800, 1, 1078376400, 1867294800, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "dc2e1fd1613779e4abd5d5b31271683d6a689c22": [1, 1581292800, 2222899200, 1, 1581292800, 2222899200, 0, 0, 0, 1, 1581292800, 2222899200, 0, 0, 0, 0, 0, 0, 1, 1581292800, 2222899200, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "dd040907a2f57a7d5253129295ee3880250da659": [1, 1455298779, 2244303579, 1, 1455298779, 2244303579, 1, 1455298779, 2244303579, 1, 1455298779, 2244303579, 0, 0, 0, 1, 1455298779, 2244303579, 1, 1455298779, 2244303579, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1455298779, 2244303579, 1, 1455298779, 2244303579, 1, 1455298779, 2244303579, 1, 1455298779, 2244303579, 1, 1455298779, 2244303579, 1, 1455298779, 2244303579],
+    "dd551713f6ace84821caefb5afd10032ed9e8cb5": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1387357450, 1702717450, 1, 1387357450, 1702717450, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "e04dbfdc9b415d13e864f0a7e915a4e181c1ba31": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1249693201, 2196378001, 1, 1249693201, 2196378001, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "e08c9bdb2549b3f17c86d6b242870bd06ba0d9e4": [1, 1152033604, 1940952004, 1, 1152033604, 1940952004, 1, 1152033604, 1940952004, 1, 1152033604, 1940952004, 1, 1152033604, 1940952004, 1, 1152033604, 1940952004, 1, 1152033604, 1940952004, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1152033604, 1940952004, 1, 1152033604, 1940952004, 1, 1152033604, 1940952004, 1, 1152033604, 1940952004, 1, 1152033604, 1940952004, 1, 1152033604, 1940952004, 1, 1152033604, 1940952004, 1, 1152033604, 1940952004, 1, 1152033604, 1940952004, 1, 1152033604, 1940952004, 1, 1152033604, 1940952004],
+    "e0aa3f258d9f445cc13ae82eae774c843e670cf4": [1, 1617235200, 2406153600, 1, 1617235200, 2406153600, 0, 0, 0, 1, 1617235200, 2406153600, 0, 0, 0, 0, 0, 0, 1, 1617235200, 2406153600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "e166cf0ed1f1b34bb7062014fe8712d5f6fefb3e": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1249693201, 2196378001, 1, 1249693201, 2196378001, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "e2c9409f4dcee89aa17ccf0e3f65c529886a1951": [1, 1416978795, 2240582399, 1, 1416978795, 2240582399, 1, 1416978795, 2240582399, 1, 1416978795, 2240582399, 1, 1416978795, 2240582399, 1, 1416978795, 2240582399, 1, 1416978795, 2240582399, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1416978795, 2240582399, 1, 1416978795, 2240582399, 1, 1416978795, 2240582399, 1, 1416978795, 2240582399, 1, 1416978795, 2240582399, 1, 1416978795, 2240582399],
+    "e371e09ed8a742d9db71916b9493ebc3a3d114a3": [1, 1389894812, 2021046812, 1, 1389894812, 2021046812, 1, 1389894812, 2021046812, 1, 1389894812, 2021046812, 1, 1389894812, 2021046812, 1, 1389894812, 2021046812, 1, 1389894812, 2021046812, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1389894812, 2021046812, 1, 1389894812, 2021046812, 1, 1389894812, 2021046812, 1, 1389894812, 2021046812, 1, 1389894812, 2021046812, 1, 1389894812, 2021046812, 1, 1389894812, 2021046812, 1, 1389894812, 2021046812],
+    "e3732ddfcb0e280cdeddb3a4ca79b88ebbe83089": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 931367100, 1562457599, 3, 931367100, 1562457599, 3, 931367100, 1562457599, 3, 931367100, 1562457599, 3, 931367100, 1562457599, 3, 931367100, 1562457599, 3, 931367100, 1562457599, 3, 931367100, 1562457599, 3, 931367100, 1562457599, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "e394f5b14de9dba1295b578b4d760676e1d1a28a": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1064938423, 2137940024, 1, 1064938423, 2137940024, 1, 1064938423, 2137940024, 1, 1064938423, 2137940024, 1, 1064938423, 2137940024, 1, 1064938423, 2137940024, 1, 1064938423, 2137940024, 1, 1064938423, 2137940024, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "e3ab544c80a1db5643b7914acbf3827a135c08ab": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1137076723, 1767221999, 1, 1137076723, 1767221999, 1, 1137076723, 1767221999, 1, 1137076723, 1767221999, 1, 1137076723, 1767221999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "e3fe2dfd28d00bb5bab6a2c4bf06aa058c93fb2f": [1, 1344395221, 1893380821, 1, 1344395221, 1893380821, 1, 1344395221, 1893380821, 1, 1344395221, 1893380821, 0, 0, 0, 1, 1344395221, 1893380821, 1, 1344395221, 1893380821, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1344395221, 1893380821, 1, 1344395221, 1893380821, 1, 1344395221, 1893380821, 1, 1344395221, 1893380821, 1, 1344395221, 1893380821, 1, 1344395221, 1893380821, 1, 1344395221, 1893380821, 1, 1344395221, 1893380821],
+    "e4af2b26711a2b4827852f52662ceff08913713e": [1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600, 1, 1466553600, 2097705600],
+    "e59d5930824758ccacfa085436867b3ab5044df0": [1, 958157160, 1747094340, 1, 958157160, 1747094340, 1, 958157160, 1747094340, 1, 958157160, 1747094340, 1, 958157160, 1747094340, 1, 958157160, 1747094340, 1, 958157160, 1747094340, 0, 0, 0, 0, 0, 0, 1, 958157160, 1747094340, 1, 958157160, 1747094340, 1, 958157160, 1747094340, 1, 958157160, 1747094340, 1, 958157160, 1747094340, 1, 958157160, 1747094340, 1, 958157160, 1747094340, 1, 958157160, 1747094340, 1, 958157160, 1747094340, 1, 958157160, 1747094340, 1, 958157160, 1747094340, 1, 958157160, 1747094340],
+    "e7cec64ffc166796fa4aa307c104a7cb6adeda47": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1155774069, 1471134669, 3, 1155774069, 1471134669, 3, 1155774069, 1471134669, 3, 1155774069, 1471134669, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "ecd7e382d2715d644cdf2e673fe7ba98ae1c0f4f": [1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600, 1, 1375358400, 2147169600],
+    "ed4419c0d3f0068beea47bbe42e72654c88e3676": [1, 1389895943, 2021047943, 1, 1389895943, 2021047943, 1, 1389895943, 2021047943, 1, 1389895943, 2021047943, 0, 0, 0, 1, 1389895943, 2021047943, 1, 1389895943, 2021047943, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1389895943, 2021047943, 1, 1389895943, 2021047943, 1, 1389895943, 2021047943, 1, 1389895943, 2021047943, 1, 1389895943, 2021047943, 1, 1389895943, 2021047943, 1, 1389895943, 2021047943, 1, 1389895943, 2021047943],
+    "ede76f765abf60ec495bc6a577bb7216719bc43d": [1, 1326394772, 2273165972, 1, 1326394772, 2273165972, 1, 1326394772, 2273165972, 1, 1326394772, 2273165972, 1, 1326394772, 2273165972, 1, 1326394772, 2273165972, 1, 1326394772, 2273165972, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1326394772, 2273165972, 1, 1326394772, 2273165972, 1, 1326394772, 2273165972, 1, 1326394772, 2273165972, 1, 1326394772, 2273165972, 1, 1326394772, 2273165972, 1, 1326394772, 2273165972, 1, 1326394772, 2273165972],
+    "ee6b493c7a3f0de3b109b78ac8ab199f733350e7": [3, 1454589136, 1893432196, 1, 1454589136, 1893432196, 1, 1454589136, 1893432196, 0, 0, 0, 0, 0, 0, 1, 1454589136, 1893432196, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1454589136, 1893432196, 1, 1454589136, 1893432196, 1, 1454589136, 1893432196, 1, 1454589136, 1893432196, 1, 1454589136, 1893432196, 1, 1454589136, 1893432196],
+    "ef914cf5a5c330e82f08ead37122a492687874d9": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1382347038, 2013499038, 1, 1382347038, 2013499038, 1, 1382347038, 2013499038, 1, 1382347038, 2013499038, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "f0176213553db3ff0a006bfb508497f3ed62d01a": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 927648580, 1558802380, 3, 927648580, 1558802380, 3, 927648580, 1558802380, 3, 927648580, 1558802380, 3, 927648580, 1558802380, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "f08f593800b3f58f9a960cd5ebfa7baa17e81312": [1, 1192708850, 1981713650, 1, 1192708850, 1981713650, 1, 1192708850, 1981713650, 1, 1192708850, 1981713650, 0, 0, 0, 1, 1192708850, 1981713650, 1, 1192708850, 1981713650, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1192708850, 1981713650, 1, 1192708850, 1981713650, 1, 1192708850, 1981713650, 1, 1192708850, 1981713650, 1, 1192708850, 1981713650, 1, 1192708850, 1981713650, 1, 1192708850, 1981713650, 1, 1192708850, 1981713650],
+    "f27717fa5ea8fef63d71d568bac9460c38d8afb0": [1, 1550828764, 2145887999, 1, 1550828764, 2145887999, 0, 0, 0, 1, 1550828764, 2145887999, 1, 1550828764, 2145887999, 0, 0, 0, 1, 1550828764, 2145887999, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "f2c013e082433efbee2f673296355cdbb8cb02d0": [1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 0, 0, 0, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604, 1, 1164395483, 1953313604],
+    "f32818cb6475ee292aebedae23583885ebc82207": [1, 1617235200, 2406153600, 1, 1617235200, 2406153600, 0, 0, 0, 1, 1617235200, 2406153600, 1, 1617235200, 2406153600, 0, 0, 0, 1, 1617235200, 2406153600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "f5f296887d0df32af94ee734a0bd467e13d616c8": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1219688066, 1535222666, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "f77dc5fdc4e89a1b7764a7f51da0ccbf87609a6d": [1, 1225295996, 1893456000, 1, 1225295996, 1893456000, 1, 1225295996, 1893456000, 1, 1225295996, 1893456000, 1, 1225295996, 1893456000, 1, 1225295996, 1893456000, 1, 1225295996, 1893456000, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1225295996, 1893456000, 1, 1225295996, 1893456000, 1, 1225295996, 1893456000, 1, 1225295996, 1893456000, 1, 1225295996, 1893456000, 1, 1225295996, 1893456000, 1, 1225295996, 1893456000],
+    "f924ac0fb2b5f879c0fa60881bc4d94d029e1719": [0, 0, 0, 0, 0, 0, 1, 1217593790, 2164192190, 0, 0, 0, 0, 0, 0, 1, 1217593790, 2164192190, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1217593790, 2164192190, 1, 1217593790, 2164192190, 1, 1217593790, 2164192190, 1, 1217593790, 2164192190, 1, 1217593790, 2164192190, 1, 1217593790, 2164192190, 1, 1217593790, 2164192190, 1, 1217593790, 2164192190, 1, 1217593790, 2164192190, 1, 1217593790, 2164192190, 1, 1217593790, 2164192190],
+    "f960bbd4e3d534f6b8f5068025a773db4669a89e": [1, 1496254477, 2285086477, 1, 1496254477, 2285086477, 1, 1496254477, 2285086477, 1, 1496254477, 2285086477, 0, 0, 0, 1, 1496254477, 2285086477, 1, 1496254477, 2285086477, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1496254477, 2285086477, 1, 1496254477, 2285086477, 1, 1496254477, 2285086477, 1, 1496254477, 2285086477, 1, 1496254477, 2285086477, 1, 1496254477, 2285086477],
+    "fa60a9eb65c5dd1614084e0c0f8d9be0f764af67": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1415408338, 2362179538, 1, 1415408338, 2362179538, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "fa86c9dbe0bae978f54ba8d615dff0d3e16a143c": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 931546119, 1562698669, 3, 931546119, 1562698669, 3, 931546119, 1562698669, 3, 931546119, 1562698669, 3, 931546119, 1562698669, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "fb5a48d0802040f2a8e90007691977a7e6c3f4cf": [1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 0, 0, 0, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000],
+    "fbef0d869eb0e3dda9b9f121177f3efcf0772b1a": [1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000],
+    "fdda14c49f30de21bd1e4239fcab632349e0f184": [1, 1257410158, 1888562158, 1, 1257410158, 1888562158, 1, 1257410158, 1888562158, 1, 1257410158, 1888562158, 1, 1257410158, 1888562158, 1, 1257410158, 1888562158, 1, 1257410158, 1888562158, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1257410158, 1888562158, 1, 1257410158, 1888562158, 1, 1257410158, 1888562158, 1, 1257410158, 1888562158, 1, 1257410158, 1888562158, 1, 1257410158, 1888562158, 1, 1257410158, 1888562158, 1, 1257410158, 1888562158, 1, 1257410158, 1888562158],
+    "fea1e0701e2a0339525a42be5c91857a18aa4db5": [1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000, 1, 1518978600, 2307897000],
+    "feab0090989e24fca9cc1a8afb27b8bf306ea83b": [0, 0, 0, 3, 1291807169, 1670497828, 3, 1291807169, 1670497828, 0, 0, 0, 0, 0, 0, 3, 1291807169, 1670497828, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1291807169, 1670497828, 3, 1291807169, 1670497828, 3, 1291807169, 1670497828, 3, 1291807169, 1670497828, 3, 1291807169, 1670497828, 3, 1291807169, 1670497828, 3, 1291807169, 1670497828, 3, 1291807169, 1670497828],
+    "ff182876f948052ca1aef12b1b2bb253f84b7cb3": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1425561717, 2056713717, 1, 1425561717, 2056713717, 1, 1425561717, 2056713717, 1, 1425561717, 2056713717, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    "ff8231723ef9c4666cad389ed1b05188a590ccf5": [1, 1584524818, 2372924818, 1, 1584524818, 2372924818, 0, 0, 0, 1, 1584524818, 2372924818, 1, 1584524818, 2372924818, 0, 0, 0, 1, 1584524818, 2372924818, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+}
+METADATA = {
+    "00add9a3f679f66e74a97f333d8117d74ccf33de": ["America Online Root Certification Authority 1", "3921c115c15d0eca5ccb5bc4f07d21d8050b566a", 2142276180],
+    "01b92fefbf118660f24fd0416eab731fe7d26e49": ["AC RAIZ FNMT-RCM SERVIDORES SEGUROS", "62ffd99ec0650d03ce7593d2ed3f2d32c9e3e54a", 2334217053],
+    "03252fde6f82013a5c2cdc2ba169b567d48cd3fd": ["Swisscom Root CA 1", "5f3afc0a8b64f686673474df7ea9a2fef9fa7a51", 1755554780],
+    "035cab738187a8ccb0a6d594e2369649ff05992c": ["GlobalSign Root R46", "53a2b04bca6bd645e6398a8ec40dd2bf77c3a290", 2405116800],
+    "03de503556d14cbb66f0a3e21b1bc397b23dd155": ["DigiCert Global Root CA", "a8985d3a65e5e5c4b2d7d66d40c6dd2fb19c5436", 1952035200],
+    "04aa7a47a3e489af1acf0a40a7183f6fefe97dbe": ["Juur-SK", "409d4bd917b55c27b69b64cb9822440dcd09b889", 1472221381],
+    "069a9b1f537df1f5a4c8d3863ea17359b4f74421": ["TunTrust Root CA", "cfe970840fe0730f9df60c7f2c4bee2046349cbb", 2345273876],
+    "071fd2e79cdac26ea240b4b07a50105074c4c8bd": ["AffirmTrust Networking", "293621028b20ed02f566c532d1d6ed909f45002f", 1924956504],
+    "07c35130a4aae945ae3524faff242c33d0b19d8c": ["RSA Security Inc", "25019019cffbd9991cb76825748d945f30939542", 1771792763],
+    "0876cdcb07ff24f6c5cdedbb90bce284374675f7": ["Certum Trusted Network CA", "07e032e020b72c3f192f0628a2593a19a70f069e", 1893413257],
+    "0972064e18430fe5d6ccc36a8b317b788fa883b8": ["DST ACES CA X6", "4054da6f1c3f4074aced0feccddb79d153fb901d", 1511212798],
+    "09cb597f86b2708f1ac339e3c0d9e9bfbb4db223": ["Microsoft RSA Root Certificate Authority 2017", "73a5e64a3bff8316ff0edccc618a906e4eae4d74", 2289337223],
+    "0a4823a660a4920a33ea935bc557ea254dbd12ee": ["HARICA TLS RSA Root CA 2021", "022d0582fa88ce140c0679de7f1410e945d7a56d", 2370596137],
+    "0a85a9776505987c4081f80f972c38f10aec3ccf": ["SECOM Trust Systems CO.,LTD.", "5f3b8cf2f810b37d78b4ceec1919c37334b9c774", 1874725239],
+    "0b58e58bc64c1537a440a930a921be47365a56ff": ["COMODO Certification Authority", "6631bf9ef74f9eb6c9d5a60cba6abed1f7bdef7b", 1893455999],
+    "0d8cb661da44b8d1147dc3be7d5e48f0ceca6ab0": ["Certinomis - Autorité Racine", "2e14daec28f0fa1e8e389a4eabeb26c00ad383c3", 1852792139],
+    "12f25a3eea561cbfcd06acf1f125c9a94bd41499": ["EE Certification Centre Root CA", "c9a8b9e755805e58e35377a725ebafc37b27ccd7", 1923782399],
+    "1538830f3f2c3f70331ecd46fe078c20e0d7c3b7": ["Visa eCommerce Root", "70179b868c00a4fa609152223f9f3e32bde00562", 1656029772],
+    "155f35575155fb25b2ad0369fc01a3fabe1155d5": ["GeoTrust Primary Certification Authority - G2", "8d1784d537f3037dec70fe578b519a99e610d7b0", 2147471999],
+    "15a69680b1154b31c3c29cf6e7130b4bf318cd86": ["ipsCA Global CA Root", "3c71d70e35a5daa8b2e3812dc3677417f5990df3", 1892903924],
+    "179dcd1e8bd6392b70d35cd4a0b81fb000fcc561": ["Hongkong Post Root CA 3", "58a2d0ec2052815bc1f3f86402244ec28e024b02", 2285375386],
+    "17a0cdc1e441b63a5b3bcb459dbd1cc298fa8658": ["SwissSign Silver CA - G2", "9baae59f56ee21cb435abe2593dfa7f040d11dcb", 2108536366],
+    "188756e06e77ee24353c4e739a1fd6e1e2797e2b": ["Certigna Root CA", "2d0d5214ff9ead9924017420476e6c852727f543", 2011768347],
+    "1a8462bc484c332504d4eed0f603c41946d1946b": ["QuoVadis Root CA 2", "ca3afbcf1240364b44b216208880483919937cf7", 1953311013],
+    "1aedfe413990b42459be01f252d545f65a39dc11": ["Certigna", "b12e13634586a46f1ab2606837582dc4acfd9497", 1814281985],
+    "1d1c650ea8f2257bb491cfe4b1b1e6bd55746c05": ["Izenpe.com", "2f783d255218a74a653971b52ca29c45156fe919", 2144305645],
+    "1e0cf7b667f2e192260945c055392e773f424aa2": ["Chunghwa Telecom Co., Ltd.", "67650df17e8e7e5b8240a4f4564bcfe23d69c6f0", 2050194687],
+    "1e824d2865803cc9416eac352e5acbdeeef8395b": ["Digital Signature Trust Co.", "ab48f333db04abb9c072da5b0cc1d057f0369b46", 1544384846],
+    "2130c9fb00d74e98da87aa2ad0a72eb14031a74c": ["Network Solutions Certificate Authority", "74f8a3c3efe7b390064b83903c21646020e5dfce", 1893455999],
+    "26951910d9e8a19791ffdc19d9b5043ed2730a6a": ["WellsSecure Public Root Certificate Authority", "e7b4f69d61ec9069db7e90a7401a3cf47d4fe8ee", 1670976474],
+    "29c590ab25af11e461bfa3ff886191e60efe9c81": ["TÜRKTRUST Elektronik Sertifika Hizmet Sağlayıcısı", "f17f6fb631dc99e3a3c87ffe1cf1811088d96033", 1513967839],
+    "2cd5504197158bf08f36615b4afb6bd999c93392": ["GeoTrust Primary Certification Authority", "323c118e1bf7b8b65254e2e2100dd6029037f096", 2099865599],
+    "2e16a94a18b5cbccf56f50f3235ff85de7acf0c8": ["SZAFIR ROOT CA2", "e252fa953feddb2460bd6e28f39ccccf5eb33fde", 2076392610],
+    "2ee3dbb249d09c54795cfa272afecc4ed2e84e54": ["E-Tugra Certification Authority", "51c6e70849066ef392d45ca00d6da3628fc35239", 1677845388],
+    "310a908fb6c69dd2444b80b5a2e61fb1124f1b95": ["GlobalSign Root E46", "39b46cd5fe8006ebe22f4abb0833a0afdbb9dd84", 2405116800],
+    "31c3791bbaf553d717e0897a2d176c0ab32b9d33": ["Deutsche Telekom Root CA 2", "85a408c09c193e5d51587dcdd61330fd8cde37bf", 1562716740],
+    "330ba066d1eadacede6293042852b5147f3868b7": ["Autoridad de Certificacion Firmaprofesional CIF A62634068", "a9628f4b98a91b4835bad2c1463286bb66646a8c", 1382652000],
+    "350fc836635ee2a3ecf93b6615ce5152e3919a3d": ["OISTE WISeKey Global Root GB CA", "0ff9407618d3d76a4b98f0a8359e0cfd27accced", 2206365031],
+    "354af54daf3fd78238acab716517758c9d5593e6": ["SECOM Trust Systems CO.,LTD.", "feb8c432dcf9769aceae3dd8908ffd288665647d", 2127867152],
+    "3814e6c8f0a9a403f44e3e22a35bf2d6e0ad4074": ["Buypass Class 3 CA 1", "61573a11df0ed87ed5926522ead056d744b32371", 1431180783],
+    "39958b628b5cc9d480ba580f973f150843cc98a7": ["AddTrust Qualified CA Root", "4d2378ec919539b5007f758f033b211ec54d8bcf", 1590835490],
+    "3a9a8507106728b6eff6bd05416e20c194da0fde": ["Go Daddy Root Certificate Authority - G2", "47beabc922eae80e78783462a79f45c254fde68b", 2145916799],
+    "3ae10986d4cf19c29676744976dce035c663639a": ["USERTrust ECC Certification Authority", "d1cbca5db2d52a7f693b674de5f05a1d0c957df0", 2147471999],
+    "3cd89388c2c08209cc0199069320e99e7009634f": ["Secure Certificate Services", "4a65d5f41def39b8b8904a4ad3648133cfc7a1d1", 1861919999],
+    "3de629489bea07ca21444a26de6eded283d09f59": ["GlobalSign", "1f24c630cda418ef2069ffad4fdd5f463a1b69aa", 2147483647],
+    "3f8d9a598bfc7b7b9ca3af38b039ed907180d6c8": ["Buypass Class 2 CA 1", "a0a1ab90c9fc847b3b1261e8977d5fd32261d3cc", 1476354309],
+    "409a7644977407c4ac14cb1e8d4f3a457c30d761": ["FNMT", "43f9b110d5bafd48225231b0d0082b372fef9a54", 1552922779],
+    "4232b616fa04fdfe5d4b7ac3fdf74c401d5a43af": ["SecureTrust CA", "8782c6c304353bcfd29692d2593e7d44d934ff11", 1893440455],
+    "439c369fb09e304dc6ce5fad10abe503a5faa914": ["Global Chambersign Root", "339b6b1450249b557a01877284d9e02fc3d2d8e9", 2137940058],
+    "446a95675579114f": ["A-Trust-nQual-03", "d3c063f219ed073e34ad5d750b327629ffd59af2", 1439848800],
+    "449e48f5cc6d48d4a04b7ffe59242f8397999a86": ["TrustCor ECA-1", "58d1df9595676b63c0f05b1c174d8b840bc878bd", 1893432487],
+    "45d9a5816e3d884d8d71d246c16e451ef3c4809d": ["Swisscom Root EV CA 2", "e7a19029d3d552dc0d0fc692d3ea880d152e1a6b", 1940143508],
+    "45eba2aff492cb82312d518ba7a7219df36dc80f": ["DigiCert Assured ID Root CA", "0563b8630d62d75abbc8ab1e4bdfb5a899b24d43", 1952035200],
+    "4777c3148b62390cc96fe1504dd01058dc95886d": ["OpenTrust Root CA G3", "6e2664f356bf3455bfd1933f7c01ded813da8aa6", 2147126400],
+    "47b8cdffe56feef8b2ec2f4e0ef925b08e3c6bc3": ["Buypass Class 3 Root CA", "dafaf7fa6684ec068f1450bdc7c281a5bca96457", 2234852938],
+    "488714ace3c39e90603ad7ca89eed3ad8cb45066": ["OISTE WISeKey Global Root GC CA", "e011845e34debe8881b99cf61626d1961fc3b931", 2283242313],
+    "48e668f92bd2b295d747d82320104f3398909fd4": ["Equifax", "d23209ad23d314232174e40d7f9d62139786633a", 1534956111],
+    "4a78325211db5916365edfc11436406a477c4ca1": ["Equifax Secure eBusiness CA-1", "da40188b9189a3edeeaeda97fe2f9df5b7d18a41", 1592712000],
+    "4aa0aa5884d35e3c": ["Sonera Class2 CA", "37f76de6077c90c5b13e931ab74110b4f2e49a27", 1617694180],
+    "4bc5b4406bad1cb3a51c656e46368987050c0eb6": ["StartCom Certification Authority G2", "31f1fd68226320eec63b3f9dea4a3e537c7c3917", 2208988741],
+    "4d262022894bd3d5a40aa16fdee21281c5f13c2e": ["Swisscom Root CA 2", "77474fc630e40f4c47643f84bab8c6954a8a41ec", 1940139494],
+    "4d45c16838bb73a969a120e7edf522a12314d79e": ["America Online Root Certification Authority 2", "85b5ff679b0c79961fc86e4422004613db179284", 2137846080],
+    "4e0bef1aa4405ba517698730ca346843d041aef2": ["StartCom Certification Authority", "3e2bf7f2031b96f38ce6c4d8a85d3e2d58476a0f", 2105293596],
+    "4e2254201895e6e36ee60ffafab912ed06178f39": ["DigiCert Global Root G2", "df3c24f9bfd666761b268073fe06d1cc8d4f82a4", 2147169600],
+    "4e43c81d76ef37537a4ff2586f94f338e2d5bddf": ["VeriSign Class 3 Extended Validation SSL SGC CA", "4a8a2a0e276ff33b5dd88a362146010f2a8b6aee", 1478563199],
+    "509e0beaaf5eb92048a6506acbfdd8207aa78276": ["Equifax Secure", "394ff6850b06be52e51856cc10e180e882b385cc", 1561292085],
+    "50afcc078715476f38c5b465d1de95aae9df9ccc": ["SwissSign Platinum CA - G2", "56e0fac03b8f18235518e5d311cae8c24331ab66", 2108536560],
+    "51331ced3640af17d325cd6968f2af4e233eb341": ["DigiCert TLS RSA4096 Root G5", "a78849dc5d7c758c8cde399856b3aad0b2a57135", 2399587199],
+    "52d8883ac89f7866ed89f37b387094c9020236d0": ["Actalis Authentication Root CA", "f373b387065a28848af2f34ace192bddc78e9cac", 1916306522],
+    "5332d1b3cf7ffae0f1a05d854e92d29e451db44f": ["UTN - DATACorp SGC", "58119f0e128287ea50fdd987456f4f78dcfad6d4", 1561403190],
+    "5379bf5aaa2b4acf5480e1d89bc09df2b20366cb": ["USERTrust RSA Certification Authority", "2b8f1b57330dbba2d07a6c51f70ee90ddab9ad8e", 2147471999],
+    "545acb263f71cc94460d9653ea6b48d093fe4275": ["Japanese Government", "7f8ab0cfd051876a66f3360f47c88d8cd335fc74", 1513090800],
+    "54627063f1758443588ed11620b1c6ac1abcf689": ["vTrus Root CA", "841a69fbf5cd1a2534133de3f8fcb899d0c914b7", 2321940245],
+    "54adfac79257aeca359c2e12fbe4ba5d20dc9457": ["Staat der Nederlanden Root CA - G3", "d8eb6b41519259e0f3e78500c03db68897c9eefc", 1857769200],
+    "54b07bad45b8e2407ffb0a6efbbe33c93ca384d5": ["GlobalSign", "6ba0b098e171ef5aadfe4815807710f4bd6f0b28", 2147483647],
+    "55a98489d2c132bd18cb6ca6074ec8e79dbe8290": ["Trustwave Global ECC P384 Certification Authority", "e7f3a3c8cf6fc3042e6d0e6732c59e68950d5ed2", 2292435403],
+    "55e481d11180bed889b908a331f9a1240916b970": ["Entrust.net Certification Authority (2048)", "503006091d97d4f5ae39f7cbe7927d7d652d3431", 1879596912],
+    "5699071ed3ac0c6964b40c5047de432cbe20c0fb": ["TÜRKTRUST Elektronik Sertifika Hizmet Sağlayıcısı H5", "c418f64d46d1df003d2730137243a91211c675fb", 1682669221],
+    "56e7e15b254380e0f68ce171bc8ee5802fc448e2": ["TC TrustCenter Universal CA III", "9656cd7b57969895d0e141466806fbb8c6110687", 1893455999],
+    "5b257b96a465517eb839f3c078665ee83ae7f0ee": ["SwissSign Gold CA - G2", "d8c5388ab7301b1b6ed47ae645253a6f9f1a2761", 2108536235],
+    "5bca5ee5ded281aacda82d6451b6d9729b97e64f": ["SSL.com EV Root Certification Authority ECC", "4cdd51a3d1f5203214b0c6c532230391c746426d", 2244305723],
+    "5bf84d4fb2a586d43ad2f1639aa0be09f657b7de": ["SecureSign RootCA11", "3bc49f48f8f373a09c1ebdf85bb1c365c7d811b3", 1870318607],
+    "607b661a450d97ca89502f7d04cd34a8fffcfd4b": ["GlobalSign Root CA", "b1bc968bd4f49d622aa89a81f2150152a41d829c", 1832673600],
+    "60b585ec56647e121927671d50154b73ae3bf912": ["TDC OCES CA", "8781c25a96bdc2fb4c65064ff9390b26048a0e01", 2117956170],
+    "64147cfc587216a60a2934156f2acbbcfcafa8ab": ["Security Communication RootCA3", "c303c8227492e561a29c5f79912b1e441391303a", 2147408236],
+    "653fc78a86c63cdd3c545c35f83aed520c4757c8": ["TUBITAK Kamu SM SSL Kok Sertifikasi - Surum 1", "3143649becce27eced3a3f0b8f0de4e891ddeeca", 2329374355],
+    "65cdebab351e003e7ed574c01cb473470e1a642f": ["Autoridad de Certificacion Firmaprofesional CIF A62634068", "0bbec2272249cb39aadb355c53e38cae78ffb6fe", 2093613727],
+    "65f231ad2af7f7dd52960ac702c10eefa6d53b11": ["CNNIC ROOT", "8baf4c9b1df02a92f7da128eb91bacf498604b6f", 1807859354],
+    "6890e467a4a65380c78666a4f1f74b43fb84bd6d": ["Entrust Root Certification Authority", "b31eb1b740e36c8402dadc37d44df5d4674952f9", 1795812822],
+    "6a385b268dde8b5af24f7a54831918e30835a6ba": ["TWCA Root Certification Authority", "cf9e876dd3ebfc422697a3b5a37aa076a9062348", 1924963199],
+    "6a39fa4222f7e689004d5e7d3383cbb86e7786af": ["OpenTrust Root CA G2", "795f8860c5ab7c3d92e6cbf48de145cd11ef600b", 2147126400],
+    "6a72267ad01eef7de73b6951d46c8d9f901266ab": ["Entrust Root Certification Authority - G2", "8cf427fd790c3ad166068de81e57efbb932272d4", 1922896554],
+    "6a797e91694618130a0277a5595b6098250ea2f8": ["Digital Signature Trust Co.", "81968b3aef1cdc70f5fa3269c292a3635bd123d3", 1544467223],
+    "6c6401c7fd856dacc8da9e50088508b53c56a850": ["TDC Internet", "21fcbd8e7f6caf051bd1b343eca8e76147f20f8a", 1617642197],
+    "711567c8c8c9bd755d72d038186a9df37124540b": ["Hellenic Academic and Research Institutions RootCA 2015", "010c0695a6981914ffbf5fc6b0b695ea29e912a6", 2224663881],
+    "713836f2023153472b6eba6546a9101558200509": ["GeoTrust Global CA 2", "a9e9780814375888f20519b06d2b0d2b6016907d", 1551675600],
+    "72ace43379aa4587f6fdac1d9ed6c72f86d82439": ["Telia Root CA v2", "b999cdd173508ac44705089c8c88fbbea02b40cd", 2332410954],
+    "739110abff55b35a7c0925d5b2ba08a06bab1f6d": ["D-TRUST BR Root CA 1 2020", "1f5b98f0e3b5f7743cede6b0367d32cdf4094167", 2054799899],
+    "7571a7194819bc9d9dea4147df94c4487799d379": ["COMODO ECC Certification Authority", "9f744e9f2b4dbaec0f312c50b6563b8e2d93c311", 2147471999],
+    "76f355e1faa436fbf09f5c6271ed3cf44738102b": ["GeoTrust Universal CA 2", "379a197b418545350ca60369f33c2eaf474f2079", 1867294800],
+    "79b459e67bb6e5e40173800888c81a58f6e99b6e": ["ISRG Root X1", "cabd2a79a1076a31f21d253635cb039d4329a5e8", 2064567878],
+    "7b35d340d21c781966ef741028dc3e4fb27804fc": ["Root CA Generalitat Valenciana", "a073e5c5bd43610d864c21130a855857cc9cea46", 1625152967],
+    "7b5b45cfafcecb7afd31921a6ab6f346eb574850": ["thawte Primary Root CA", "91c6d6ee3e8ac86384e548c299295c756c817b81", 2099865599],
+    "7c0c321fa7d9307fc47d68a362a8a1ceab075b27": ["Starfield Root Certificate Authority - G2", "b51c067cee2b0c3df855ab2d92f4fe39d4e70f0e", 2145916799],
+    "7c4296aede4b483bfa92f89e8ccf6d8ba9723795": ["ISRG Root X2", "bdb1b93cd5978d45c6261455f8db95c75ad153af", 2231510400],
+    "7c5d028413d4cc8a9b81ce171c2e291e9c486342": ["emSign ECC Root CA - G3", "3043fa4ff257dca0c380ee2e58ea78b23fe6bbc1", 2307897000],
+    "7c724b39c7c0db62a54f9baa183492a2ca838259": ["China Internet Network Information Center EV Certificates Root", "4f99aa93fb2bd13726a1994ace7ff005f2935d1e", 1914390685],
+    "7f100116373aa428e450f8a4f7ec6b32b6fee98b": ["D-TRUST EV Root CA 1 2020", "61db8c2159690390d87c9c128654cf9d3df4dd07", 2054800799],
+    "7fd365a7c2ddecbbf03009f34339fa02af333133": ["VeriSign Class 3 Public Primary Certification Authority - G5", "4eb6d578499b1ccf5f581ead56be3d9b6744a5e5", 2099865599],
+    "804cd6eb74ff4936a3d5d8fcb53ec56af0941d8c": ["GTS Root R4", "77d30367b5e00c15f60c3861df7ce13b92464d47", 2097705600],
+    "813e37d892b01f779f5cb4ab73aae7f634602ffa": ["AddTrust Public CA Root", "2ab628485e78fbf3ad9e7910dd6bdf99722c96e5", 1590835310],
+    "81c48cccf5e430ffa50c085f8c1567217401dfdf": ["UCA Global G2 Root", "28f97816197aff182518aa44fec1a0ce5cb64c8a", 2240524800],
+    "82212d66c6d7a0e015ebce4c0977c4609e546e03": ["CERTSIGN SA", "26f993b4ed3d2827b0b94ba7e9151da38d92e532", 2275291655],
+    "82d1857330e73504d38e0292fbe5a4d1c421e8cd": ["SSL.com Root Certification Authority ECC", "c3197c3924e654af1bc4ab20957ae2c30e13026a", 2244305643],
+    "8418cc8534ecbc0c94942e08599cc7b2104e0a08": ["Amazon Root CA 1", "8da7f965ec5efc37910f1c6e59fdc1cc6a6ede16", 2147299200],
+    "861ce7fe2da54a8b08fe2811fabea366f860592f": ["Security Communication ECC RootCA1", "b80e26a9bfd2b23bc0ef46c9bac7bbf61d0d4141", 2147404528],
+    "87111508d1aac1780cb1afcec6c990efbf3004c0": ["e-Szigno Root CA 2017", "89d483034f9e9a48805f7237d4a9a6efcb7c1fd1", 2292322026],
+    "8868bfe08e35c43b386b62f7283b8481c80cd74d": ["DigiNotar Root CA", "c060ed44cbd881bd0ef86c0ba287ddcf8167478c", 1743445161],
+    "890ab438931ae6abee9b9118f9f53c3e35d0d382": ["CA Disig Root R1", "8e1c74f8a620b9e58af461faec2b4756511a52c6", 2289373616],
+    "8b4b6dedd329b90619ec3939a9f097846acbefdf": ["QuoVadis Root Certification Authority", "de3f40bd5093d39b6c60f6dabc076201008976c9", 1616006013],
+    "8cfb1c75bc02d39f4e2e48d9f96054aac4b34ffa": ["Certum Trusted Root CA", "c88344c018ae9fccf187b78f22d1c5d74584bae5", 2310120613],
+    "8d06667424763af389f7bcd6bd477d2fbc105f4b": ["Certum EC-384 CA", "f33e783cacdff4a2ccac67556956d7e5163ce1ed", 2310967494],
+    "8db249689d720825b9c027f5509356484671f98f": ["CA Disig", "2ac8d58b57cebf2f49aff2fc768f511462907a41", 1458610774],
+    "8f81f0daa6cd743cbe66f4156b46a4fe0628ccaa": ["KISA RootCA 3", "5f4e1fcf31b7913b850b54f6e5ff501a2b6fc6cf", 1416379191],
+    "8ff04b7fa82e4524ae4d50fa639a8bdee2dd1bbc": ["GlobalSign", "d69b561148f01c77c54578c10926df5b856976ad", 1868522400],
+    "91683287151d89e2b5f1ac3628348d0b7c6288eb": ["Staat der Nederlanden Root CA - G2", "59af82799186c7b47507cbcf035746eb04ddb716", 1585134190],
+    "92a4752ca49ebe8144eb79fc8ac595a5eb107573": ["TC TrustCenter Universal CA I", "6b2f34ad8958be62fdb06b5ccebb9dd94f4e39f3", 1767221999],
+    "95b1b4f094b6bdc7dad1110921bec1af49fd107b": ["AddTrust Class 1 CA Root", "ccab0ea04c2301d6697bdd379fcd12eb24e3949d", 1590835111],
+    "974621572135da3655c7f3f13770e508f69329b6": ["OpenTrust Root CA G1", "7991e834f7e2eedd08950152e9552d14e958d57e", 2147126400],
+    "9839cdbed8b28cf7b2abe1ad24af7b7ca1db1fcf": ["vTrus ECC Root CA", "f69cdbb0fcf60213b65232a6a3913f1670dac3e1", 2321940404],
+    "99e019670d62db76b3da3db85be8fd42d2310e87": ["Trustwave Global Certification Authority", "2f8f364fe1589744215987a52a9ad06995267fb5", 2292435252],
+    "9aaf297ac011353526513000c36afe40d5aed63c": ["AffirmTrust Premium ECC", "b8236b002f1d16865301556c11a437caebffc3bb", 2240576424],
+    "9ad8003000e76b7f8518ee8bb6ce8a0cf811e1bb": ["thawte Primary Root CA - G2", "aadbbc22238fc401a127bb38ddf41ddb089ef012", 2147471999],
+    "9be20757671c1ec06a06de59b49a2ddfdc19862e": ["GlobalSign", "75e0abb6138512271c04f85fddde38e4b7242efe", 1639555200],
+    "9c5f00dfaa01d7302b3888a2b86d4a9cf2119183": ["Starfield Services Root Certificate Authority - G2", "925a8f8d2c6d04e0665f596aff22d863e8256f3f", 2145916799],
+    "9c5fd06c63a35f93ca939808ad8c87a52c5cc137": ["ANF Secure Server Root CA", "5b6e68d0cc15b6a05f1ec15fae02fc6b2f5d6f74", 2198311238],
+    "9d93c6538b5ecaaf3f9f1e0fe59995bc24f6948f": ["AffirmTrust Commercial", "f9b5b632455f9cbeec575f80dce96e2cc7b278b7", 1924956366],
+    "9dc067a60c22d926f545aba665521127d845ac63": ["AffirmTrust Premium", "d8a6332ce0036fb185f6634f7d6a066526322827", 2240575836],
+    "9f38c45623c339e8a0716ce8544ce4e83ab1bf67": ["Entrust Root Certification Authority - G4", "14884e862637b026af59625c4077ec3529ba9601", 2145526876],
+    "9fee44b394d5fa914f2ed9559a0456db2dc4dba5": ["e-Guven Kok Elektronik Sertifika Hizmet Saglayicisi", "dde1d2a901802e1d875e84b3807e4bb1fd994134", 1483529568],
+    "a0110a233e96f107ece2af29ef82a57fd030a4b4": ["AAA Certificate Services", "d1eb23a46d17d68fd92564c2f1f1601764d8e349", 1861919999],
+    "a073499968dc855b65e39b282f579fbd33bc0748": ["SECOM Trust.net", "36b12b49f9819ed74c9ebc380fc6568f5dacb2f7", 1696047649],
+    "a0c38b44aa37a545bf97805ad1f178a29be95d8d": ["EC-ACC", "28903a635b5280fae6774c0b6da7d6baa64af2e8", 1925593199],
+    "a1725f261b289843955d0737d585969d4bd2c345": ["UTN-USERFirst-Hardware", "0483ed3399ac3608058722edbc5e4600e3bef9d7", 1562696362],
+    "a1e19e4525794d06d902179282d53089722514a0": ["StartCom Extended Validation Server CA", "657355a6bb68f93d33ccb758b42f5e1a7d85c9c4", 1546322400],
+    "a3052f186050c2890add2b214fff8e4ea8303136": ["IGC/A", "60d68974b5c2659e8a0fc1887c88d246691b182c", 1602944962],
+    "a34106ac906dd14aeb75a54a1099b3b1a18b4af7": ["Trustwave Global ECC P256 Certification Authority", "b49082dd450cbe8b5bb166d3e2a40826cded42cf", 2292435310],
+    "a397d6f35ea210e1ab459f3c17643cee01709ccc": ["QuoVadis Root CA 1 G3", "1b8eea5796291ac939eab80a811a7373c0937967", 2273160464],
+    "a69142fd13614a239e08a429e5d8130423ee4125": ["Hellenic Academic and Research Institutions RootCA 2011", "fe45659b79035b98a161b5512eacda580948224d", 1953899392],
+    "a6b3e12b2b49b6d773a1aa94f501e773654cac50": ["ACEDICOM Root", "e0b4322eb2f6a568b654538448184a5036874384", 1839255862],
+    "a7a506b12ca60960eed197e970aebc3b196cdb21": ["Atos TrustedRoot 2011", "2bb1f53e550c1dc5f1d4e6b76a464b550602ac21", 1924991999],
+    "a87debbc63a474137400ec96e0d334c12cbf6cf8": ["Staat der Nederlanden Root CA", "101dfa3fd50bcbbb9bb5600c1955a41af4733a04", 1450257338],
+    "a8c1c09b91a843157c5d0627b42a51d8970b81b1": ["Certplus Root CA G1", "22fdd0b7fda24e0dac492ca0aca67b6a1fe3f766", 2147126400],
+    "aafdd55aa3f6878b3285fdd1325b804593f303b8": ["CA WoSign ECC Root", "d27ad2beed94c0a13cc72521ea5d71be8119f32b", 2362179538],
+    "abb6dbd7069e37ac3086079170c79cc419b178c0": ["Amazon Root CA 3", "0d44dd8c3c8c1a1a58756481e90f2e2affb3d26e", 2221603200],
+    "ad6caa94609cede4fffa3e0a742b6303f7b659bf": ["thawte Primary Root CA - G3", "f18b538d1be903b6a6f056435b171589caf36bf2", 2143324799],
+    "adbd987a34b426f7fac42654ef03bde024cb541a": ["AddTrust External CA Root", "02faf3e291435468607857694df5e45b68851868", 1590835718],
+    "ae6c05a39313e2a2e7e2d71cd6c7f07fc86753a0": ["GlobalSign", "8094640eb5a7a1ca119c1fddd59f810263a7fbd1", 2049321600],
+    "af4404c2417e4883db4e3902ecec847ae6cec9a4": ["Secure Global CA", "3a44735ae581901f248661461e3b9cc45ff53a1b", 1893441126],
+    "b00cf04c30f405580248fd33e552af4b84e36652": ["Amazon Root CA 2", "5a8cef45d7a69859767a8c8b4496b578cf474b1a", 2221603200],
+    "b13ec36903f8bf4701d498261a0802ef63642bc3": ["DigiCert High Assurance EV Root CA", "5fb7ee0633e259dbad0c4c9ae6d38f1a61c7dc25", 1952035200],
+    "b2b4aee62df726d5aa752d764bc01b5321d048ef": ["E-Tugra Global Root CA RSA v3", "e9a85d2214521c5baa0ab4be246a238ac9bae2a9", 2372922437],
+    "b3037eae36bcb079d1dc9426b611be21b2698694": ["OISTE WISeKey Global Root GA CA", "5922a1e15aea163521f898396a4646b0441b0fa9", 2144160591],
+    "b31691fdeea66ee4b52e498f87788180ece5b1b5": ["VeriSign Class 3 Public Primary Certification Authority - G4", "22d5d8df8f0231d18df79db7cf8a2d64c93f6c3a", 2147471999],
+    "b3db48a4f9a1c5d8ae3641cc1163696229bc4bc6": ["DigiCert Global Root G3", "7e04de896a3e666d00e687d33ffad93be83d349e", 2147169600],
+    "b4220b829924010e9cbbe40efdbffb972093992a": ["Hellenic Academic and Research Institutions ECC RootCA 2015", "9ff1718d92d59af37d7497b4bc6f84680bbab666", 2224665432],
+    "b503f7763b61826a12aa1853eb032194bffececa": ["T-TeleSec GlobalRoot Class 3", "55a6723ecbf2eccdc3237470199d2abe11e381d1", 2011823999],
+    "b599f8afb094f5e320d60aadce4e56a42e6e42ed": ["CA Disig Root R2", "b561ebeaa4dee4254b691a98a55747c234c7d971", 2289374130],
+    "b6087b0d7accac204c8656325ecfab6e852d7057": ["Cybertrust Global Root", "5f43e5b1bff8788cac1cc7ca4a9ac6222bcc34c6", 1639555200],
+    "b677fa6948479f5312d5c2ea07327607d1970719": ["VeriSign Universal Root Certification Authority", "3679ca35668772304d30a5fb873b0fa77bb70d54", 2143324799],
+    "b6a1543902c3a03f8e8abcfad4f81ca6d13a0efd": ["Certum Trusted Network CA 2", "d3dd483e2bbf4c05e8af10f5fa7626cfd3dc3092", 2422427996],
+    "b763e71add8de908a65583a4e06a504165114249": ["Entrust Root Certification Authority - EC1", "20d80640df9b25f512253a11eaf7598aeb14b547", 2144764536],
+    "b909ca9c1edbd36c3a6baeed54f15b9306352e5e": ["Global Chambersign Root - 2008", "4abdeeec950d359c89aec752a12c5b29f6d6aa0c", 2164192300],
+    "bafa7125798b57412521860b71ebb2640e8b2167": ["Trustis Limited", "3bc0380b33c3f6a60c86152293d9dff54b81c004", 1705837014],
+    "bbaf7e023dfaa6f13c848eadee3898ecd93232d4": ["COMODO RSA Certification Authority", "afe5d244a8d1194230ff479fe2f897bbcd7a8cb4", 2147471999],
+    "bbffca8e239f4f99cadbe268a6a51527171ed90e": ["GTS Root R2", "9a44497632dbdefad0bcfb5a7b17bd9e56092494", 2097705600],
+    "bd8887c98ff6a40a0baaebc5fe91239dab4a8a32": ["TÜBİTAK UEKAE Kök Sertifika Hizmet Sağlayıcısı - Sürüm 3", "1b4b396126276b6491a2686dd70243212d1f1d96", 1503315427],
+    "bea8a07472506b44b7c923d8fba8ffb3576b686c": ["Equifax Secure Global eBusiness CA-1", "7e784a101c8265cc2de1f16d47b440cad90a1945", 1592712000],
+    "bf5920360079a0a0226b8cd5f261d2b82ccb824a": ["T-TeleSec GlobalRoot Class 2", "590d2d7d884f402e617ea562321765cf17d894e9", 2011823999],
+    "bf5fb7d1cedd1f86f45b55acdcd710c20ea988e7": ["Starfield Technologies, Inc.", "ad7e1c28b064ef8f6003402014c3d0e3370eb58a", 2035215556],
+    "bfb627d8035a76654c6101415631e58b7b3ad9cc": ["KISA RootCA 1", "027268293e5f5d17aaa4b3c3e6361e1f92575eaa", 1756022746],
+    "c07a98688d89fbab05640c117daa7d65b8cacc4e": ["GeoTrust Global CA", "de28f4a4ffe5b92fa3c503d1a349a7f9962a8212", 1653105600],
+    "c14bed70b6f73e7c003b008fc73e0e459f1e5dec": ["ComSign Secured CA", "f9cd0e2cda7624c18fbdf0f0abb645b8f7fed57a", 1868367896],
+    "c151455059ab3ee72c5afa2022120780887c116a": ["DigiCert TLS ECC P384 Root G5", "17f3de5e9f0f19e98ef61f32266e20c407ae30ee", 2399587199],
+    "c1f126baa02dae8581cfd3f12a12bdb80a67fdbc": ["GTS Root R3", "ede571802bc892b95b833cd232683f09cda01e46", 2097705600],
+    "c479ca8ea14e031d1cdc6bdb315b943e3f307f2d": ["GeoTrust Primary Certification Authority - G3", "039eedb80be7a03c6953893b20d2d9323a4c2afd", 2143324799],
+    "c4a7b1a47b2c71fadbe14b9075ffc41560858910": ["DST Root CA X3", "dac9024f54d8f6df94935fb1732638ca6ad77c13", 1633010475],
+    "c57b58bdedda2569d2f75916a8b332c07b275bf4": ["Trusted Certificate Services", "e19fe30e8b84609e809b170d72a8c5ba6e1409bd", 1861919999],
+    "c617d0bca8ea0243f21b06995d2b9020b9d79ce4": ["QuoVadis Root CA 3 G3", "4812bd923ca8c43906e7306d2796e6a4cf222e7d", 2273171192],
+    "c64fa23d066384099cce62e404ac8d5cb5e9b61b": ["XRamp Global Certification Authority", "b80186d1eb9c86a54104cf3054f34c52b7e558c6", 2051242639],
+    "c7a04975166184db314b84d2f1374090ef4edcf7": ["Microsec e-Szigno Root CA", "2388c9d371cc9e963dff7d3ca7cefcd625ec190d", 1491481724],
+    "c8cb997270520cf8e6beb20457292acf4210ed35": ["Microsoft ECC Root Certificate Authority 2017", "999a64c37ff47d9fab95f14769891460eec4c3c5", 2289338164],
+    "c91b538112fe04d516d1aabc9a6fb7a095196eca": ["HARICA TLS ECC Root CA 2021", "bcb0c19de9989270193857e98da7b45d6eee0148", 2370596469],
+    "c98077e0629282f5469cf3baf74cc3deb8a3ad39": ["Buypass Class 2 Root CA", "490a7574de870a47fe58eef6c76bebc60b124099", 2234853483],
+    "cb0fc6df4243cc3dcbb54823a11a7aa62abb3468": ["Microsec e-Szigno Root CA 2009", "89df74fe5cf40f4a80f9e3377d54da91e101318e", 1893324618],
+    "cbd0bda9e1980551a14d37a28379ce8d1d2ae484": ["DigiCert Assured ID Root G3", "f517a24f9a48c6c9f8a200269fdc0f482cab3089", 2147169600],
+    "ccccefcc2960a43bb192b63cfa32628fac25153b": ["Government Root Certification Authority", "f48b11bfdeabbe94542071e641de6bbe882b40b9", 1985865813],
+    "ccfa6793f0b6b8d0a5c01ef353fd8c53df83d796": ["NetLock Arany (Class Gold) Főtanúsítvány", "06083f593f15a104a069a46ba903d006b7970991", 1859728101],
+    "cec34ab99955f2b8db60bfa97ebd56b59736a7d6": ["DigiCert Assured ID Root G2", "a14b48d943ee0a0e40904f3ce0a4c09193515d3f", 2147169600],
+    "d287b4e3df37279355f656ea81e536cc8c1e3fbd": ["ACCVRAIZ1", "93057a8815c64fce882ffa9116522878bc536417", 1924940257],
+    "d29f88dfa1cd2cbdecf53b0101933327b2eb604b": ["NAVER Global Root Certification Authority", "8f6bf2a9274ada14a0c4f48e6127f9c01e785dd1", 2134252799],
+    "d2c4b0d291d44c1171b361cb3da1fedda86ad4e3": ["The Go Daddy Group, Inc.", "2796bae63f1801e277261ba0d77770028f20eee4", 2035213580],
+    "d3948a4c62132a192eccaf728a7d36d79a1cdc67": ["D-TRUST Root Class 3 CA 2 EV 2009", "96c91b0b95b4109842fad0d82279fe60fab91683", 1888563046],
+    "d3ecc73a656ecce1da769a56fb9cf3866d57e581": ["Amazon Root CA 4", "f6108407d6f8bb67980cc2e244c2ebae1cef63be", 2221603200],
+    "d4a2fc9fb3c3d803d3575c07a4d024a7c0f200d4": ["TC TrustCenter Class 3 CA II", "8025eff46e70c8d472246584fe403b8a8d6adbf5", 1767221999],
+    "d937b34e05fdd9cf9f1216aeb6892feb253a881c": ["TÜRKTRUST Elektronik Sertifika Hizmet Sağlayıcısı", "b435d4e1119d1c6690a749ebb394bd637ba782b7", 1442398077],
+    "d9743ae4303d0df712dc7e5a059f1e349af7e114": ["UCA Extended Validation Root", "a3a1b06f2461234ae336a5c237fca6ffddf0d73a", 2177366400],
+    "d9fe21406e949ebc9b3d9c7d982019e58c3062b2": ["TrustCor RootCert CA-2", "b8be6dcb56f155b963d412ca4e0634c794b21cc0", 2051198799],
+    "da836302798eda4cc63c2314d88fc320ab286059": ["Certplus Root CA G2", "4f658e1fe906d82802e9544741c954255d69cc1a", 2147126400],
+    "dabb2eaab00cb8882651745c6d03d3c0d88f7ad6": ["GeoTrust Universal CA", "e621f3354379059a4b68309d8a2f74221587ec79", 1867294800],
+    "dc2e1fd1613779e4abd5d5b31271683d6a689c22": ["GLOBALTRUST 2020", "d067c11351010caad0c76a65373116264f5371a2", 2222899200],
+    "dd040907a2f57a7d5253129295ee3880250da659": ["SSL.com Root Certification Authority RSA", "b7ab3308d1ea4477ba1480125a6fbda936490cbb", 2244303579],
+    "dd551713f6ace84821caefb5afd10032ed9e8cb5": ["TÜRKTRUST Elektronik Sertifika Hizmet Sağlayıcısı H6", "8a5c8ceea503e60556bad81bd4f6c9b0ede52fe0", 1702717450],
+    "e04dbfdc9b415d13e864f0a7e915a4e181c1ba31": ["CA 沃通根证书", "1632478d89f9213a92008563f5a4a7d312408ad6", 2196378001],
+    "e08c9bdb2549b3f17c86d6b242870bd06ba0d9e4": ["certSIGN", "fab7ee36972662fb2db02af6bf03fde87c4b2f9b", 1940952004],
+    "e0aa3f258d9f445cc13ae82eae774c843e670cf4": ["Certainly Root R1", "a050ee0f2871f427b2126d6f509625bacc8642af", 2406153600],
+    "e166cf0ed1f1b34bb7062014fe8712d5f6fefb3e": ["Certification Authority of WoSign", "b94294bf91ea8fb64be61097c7fb001359b676cb", 2196378001],
+    "e2c9409f4dcee89aa17ccf0e3f65c529886a1951": ["GDCA TrustAUTH R5 ROOT", "0f36385b811a25c39b314e83cae9346670cc74b4", 2240582399],
+    "e371e09ed8a742d9db71916b9493ebc3a3d114a3": ["IdenTrust Public Sector Root CA 1", "ba29416077983ff4f3eff231053b2eea6d4d45fd", 2021046812],
+    "e3732ddfcb0e280cdeddb3a4ca79b88ebbe83089": ["Class 2 Primary CA", "74207441729cdd92ec7931d823108dc28192e2bb", 1562457599],
+    "e394f5b14de9dba1295b578b4d760676e1d1a28a": ["Chambers of Commerce Root", "6e3a55a4190c195c93843cc0db722e313061f0b1", 2137940024],
+    "e3ab544c80a1db5643b7914acbf3827a135c08ab": ["TC TrustCenter Class 2 CA II", "ae5083ed7cf45cbc8f61c621fe685d794221156e", 1767221999],
+    "e3fe2dfd28d00bb5bab6a2c4bf06aa058c93fb2f": ["CFCA EV ROOT", "e2b8294b5584ab6b58c290466cac3fb8398f8483", 1893380821],
+    "e4af2b26711a2b4827852f52662ceff08913713e": ["GTS Root R1", "e58c1cc4913b38634be9106ee3ad8e6b9dd9814a", 2097705600],
+    "e59d5930824758ccacfa085436867b3ab5044df0": ["Baltimore CyberTrust Root", "d4de20d05e66fc53fe1a50882c78db2852cae474", 1747094340],
+    "e7cec64ffc166796fa4aa307c104a7cb6adeda47": ["EBG Elektronik Sertifika Hizmet Sağlayıcısı", "8c96baebdd2b070748ee303266a0f3986e7cae58", 1471134669],
+    "ecd7e382d2715d644cdf2e673fe7ba98ae1c0f4f": ["DigiCert Trusted Root G4", "ddfb16cd4931c973a2037d3fc83a4d7d775d05e4", 2147169600],
+    "ed4419c0d3f0068beea47bbe42e72654c88e3676": ["IdenTrust Commercial Root CA 1", "df717eaa4ad94ec9558499602d48de5fbcf03a25", 2021047943],
+    "ede76f765abf60ec495bc6a577bb7216719bc43d": ["QuoVadis Root CA 2 G3", "093c61f38b8bdc7d55df7538020500e125f5c836", 2273165972],
+    "ee6b493c7a3f0de3b109b78ac8ab199f733350e7": ["TrustCor RootCert CA-1", "ffbdcde782c8435e3c6f26865ccaa83a455bc30a", 1893432196],
+    "ef914cf5a5c330e82f08ead37122a492687874d9": ["Certinomis - Root CA", "9d70bb01a5a4a018112ef71c01b932c534e788a8", 2013499038],
+    "f0176213553db3ff0a006bfb508497f3ed62d01a": ["Entrust.net Secure Server Certification Authority", "99a69be61afe886b4d2b82007cb854fc317e1539", 1558802380],
+    "f08f593800b3f58f9a960cd5ebfa7baa17e81312": ["TeliaSonera Root CA v1", "4313bb96f1d5869bc14e6a92f6cff63469878237", 1981713650],
+    "f27717fa5ea8fef63d71d568bac9460c38d8afb0": ["HiPKI Root CA - G1", "6a92e4a8ee1bec964537e3295749cd96e3e5d260", 2145887999],
+    "f2c013e082433efbee2f673296355cdbb8cb02d0": ["QuoVadis Root CA 3", "1f4914f7d874951dddae02c0befd3a2d82755185", 1953313604],
+    "f32818cb6475ee292aebedae23583885ebc82207": ["Certainly Root E1", "f9e16ddc0189cfd58245633ec5377dc2eb936f2b", 2406153600],
+    "f5f296887d0df32af94ee734a0bd467e13d616c8": ["Entrust Certification Authority - L1B", "199849d9a9e9f528436c7265302a152cc09bca9e", 1535222666],
+    "f77dc5fdc4e89a1b7764a7f51da0ccbf87609a6d": ["FNMT-RCM", "ec503507b215c4956219e2a89a5b42992c4c2c20", 1893456000],
+    "f924ac0fb2b5f879c0fa60881bc4d94d029e1719": ["Chambers of Commerce Root - 2008", "786a74ac76ab147f9c6a3050ba9ea87efe9ace3c", 2164192190],
+    "f960bbd4e3d534f6b8f5068025a773db4669a89e": ["SSL.com EV Root Certification Authority RSA R2", "743af0529bd032a0f44a83cdd4baa97b7c2ec49a", 2285086477],
+    "fa60a9eb65c5dd1614084e0c0f8d9be0f764af67": ["Certification Authority of WoSign G2", "fbeddc9065b7272037bc550c9c56debbf27894e1", 2362179538],
+    "fa86c9dbe0bae978f54ba8d615dff0d3e16a143c": ["UTN-USERFirst-Network Applications", "5d989cdb159611365165641b560fdbea2ac23ef1", 1562698669],
+    "fb5a48d0802040f2a8e90007691977a7e6c3f4cf": ["emSign ECC Root CA - C3", "b6af43c29b81537df6ef6bc31f1f60150cee4866", 2307897000],
+    "fbef0d869eb0e3dda9b9f121177f3efcf0772b1a": ["emSign Root CA - G1", "8ac7ad8f73ac4ec1b5754da540f4fccf7cb58e8c", 2307897000],
+    "fdda14c49f30de21bd1e4239fcab632349e0f184": ["D-TRUST Root Class 3 CA 2 2009", "58e8abb0361533fb80f79b1b6d29d3ff8d5f00f0", 1888562158],
+    "fea1e0701e2a0339525a42be5c91857a18aa4db5": ["emSign Root CA - C1", "e72ef1dffcb20928cf5dd4d56737b151cb864f01", 2307897000],
+    "feab0090989e24fca9cc1a8afb27b8bf306ea83b": ["Staat der Nederlanden EV Root CA", "76e27ec14fdb82c1c0a675b505be3d29b4eddbbb", 1670497828],
+    "ff182876f948052ca1aef12b1b2bb253f84b7cb3": ["LuxTrust Global Root 2", "1e0e56190ad18b2598b20444ff668a0417995f3f", 2056713717],
+    "ff8231723ef9c4666cad389ed1b05188a590ccf5": ["E-Tugra Global Root CA ECC v3", "8a2faf5753b1b0e6a104ec5b6a69716df61ce284", 2372924818],
+}
+SUBJECTS = {
+    "0219091aabd02ff9312f29f1f8a355c0ba6d5ca2": ["6a39fa4222f7e689004d5e7d3383cbb86e7786af"],
+    "02bbf1ce0639b888d7e09dd7f7b045180c096341": ["350fc836635ee2a3ecf93b6615ce5152e3919a3d"],
+    "03244199cec01bd54aaf10bd6bf1baa3993dcc31": ["6a385b268dde8b5af24f7a54831918e30835a6ba"],
+    "04d5d3f0e71b7495fd312e416715d0098bb15bbd": ["bf5fb7d1cedd1f86f45b55acdcd710c20ea988e7"],
+    "06590cac01542e5a00ddf21a6af0f7bad764d09b": ["1538830f3f2c3f70331ecd46fe078c20e0d7c3b7"],
+    "0815cfd9ef6bf43885a1b773c4c8052c65dcbe55": ["55a98489d2c132bd18cb6ca6074ec8e79dbe8290"],
+    "08e6df3b826e3ff01cd856959869586149a91775": ["c98077e0629282f5469cf3baf74cc3deb8a3ad39"],
+    "09f86230d7245c2d3301b9591a6f2a838aeb4737": ["0d8cb661da44b8d1147dc3be7d5e48f0ceca6ab0"],
+    "0b712c163faa5bc65e3ebd69a2bacf37c530a5d8": ["d3ecc73a656ecce1da769a56fb9cf3866d57e581"],
+    "0c570a9be8243ee0f8131be96657c378f63eea8f": ["c07a98688d89fbab05640c117daa7d65b8cacc4e"],
+    "0c6801dc1f3807a6ae26d74e751ca682cef3b27e": ["4bc5b4406bad1cb3a51c656e46368987050c0eb6"],
+    "0df2a70a4944e74f61a0de66271220301351d4fd": ["4e2254201895e6e36ee60ffafab912ed06178f39"],
+    "0f37bf106f9cff0315a270cdf43895786b73ad1a": ["39958b628b5cc9d480ba580f973f150843cc98a7"],
+    "1253635459f7e5ea5e02a86a0e76f14eb282a231": ["1e824d2865803cc9416eac352e5acbdeeef8395b"],
+    "13691159374b30c800b39018843ec0eb014f631c": ["f924ac0fb2b5f879c0fa60881bc4d94d029e1719"],
+    "145723b0d49a3d0fb8079a400667d079c71dc649": ["03252fde6f82013a5c2cdc2ba169b567d48cd3fd"],
+    "146e6a5eb281fbd06a28819b8e4d106380db2b90": ["9aaf297ac011353526513000c36afe40d5aed63c"],
+    "14fa45ce3383efcc09788d7a9d466b6c79c6af88": ["b3db48a4f9a1c5d8ae3641cc1163696229bc4bc6"],
+    "16d9aff51d2b82305a37d9d7488fb509e1a8da3f": ["1aedfe413990b42459be01f252d545f65a39dc11"],
+    "193b19aaec5df8527ccec48fcb4cc9017009f62b": ["fa60a9eb65c5dd1614084e0c0f8d9be0f764af67"],
+    "1b0663a6bab124a4bb3aaad366542d22a7227ebf": ["5b257b96a465517eb839f3c078665ee83ae7f0ee"],
+    "1baadc8161d6e8a560add53faeef2cc51c4fc7c3": ["d2c4b0d291d44c1171b361cb3da1fedda86ad4e3"],
+    "1c06061f4cd74b6df5cb75c67d10f8feae37173e": ["b599f8afb094f5e320d60aadce4e56a42e6e42ed"],
+    "1dd1eb61ce49111d742a41023fbb1dbcae62fd09": ["d9fe21406e949ebc9b3d9c7d982019e58c3062b2"],
+    "1e5281888a024ed610446d58901696d83272cdf1": ["ae6c05a39313e2a2e7e2d71cd6c7f07fc86753a0"],
+    "1ebdd16440292e062fe4353f9dc09b9e0aff2ccc": ["a8c1c09b91a843157c5d0627b42a51d8970b81b1"],
+    "1f85294a780a993e2ad5cf8890b5515857615892": ["82d1857330e73504d38e0292fbe5a4d1c421e8cd"],
+    "20e8bb399ae3d241e55366efaa0f1ff3960e5ad8": ["071fd2e79cdac26ea240b4b07a50105074c4c8bd"],
+    "21166639d0ec9312c86deeb12b8a6999b459d248": ["b909ca9c1edbd36c3a6baeed54f15b9306352e5e"],
+    "214bb0f64dd97244a535370e2208a1ea3d8ddc0b": ["ccccefcc2960a43bb192b63cfa32628fac25153b"],
+    "2274707930a525ebde7c2a46d1b60f0930071763": ["ede76f765abf60ec495bc6a577bb7216719bc43d"],
+    "23773b475243f325e312799ce2af3a3933887168": ["9c5fd06c63a35f93ca939808ad8c87a52c5cc137"],
+    "23e1258024ba3f6534876048cc3ed0305c56a443": ["c151455059ab3ee72c5afa2022120780887c116a"],
+    "242ebac700f01eb7183437cd59b5976c5deea89d": ["cbd0bda9e1980551a14d37a28379ce8d1d2ae484"],
+    "2654c1277c76656332137e366930f23832193123": ["488714ace3c39e90603ad7ca89eed3ad8cb45066"],
+    "269dbea412362058ef66fdbc3023af90fb9783ff": ["fbef0d869eb0e3dda9b9f121177f3efcf0772b1a"],
+    "275ab382024505bf8980af12f2dd92975dae7d51": ["82212d66c6d7a0e015ebce4c0977c4609e546e03"],
+    "28f8257bac614ba649e6350714d3330501e2af8a": ["711567c8c8c9bd755d72d038186a9df37124540b"],
+    "29462fde55ae1e55e70f0b5978e2f0112596adaf": ["b3037eae36bcb079d1dc9426b611be21b2698694"],
+    "2acec329466a5e5e2b00ead3fe776081e74e2bf0": ["d3948a4c62132a192eccaf728a7d36d79a1cdc67"],
+    "2b2ca6950c1024a7a8479b06402c8c3c430f6a63": ["dd040907a2f57a7d5253129295ee3880250da659"],
+    "2c44b1eca84811efd3f6b48af08e405c0c669bda": ["f0176213553db3ff0a006bfb508497f3ed62d01a"],
+    "2cc8d10cd04d3e3837a9e9e4616d87c313f78655": ["354af54daf3fd78238acab716517758c9d5593e6"],
+    "301f5e7ff59881307f2e935dc9cb847f9e9298e3": ["330ba066d1eadacede6293042852b5147f3868b7"],
+    "302d4f60fdcc1ab3cdd3385b8a4204baf932ebb1": ["26951910d9e8a19791ffdc19d9b5043ed2730a6a"],
+    "3073da7f0a2d699d3fc6de22670f59030939318f": ["a69142fd13614a239e08a429e5d8130423ee4125"],
+    "3113f1cc125d21715df0b020bfb9907e94fa9ae3": ["bbffca8e239f4f99cadbe268a6a51527171ed90e"],
+    "31692b5f0c52f4250aecc4e8887c4842c179a3c6": ["31c3791bbaf553d717e0897a2d176c0ab32b9d33"],
+    "31df7d6f73b7a89876837d9551102b434cf3bf69": ["4d262022894bd3d5a40aa16fdee21281c5f13c2e"],
+    "3279b7f8106ededc5a159adebd30628cec6654b5": ["a34106ac906dd14aeb75a54a1099b3b1a18b4af7"],
+    "32ddc1e0bb990ffe59286540ec36296b9d79de8a": ["1a8462bc484c332504d4eed0f603c41946d1946b"],
+    "34653d5b24ef18e0e193a750ba57841e61002cae": ["bea8a07472506b44b7c923d8fba8ffb3576b686c"],
+    "355cc06cc9a8cbe826ab9bf9d3686cc5ce7a0b4e": ["653fc78a86c63cdd3c545c35f83aed520c4757c8"],
+    "362acdf372a7148e8177af954fa3708e1178be66": ["449e48f5cc6d48d4a04b7ffe59242f8397999a86"],
+    "37052949348ee98ee8a32546eb1c664dd088d720": ["2ee3dbb249d09c54795cfa272afecc4ed2e84e54"],
+    "39d2b8c1a3ae0d64b15028a9ceadd6d436f90733": ["c4a7b1a47b2c71fadbe14b9075ffc41560858910"],
+    "3c026cd65520b4e606d2e1b5103a7e0ccedfc451": ["804cd6eb74ff4936a3d5d8fcb53ec56af0941d8c"],
+    "3c4cbbe7e5d1f29fe33922da175c49bf8e4e2818": ["f32818cb6475ee292aebedae23583885ebc82207"],
+    "3c702a0466067d6259f3f21585790234bf758641": ["45d9a5816e3d884d8d71d246c16e451ef3c4809d"],
+    "3c99f0658bd3b8a37193accc25b9e5a95a775bff": ["c14bed70b6f73e7c003b008fc73e0e459f1e5dec"],
+    "3e869a436d021a80acedab72072ac42f2d613822": ["b6087b0d7accac204c8656325ecfab6e852d7057"],
+    "3f106140e5ee4de5f25d499c5898fa9a5328913d": ["76f355e1faa436fbf09f5c6271ed3cf44738102b"],
+    "3fdf3179eceb4b4b6e36d12a68aa02261d4e5b9b": ["d9743ae4303d0df712dc7e5a059f1e349af7e114"],
+    "40241af3f6e83ef9cde04be1bd31f28af5b69c30": ["3a9a8507106728b6eff6bd05416e20c194da0fde"],
+    "411e4d0b15f59baee9519d6f2fde970ea24859a1": ["72ace43379aa4587f6fdac1d9ed6c72f86d82439"],
+    "42b8c7a64ddd8f3dce1ed453d8f96768345d5a81": ["7c0c321fa7d9307fc47d68a362a8a1ceab075b27"],
+    "43e5da6c13c74c92bb735be40d1e1d0603457684": ["3814e6c8f0a9a403f44e3e22a35bf2d6e0ad4074"],
+    "45d337f3f2e6cf49af13418630e6e535e9dd619d": ["ff182876f948052ca1aef12b1b2bb253f84b7cb3"],
+    "481f03d71a745d585ba3e06af9d19a9427c083ff": ["cec34ab99955f2b8db60bfa97ebd56b59736a7d6"],
+    "481f89a7a9130f1369dbbf18d0a0fd2a62a1e9da": ["c479ca8ea14e031d1cdc6bdb315b943e3f307f2d"],
+    "49dcbe35e1740994e56c3d6fde9dfca82c0651ee": ["5332d1b3cf7ffae0f1a05d854e92d29e451db44f"],
+    "4b07edbefd84e155494b7592542f595f37e236a5": ["e0aa3f258d9f445cc13ae82eae774c843e670cf4"],
+    "4b0c0cb30d159d396ab3fcdd0462a78d55923944": ["974621572135da3655c7f3f13770e508f69329b6"],
+    "4c209abe060ad1f20c893a49385ea3809cd0bd26": ["f960bbd4e3d534f6b8f5068025a773db4669a89e"],
+    "4c4e048677998c47f55d6ecdc15d6fb4dee20d94": ["f08f593800b3f58f9a960cd5ebfa7baa17e81312"],
+    "4cc1426de4ba1f5d23bc284412576b2f7066836a": ["ed4419c0d3f0068beea47bbe42e72654c88e3676"],
+    "4ed11c5289ba743c62c3962f69927e338b50d11b": ["a073499968dc855b65e39b282f579fbd33bc0748"],
+    "51c1a4b776d5e04336dba99c27f86775b321a386": ["5bf84d4fb2a586d43ad2f1639aa0be09f657b7de"],
+    "53c4e17bc69f235b0dfbd400cdd589ca4f22ea90": ["ecd7e382d2715d644cdf2e673fe7ba98ae1c0f4f"],
+    "54225b9c2ce15490b4013259461ffa7014a39d14": ["54adfac79257aeca359c2e12fbe4ba5d20dc9457"],
+    "544f814f53389a66259ccb44dd1468dd70746bef": ["4aa0aa5884d35e3c"],
+    "561700b2f7bc0c3828aca5776078f7bf7a161d94": ["713836f2023153472b6eba6546a9101558200509"],
+    "59530af075e84265017699160f5a1d5d76783a56": ["f77dc5fdc4e89a1b7764a7f51da0ccbf87609a6d"],
+    "5a6d54546451990d5948688f54087e130fa49ab3": ["dabb2eaab00cb8882651745c6d03d3c0d88f7ad6"],
+    "5f129e9c9f97bd857218ff27e9f7dad937793bae": ["0a85a9776505987c4081f80f972c38f10aec3ccf"],
+    "6188e34f1826876f5d11e3f2bc1eb311abcf19fe": ["5699071ed3ac0c6964b40c5047de432cbe20c0fb"],
+    "61bc752851dee05ca3b7a11779e7c527674f3193": ["8868bfe08e35c43b386b62f7283b8481c80cd74d"],
+    "61da82f42dec3011c836aeecebc047a8467562fc": ["ccfa6793f0b6b8d0a5c01ef353fd8c53df83d796"],
+    "61ff6948bbb1b2e88ee45c06a229d40cc6979dfc": ["92a4752ca49ebe8144eb79fc8ac595a5eb107573"],
+    "637c443e2562468473a5a73e58e197006847d1a7": ["7c4296aede4b483bfa92f89e8ccf6d8ba9723795"],
+    "64304e1021564f95ce0a1719e563713268494c97": ["861ce7fe2da54a8b08fe2811fabea366f860592f"],
+    "64598f509e13225ea08bd7bfb821a064e985b9d6": ["fdda14c49f30de21bd1e4239fcab632349e0f184"],
+    "64d1ca6f1179d9d6dab44461dcf636258eece568": ["47b8cdffe56feef8b2ec2f4e0ef925b08e3c6bc3"],
+    "65451bd6c4fa16c783f2a734aac5f43e1459cb0c": ["ee6b493c7a3f0de3b109b78ac8ab199f733350e7"],
+    "656dfb445f6d6a7f3c11a9531d8db74afdec2e3c": ["e166cf0ed1f1b34bb7062014fe8712d5f6fefb3e"],
+    "67bd35746e3aa79b902c6d2455440dd88a771aa7": ["c617d0bca8ea0243f21b06995d2b9020b9d79ce4"],
+    "69c3fff26813f00dc38dcdaff9224926a4d7574b": ["91683287151d89e2b5f1ac3628348d0b7c6288eb"],
+    "6a162560ce93ed42e1731dca20a4ba0077a46a96": ["51331ced3640af17d325cd6968f2af4e233eb341"],
+    "6ae748996b056897d889218f755463c23af8d108": ["b00cf04c30f405580248fd33e552af4b84e36652"],
+    "6e690c94f1ee12b6edbd111a9ecd2876d7d659c6": ["0876cdcb07ff24f6c5cdedbb90bce284374675f7"],
+    "6ed54373e66f861fca63fcc7a7250bff40f54758": ["09cb597f86b2708f1ac339e3c0d9e9bfbb4db223"],
+    "70097c5cde4f8ac5a43db3e02e30cb1feb6a72c0": ["a87debbc63a474137400ec96e0d334c12cbf6cf8"],
+    "7158f8ef403bf046f845718afe0f3cb530d45af4": ["29c590ab25af11e461bfa3ff886191e60efe9c81"],
+    "732e4080bc0810850423e7ee7b359a508fae9193": ["cb0fc6df4243cc3dcbb54823a11a7aa62abb3468"],
+    "74570e2ddb9a2231dd05507ff2dd5349fcac77df": ["6a797e91694618130a0277a5595b6098250ea2f8"],
+    "76b05b02a95b64dca69eb460ce960a44264bb5d3": ["aafdd55aa3f6878b3285fdd1325b804593f303b8"],
+    "771e9594fed7228f46be5216ca06e15b7d55ac3b": ["c7a04975166184db314b84d2f1374090ef4edcf7"],
+    "772569fd543e922c1e191c22c9e54c0367e3abd1": ["c57b58bdedda2569d2f75916a8b332c07b275bf4"],
+    "786b19a4a1b66fb11cd9c47fb8cbc9cb33a3972c": ["607b661a450d97ca89502f7d04cd34a8fffcfd4b"],
+    "7882602ca9c66c0826ecea3fb0f8171c882b196d": ["bafa7125798b57412521860b71ebb2640e8b2167"],
+    "79859ffb35f469c8588078f42377fe4dcaf15984": ["035cab738187a8ccb0a6d594e2369649ff05992c"],
+    "79fa966d541a1d156a8b0843e081b992255c5b88": ["890ab438931ae6abee9b9118f9f53c3e35d0d382"],
+    "7a73aa2c402766213d02c77d53b590676d88179e": ["01b92fefbf118660f24fd0416eab731fe7d26e49"],
+    "7ac4492fe7a858f3d24fc6589181da2540b37b67": ["e08c9bdb2549b3f17c86d6b242870bd06ba0d9e4"],
+    "7ad3956c8987c5f3d10dad78f35ab4bc287e6247": ["0b58e58bc64c1537a440a930a921be47365a56ff"],
+    "7ae8102d907bae37bbe137bd6a08f7c1363d5271": ["8f81f0daa6cd743cbe66f4156b46a4fe0628ccaa"],
+    "7b436b88249a512422ea7e8729bb06fd3ff40def": ["54b07bad45b8e2407ffb0a6efbbe33c93ca384d5"],
+    "7d0f0ccf571e4d83bee092853c0e79d3956f9c7a": ["739110abff55b35a7c0925d5b2ba08a06bab1f6d"],
+    "7e610839f76ce44f1a40d001f4b485d19eeb027d": ["179dcd1e8bd6392b70d35cd4a0b81fb000fcc561"],
+    "7e9e2869ec52ee21adbfda5cc246dfcc6598f2a4": ["509e0beaaf5eb92048a6506acbfdd8207aa78276"],
+    "7eafda58e0791d42ec21591c78cd682f6e7d3600": ["45eba2aff492cb82312d518ba7a7219df36dc80f"],
+    "82bf2932c090aeb7db14a47f464bd462a15047e3": ["d287b4e3df37279355f656ea81e536cc8c1e3fbd"],
+    "8405a04a21f4ada4d1ddc5fface61552da3a5805": ["8b4b6dedd329b90619ec3939a9f097846acbefdf"],
+    "84371c960a55d6823a5cc3c21372a03dd107d7e2": ["00add9a3f679f66e74a97f333d8117d74ccf33de"],
+    "85fd0680b72eed75d6594accdd83c7f213515e4e": ["abb6dbd7069e37ac3086079170c79cc419b178c0"],
+    "88cae6b26f06e32f3b3d02f7abcf5d87f24bd743": ["60b585ec56647e121927671d50154b73ae3bf912"],
+    "89454ae34df13ab821a0a5e4a4373d1a1d0ef437": ["f2c013e082433efbee2f673296355cdbb8cb02d0"],
+    "89c595cbb62469bc54e2cf63bbaf22473ab7d183": ["b677fa6948479f5312d5c2ea07327607d1970719"],
+    "8a7c0cec953d63945a202dbca0d2672e5edf7dff": ["0972064e18430fe5d6ccc36a8b317b788fa883b8"],
+    "8bc3b9398287fca5368db1f78b2cc62551d58278": ["a3052f186050c2890add2b214fff8e4ea8303136"],
+    "8bd5af518195ce1139493b6569b72b644598f0c1": ["c1f126baa02dae8581cfd3f12a12bdb80a67fdbc"],
+    "8dbd7428f3eed5c22bc26fe9252c9147789d0eef": ["3de629489bea07ca21444a26de6eded283d09f59"],
+    "8dcd418665141d1597c91179eefdbdfbaaecb6b6": ["b4220b829924010e9cbbe40efdbffb972093992a"],
+    "8feb56a075b171899d2f19da619194a7a419f1a3": ["bbaf7e023dfaa6f13c848eadee3898ecd93232d4"],
+    "917b854595d196dd6c8a8602c98ee54ba9894350": ["ad6caa94609cede4fffa3e0a742b6303f7b659bf"],
+    "918508f1af66e3e1539f5e04dab5e0c53a72f719": ["8cfb1c75bc02d39f4e2e48d9f96054aac4b34ffa"],
+    "9217c33294d9a3b135bcaffc55f88202addd7a74": ["a1725f261b289843955d0737d585969d4bd2c345"],
+    "9224231f2f181d8a1eb71a020509421e67a73dd8": ["545acb263f71cc94460d9653ea6b48d093fe4275"],
+    "92487d5b71e3ff0d20994b8601d75467eef7fe8f": ["9fee44b394d5fa914f2ed9559a0456db2dc4dba5"],
+    "938d2fe8d919c2cb5144a292c0a63e60a6b4aff1": ["2130c9fb00d74e98da87aa2ad0a72eb14031a74c"],
+    "944ba87485882760b2e0271b6ec7098b5b108129": ["310a908fb6c69dd2444b80b5a2e61fb1124f1b95"],
+    "9554bdfa575ea9b3fe07f6cf41d9df88b48aa969": ["e394f5b14de9dba1295b578b4d760676e1d1a28a"],
+    "96a1ddd93d18972ddf46e4028ccf9811fe981c97": ["155f35575155fb25b2ad0369fc01a3fabe1155d5"],
+    "9903b22f08722dfeffd8fde992087e6293510044": ["fea1e0701e2a0339525a42be5c91857a18aa4db5"],
+    "992e8aa78125bca8db8f1805fd9671c23506ef42": ["fa86c9dbe0bae978f54ba8d615dff0d3e16a143c"],
+    "997f3c79eaf30be8e5e67971baf0c15aadf6ae40": ["1e0cf7b667f2e192260945c055392e773f424aa2"],
+    "99e969992d6d7d3f18206c511580cea84e01f7c4": ["a1e19e4525794d06d902179282d53089722514a0"],
+    "9a7bbfb6918cd8b5dced88414753f1929eb5a394": ["87111508d1aac1780cb1afcec6c990efbf3004c0"],
+    "9c1000249c0223c277b23ad805043b3b19d0d73b": ["8db249689d720825b9c027f5509356484671f98f"],
+    "9d078ab1653c8e8d610b1410e02387ad8795166f": ["e04dbfdc9b415d13e864f0a7e915a4e181c1ba31"],
+    "9da7a1bc20d2518f5e4ab2c230896f666c4bc78c": ["7fd365a7c2ddecbbf03009f34339fa02af333133"],
+    "9e3c6ada68c82b83ef64ed22dbe575607348e591": ["ef914cf5a5c330e82f08ead37122a492687874d9"],
+    "9e50a8d5163f659c45481d2dfe672f01b077a9cc": ["7c5d028413d4cc8a9b81ce171c2e291e9c486342"],
+    "9e55364f93898da59ede9da3dde6a8f420bf528a": ["9c5f00dfaa01d7302b3888a2b86d4a9cf2119183"],
+    "9fdc6b2f7503d01caa8d5afc554590a2762fbac7": ["409a7644977407c4ac14cb1e8d4f3a457c30d761"],
+    "9ff984f55e2c043557b54a75d4816bb97d757a36": ["dc2e1fd1613779e4abd5d5b31271683d6a689c22"],
+    "a005bf21a730e4d034318d6a3560ae98eb0dd981": ["f27717fa5ea8fef63d71d568bac9460c38d8afb0"],
+    "a01e5d8cf558215c289597adf76bf4362fd4fb3a": ["bf5920360079a0a0226b8cd5f261d2b82ccb824a"],
+    "a08b199b7d8628c1299fe6085f69655b19e25a40": ["a0110a233e96f107ece2af29ef82a57fd030a4b4"],
+    "a107a5ed0be00d1a65e2ab70639abcf82c567cb2": ["4e43c81d76ef37537a4ff2586f94f338e2d5bddf"],
+    "a14a279e2c2669b268d384757b1d8104ebf450cd": ["a6b3e12b2b49b6d773a1aa94f501e773654cac50"],
+    "a19d79b4f1b17332fe676d480e6fd5379667aa22": ["a7a506b12ca60960eed197e970aebc3b196cdb21"],
+    "a2556bf33561e95a50cf74562ca2188961f70b1c": ["b2b4aee62df726d5aa752d764bc01b5321d048ef"],
+    "a2662d6b1bb7663a445c2a5eba95c9b963cd8ed5": ["c91b538112fe04d516d1aabc9a6fb7a095196eca"],
+    "a35b50389f389ad4a52c9df678927591ba8017b7": ["7b35d340d21c781966ef741028dc3e4fb27804fc"],
+    "a468005c219d171f114c6e8244c9e5e521ff7ce4": ["e3732ddfcb0e280cdeddb3a4ca79b88ebbe83089"],
+    "a5c36a9b9ec450e4ef2b4056320fcbb1d64eb4b3": ["adbd987a34b426f7fac42654ef03bde024cb541a"],
+    "a68ba74b136fc474528a2d4b9a282f29cca07827": ["64147cfc587216a60a2934156f2acbbcfcafa8ab"],
+    "a7d1593f86c906f820ff0cb510c75431bb4cd3aa": ["8ff04b7fa82e4524ae4d50fa639a8bdee2dd1bbc"],
+    "a89193307b8c91108aecf455988761cd36e667d7": ["bd8887c98ff6a40a0baaebc5fe91239dab4a8a32"],
+    "a8b8aadd3054239e95cbb5df09f4faad1648a570": ["d29f88dfa1cd2cbdecf53b0101933327b2eb604b"],
+    "a9004d2ef8f99a3437208b0d0de3c12fcb010fe1": ["6890e467a4a65380c78666a4f1f74b43fb84bd6d"],
+    "aaf11528a61b57b5cc3ed786ec3e274eeed36667": ["ff8231723ef9c4666cad389ed1b05188a590ccf5"],
+    "ab9f94bec948d07a83fd6c868f05a19fdffa6485": ["4232b616fa04fdfe5d4b7ac3fdf74c401d5a43af"],
+    "ade32ac0aadef3379fb66ea939596c3666ffe5cb": ["a0c38b44aa37a545bf97805ad1f178a29be95d8d"],
+    "af2794acf5ff981b9fe475d86b95a3ccdfc4fdb8": ["c8cb997270520cf8e6beb20457292acf4210ed35"],
+    "af7f1afc7ec8cf6026bb30fa82619ca363acb1fa": ["e3fe2dfd28d00bb5bab6a2c4bf06aa058c93fb2f"],
+    "afcb6e27ed18f7fc2fe7cc6fc7b341e115f7782e": ["3f8d9a598bfc7b7b9ca3af38b039ed907180d6c8"],
+    "aff0012c44a585ab963cddb628fcf0627aa8d0ef": ["b6a1543902c3a03f8e8abcfad4f81ca6d13a0efd"],
+    "b3cff9bfd2bcd1b5044bf3213e03d1ec3a644356": ["5379bf5aaa2b4acf5480e1d89bc09df2b20366cb"],
+    "b519c6b81fe13015df2a5ffcd769c10a6ad0647f": ["b13ec36903f8bf4701d498261a0802ef63642bc3"],
+    "b62cd3e5f352893bb8f3b62bee49c28d0bc7951f": ["7c724b39c7c0db62a54f9baa183492a2ca838259"],
+    "b6de3b5d29f8380710ecb3a0a3f992da996c2e7c": ["6c6401c7fd856dacc8da9e50088508b53c56a850"],
+    "b8bd47f63226b8bff0fe324f5c804a8f8767aab7": ["95b1b4f094b6bdc7dad1110921bec1af49fd107b"],
+    "b9ab63ea6e4030151305f8c314943e5c68bd81b4": ["48e668f92bd2b295d747d82320104f3398909fd4"],
+    "baaf33b461af2ccd16388580b143d2dcfe29de65": ["e59d5930824758ccacfa085436867b3ab5044df0"],
+    "bbd845fb998157862b70bcd3051d5142c9131654": ["e371e09ed8a742d9db71916b9493ebc3a3d114a3"],
+    "bd72497300125297806317d32c667b7d0dd414db": ["dd551713f6ace84821caefb5afd10032ed9e8cb5"],
+    "be0aa8a3aa71e536a1936375980e78086350a06b": ["feab0090989e24fca9cc1a8afb27b8bf306ea83b"],
+    "c319b48da5df374b41cbe1235ecb8202d675b534": ["446a95675579114f"],
+    "c342121457d6cc16533d43a92d4673a6a58c7403": ["56e7e15b254380e0f68ce171bc8ee5802fc448e2"],
+    "c3f01a696fde7964a4c0d3ddd29e941a6c673a28": ["b763e71add8de908a65583a4e06a504165114249"],
+    "c4e87465ab0b10b3fce7b8d97580b29b288f7b98": ["e2c9409f4dcee89aa17ccf0e3f65c529886a1951"],
+    "c50a556a6486c0f004abde63e97b936423de2408": ["d937b34e05fdd9cf9f1216aeb6892feb253a881c"],
+    "c55f229aa3d1224bc1df9061259e445595aa5c14": ["e7cec64ffc166796fa4aa307c104a7cb6adeda47"],
+    "c5c097fbd34284ec39f7e2af41bab86439d3f6ef": ["15a69680b1154b31c3c29cf6e7130b4bf318cd86"],
+    "c75eeb9fa134a1076b5c8788cd69e6a0679656b2": ["5bca5ee5ded281aacda82d6451b6d9729b97e64f"],
+    "c77b9f7d2194369cb7fa88a2959d66129e41d462": ["d4a2fc9fb3c3d803d3575c07a4d024a7c0f200d4"],
+    "c77e2a6b86bf99e85854db7b6448ace546994a26": ["9f38c45623c339e8a0716ce8544ce4e83ab1bf67"],
+    "c90b63ce1d2a5bc6e0d56875de27a0d8082933f1": ["7f100116373aa428e450f8a4f7ec6b32b6fee98b"],
+    "cc0128aaf2ded35c196a929774bd3c889e04724d": ["a397d6f35ea210e1ab459f3c17643cee01709ccc"],
+    "cf739f989ea4ae44fd727976395610f36c834bb2": ["439c369fb09e304dc6ce5fad10abe503a5faa914"],
+    "d17fed82fe6cb06c49ced8c5c9c739d7ad311b4a": ["81c48cccf5e430ffa50c085f8c1567217401dfdf"],
+    "d2ffecfbc62fc2cf3804c178c2f91e4e03ae86a2": ["6a72267ad01eef7de73b6951d46c8d9f901266ab"],
+    "d43a5d9a2ebdc4c878dd3f8b1495a02af7fe3d59": ["3ae10986d4cf19c29676744976dce035c663639a"],
+    "d6594d5481c049c2c65219d0b0def8f4e7e9826b": ["8d06667424763af389f7bcd6bd477d2fbc105f4b"],
+    "d673921cf624a76ceb42ec1c5d5b5a4cad2b41f5": ["8418cc8534ecbc0c94942e08599cc7b2104e0a08"],
+    "d865d5ea87d44d8794992ad27278f728d559400f": ["da836302798eda4cc63c2314d88fc320ab286059"],
+    "dc061db84298bdcd93179f2ee8eef894343f71c8": ["069a9b1f537df1f5a4c8d3863ea17359b4f74421"],
+    "dd53e688002a017f17ffce738df855593e5838ad": ["17a0cdc1e441b63a5b3bcb459dbd1cc298fa8658"],
+    "deb2f9dda28c901388b67ce80826d57dddc97f59": ["bfb627d8035a76654c6101415631e58b7b3ad9cc"],
+    "df9401f2be900ca3d2e3855b1d8b009c66874dcd": ["07c35130a4aae945ae3524faff242c33d0b19d8c"],
+    "e07f2516f7af5f79e48fe43ee8666e3f748518b4": ["99e019670d62db76b3da3db85be8fd42d2310e87"],
+    "e09a3a00d995abcc5a7ea3f70e5aba3bae4db8a3": ["b31691fdeea66ee4b52e498f87788180ece5b1b5"],
+    "e0df594c9244ea7c0df0382af6c6d0a548935330": ["4d45c16838bb73a969a120e7edf522a12314d79e"],
+    "e198b587a7a099e6258ad3ac9026efb0a0702bb5": ["54627063f1758443588ed11620b1c6ac1abcf689"],
+    "e27630646317229d8830ddee8bd6160fb8f06720": ["4e0bef1aa4405ba517698730ca346843d041aef2"],
+    "e2ad68f881f32bb2ed1bf49ee23e2df4530b864f": ["813e37d892b01f779f5cb4ab73aae7f634602ffa"],
+    "e3f8ed9088ad414e87286320ec3e04edfd1c1bb0": ["9839cdbed8b28cf7b2abe1ad24af7b7ca1db1fcf"],
+    "e56846522727987b7b685d1cc81463e6d37f604e": ["03de503556d14cbb66f0a3e21b1bc397b23dd155"],
+    "e5e932e18593c8a370e17a9ab2d905e60f43d7d3": ["9be20757671c1ec06a06de59b49a2ddfdc19862e"],
+    "e6a7f1bf64bb07201a551069452e6f2d24e7cd15": ["e3ab544c80a1db5643b7914acbf3827a135c08ab"],
+    "e859e96b05fd81b474004fd4d74b3ee7ee3ced0e": ["9d93c6538b5ecaaf3f9f1e0fe59995bc24f6948f"],
+    "ea064f4fff32fa12a9872f25861f1cfc3344ab20": ["af4404c2417e4883db4e3902ecec847ae6cec9a4"],
+    "ea153d8653f733d8ac59b630e0062b41c2e0d807": ["b503f7763b61826a12aa1853eb032194bffececa"],
+    "eb14e835c93ea9e48537d692145bfe387de6bc3d": ["7b5b45cfafcecb7afd31921a6ab6f346eb574850"],
+    "ebb1ba4e0c34675f11c84ed858b36b48c0734a44": ["4777c3148b62390cc96fe1504dd01058dc95886d"],
+    "eec047738df6eac2f38401b6384e55d8e06b8600": ["50afcc078715476f38c5b465d1de95aae9df9ccc"],
+    "efc62b54de23a4b4b4ad23f2bc901174e0431a19": ["04aa7a47a3e489af1acf0a40a7183f6fefe97dbe"],
+    "f05b5e919642345d282f3416a43f8966de1bd1d4": ["3cd89388c2c08209cc0199069320e99e7009634f"],
+    "f1f56a8817a33ffb47237489007a13660f89390a": ["2cd5504197158bf08f36615b4afb6bd999c93392"],
+    "f21d3f80dc5337b802d157a262f137bcc7593e43": ["65cdebab351e003e7ed574c01cb473470e1a642f"],
+    "f45c094138a35d8bb5b4476e8885e08862299768": ["9ad8003000e76b7f8518ee8bb6ce8a0cf811e1bb"],
+    "f4cf059991a72ec6d924cea09f6f01b95fb5ce0c": ["7571a7194819bc9d9dea4147df94c4487799d379"],
+    "f5cdd816efbd9a1b83f9de87396e8ff72c89302f": ["4a78325211db5916365edfc11436406a477c4ca1"],
+    "f664f6955a88a5acbcb7b611f795f6cdfc49190e": ["65f231ad2af7f7dd52960ac702c10eefa6d53b11"],
+    "f708d5ce8007cc67a304171418b9b2d3941392a8": ["e4af2b26711a2b4827852f52662ceff08913713e"],
+    "f8548ca4c05d5d9a58b58705b475880c4e285fcb": ["c64fa23d066384099cce62e404ac8d5cb5e9b61b"],
+    "f8d7f361f2e20a4431fcabb7422321a937086256": ["2e16a94a18b5cbccf56f50f3235ff85de7acf0c8"],
+    "fa4dee2cead5cc54ebc13fe66cf1a3a405ac25e6": ["9dc067a60c22d926f545aba665521127d845ac63"],
+    "fa923f58385810e4f86194f7f4594cf04368ee47": ["f5f296887d0df32af94ee734a0bd467e13d616c8"],
+    "fae0de24d22086c90bc74a44e284cc597a74fdd7": ["1d1c650ea8f2257bb491cfe4b1b1e6bd55746c05"],
+    "fb621bc7bfc06d91f68814568b40820a14ae3dc9": ["0a4823a660a4920a33ea935bc557ea254dbd12ee"],
+    "fb93665af40d5af195c83ede36d65fe757e3c375": ["55e481d11180bed889b908a331f9a1240916b970"],
+    "fc628024ee45682300f88db14c8a6731b8d372bf": ["52d8883ac89f7866ed89f37b387094c9020236d0"],
+    "fcfbd834e25ddca54c99ad06effa7ffef949012d": ["188756e06e77ee24353c4e739a1fd6e1e2797e2b"],
+    "fd4548f7c039d776e1967ba87840a4df11e1f415": ["12f25a3eea561cbfcd06acf1f125c9a94bd41499"],
+    "fe5a64ccff5aabe68c4b0dc39b885b7c301daf5d": ["79b459e67bb6e5e40173800888c81a58f6e99b6e"],
+    "ff5ca5da2e3f771d6269d85a8109df2720f012d1": ["fb5a48d0802040f2a8e90007691977a7e6c3f4cf"],
+}
@@ -0,0 +1,304 @@
+"""
+Binary trust database (.tlsdb) for sharing one page-cached copy of the stores
+
+Layout, little-endian, every section at a fixed offset recorded in the header:
+
+    header      MAGIC, store/record/DER counts and the section offsets
+    stores      int32 context type per store column
+    index       record_count fixed-width key records, sorted by their bytes. An
+                SKI is its length and bytes, a "dn:" key is its subject hash
+                with DN_TAG set in the length byte
+    bitmaps     per store, a PRESENT bitmap then a DISTRUSTED bitmap over records
+    refs        per store, uint32 DER number per record (NO_DER when absent)
+    ders        per DER, uint64 offset, uint32 length, int64 not_valid_after
+    blobs       the DER certificates
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from binascii import unhexlify, Error as BinasciiError
+from pathlib import Path
+from tlstrust import context, stores
+
+__module__ = "tlstrust.stores.tlsdb"
+
+MAGIC = b"TLSDB\x00\x01\x00"
+HEADER = struct.Struct("<8sIIIIQQQQQQ")
+STORE = struct.Struct("<i")
+RECORD = struct.Struct("<B32s")
+REF = struct.Struct("<I")
+DER = struct.Struct("<QIq")
+MAX_SKI_BYTES = 32
+DN_TAG = 0x80
+NO_DER = 0xFFFFFFFF
+
+
+class InvalidDatabaseError(ValueError):
+    """Raised when a file is not a readable .tlsdb trust database"""
+
+
+def _ski_key(key_identifier: str) -> bytes:
+    """The index record for an SKI or "dn:" key, None when it cannot be one"""
+    tag = 0
+    if isinstance(key_identifier, str) and key_identifier.startswith(
+        stores.SUBJECT_KEY_PREFIX
+    ):
+        key_identifier = key_identifier[len(stores.SUBJECT_KEY_PREFIX) :]
+        tag = DN_TAG
+    try:
+        raw = unhexlify(key_identifier)
+    except (BinasciiError, TypeError, ValueError):
+        return None
+    if not raw or len(raw) > MAX_SKI_BYTES:
+        return None
+    return RECORD.pack(tag | len(raw), raw.ljust(MAX_SKI_BYTES, b"\x00"))
+
+
+class TrustDatabase:
+    def __init__(self, path):
+        self.path = Path(path)
+        self._view = None
+        with open(self.path, "rb") as handle:
+            try:
+                self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as ex:
+                raise InvalidDatabaseError(f"{self.path} is not a tlsdb file") from ex
+        self._view = memoryview(self._mmap)
+        if len(self._view) < HEADER.size:
+            self.close()
+            raise InvalidDatabaseError(f"{self.path} is not a tlsdb file")
+        (
+            magic,
+            self.store_count,
+            self.record_count,
+            self.der_count,
+            _,
+            stores_offset,
+            self._index_offset,
+            self._bitmaps_offset,
+            self._refs_offset,
+            self._ders_offset,
+            self._blobs_offset,
+        ) = HEADER.unpack_from(self._view)
+        if magic != MAGIC:
+            self.close()
+            raise InvalidDatabaseError(f"{self.path} is not a tlsdb file")
+        self._bitmap_size = (self.record_count + 7) // 8
+        if not self._fits(stores_offset):
+            self.close()
+            raise InvalidDatabaseError(f"{self.path} is truncated or corrupt")
+        self.contexts = tuple(
+            STORE.unpack_from(self._view, stores_offset + STORE.size * index)[0]
+            for index in range(self.store_count)
+        )
+        self._columns = {ctx: index for index, ctx in enumerate(self.contexts)}
+
+    def _fits(self, stores_offset: int) -> bool:
+        """Whether the sections follow in order and every DER blob is inside the file"""
+        sections = (
+            (HEADER.size, 0),
+            (stores_offset, STORE.size * self.store_count),
+            (self._index_offset, RECORD.size * self.record_count),
+            (self._bitmaps_offset, self._bitmap_size * 2 * self.store_count),
+            (self._refs_offset, REF.size * self.record_count * self.store_count),
+            (self._ders_offset, DER.size * self.der_count),
+            (self._blobs_offset, 0),
+        )
+        for (offset, size), (following, _) in zip(sections, sections[1:]):
+            if following < offset + size:
+                return False
+        if self._blobs_offset > len(self._view):
+            return False
+        der_table = self._view[
+            self._ders_offset : self._ders_offset + DER.size * self.der_count
+        ]
+        blobs_end = max(
+            (offset + length for offset, length, _ in DER.iter_unpack(der_table)),
+            default=0,
+        )
+        der_table.release()
+        return self._blobs_offset + blobs_end <= len(self._view)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def close(self):
+        if self._view is None:
+            return
+        self._view.release()
+        self._view = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # slices returned by get_der keep the mapping alive until released
+            pass
+
+    def _record(self, position: int) -> bytes:
+        offset = self._index_offset + RECORD.size * position
+        return bytes(self._view[offset : offset + RECORD.size])
+
+    def find(self, key_identifier: str) -> int:
+        """Binary search of the sorted SKI index, the record number or None"""
+        key = _ski_key(key_identifier)
+        if key is None:
+            return None
+        low, high = 0, self.record_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._record(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.record_count and self._record(low) == key:
+            return low
+        return None
+
+    def _bit(self, column: int, bitmap: int, position: int) -> bool:
+        offset = (
+            self._bitmaps_offset
+            + (column * 2 + bitmap) * self._bitmap_size
+            + position // 8
+        )
+        return bool(self._view[offset] & (1 << (position % 8)))
+
+    def _der_number(self, column: int, position: int) -> int:
+        offset = self._refs_offset + (column * self.record_count + position) * REF.size
+        return REF.unpack_from(self._view, offset)[0]
+
+    def lookup_trust(self, key_identifier: str, context_type: int) -> tuple[int, int]:
+        """Same answer as tlstrust.stores.lookup_trust, read from the database"""
+        column = self._columns.get(context_type)
+        position = self.find(key_identifier)
+        if column is None or position is None:
+            return 0, 0
+        flags = 0
+        not_valid_after = 0
+        if self._bit(column, 0, position):
+            flags |= stores.PRESENT
+            number = self._der_number(column, position)
+            _, _, not_valid_after = DER.unpack_from(
+                self._view, self._ders_offset + DER.size * number
+            )
+        if self._bit(column, 1, position):
+            flags |= stores.DISTRUSTED
+        return flags, not_valid_after
+
+    def get_der(self, key_identifier: str, context_type: int) -> memoryview:
+        """Zero-copy slice of the store's DER for the SKI, None when absent"""
+        column = self._columns.get(context_type)
+        position = self.find(key_identifier)
+        if column is None or position is None:
+            return None
+        number = self._der_number(column, position)
+        if number == NO_DER:
+            return None
+        offset, length, _ = DER.unpack_from(
+            self._view, self._ders_offset + DER.size * number
+        )
+        return self._view[
+            self._blobs_offset + offset : self._blobs_offset + offset + length
+        ]
+
+
+def open_db(path) -> TrustDatabase:
+    return TrustDatabase(path)
+
+
+def write_db(path, contexts: list[int] = None) -> Path:
+    """Write the packaged trust stores to path in the .tlsdb format"""
+    contexts = list(contexts or stores.STORE_MODULES)
+    for context_type in contexts:
+        if context_type not in stores.STORE_MODULES:
+            raise AttributeError(context.INVALID_CONTEXT.format(context_type))
+    memberships = [stores.load_store(ctx) for ctx in contexts]
+    keys = {}
+    for module in memberships:
+        for ski in list(module.CERTIFICATES) + list(module.UNTRUSTED):
+            key = _ski_key(ski)
+            if key is None:
+                raise ValueError(f"{ski} is not a key a tlsdb record can hold")
+            keys[key] = ski
+    records = sorted(keys)
+    positions = {keys[key]: position for position, key in enumerate(records)}
+    bitmap_size = (len(records) + 7) // 8
+    bitmaps = bytearray(bitmap_size * 2 * len(contexts))
+    refs = bytearray(REF.pack(NO_DER) * len(records) * len(contexts))
+    der_numbers = {}
+    der_table = bytearray()
+    blobs = bytearray()
+    for column, (ctx, module) in enumerate(zip(contexts, memberships)):
+        for ski, fingerprint in module.CERTIFICATES.items():
+            if ski not in positions:
+                continue
+            position = positions[ski]
+            if fingerprint not in der_numbers:
+                der = stores.get_der(fingerprint)
+                _, not_valid_after = stores.lookup_trust(ski, ctx)
+                der_numbers[fingerprint] = len(der_numbers)
+                der_table += DER.pack(len(blobs), len(der), not_valid_after)
+                blobs += der
+            bitmaps[column * 2 * bitmap_size + position // 8] |= 1 << (position % 8)
+            REF.pack_into(
+                refs,
+                (column * len(records) + position) * REF.size,
+                der_numbers[fingerprint],
+            )
+        for ski in module.UNTRUSTED:
+            if ski not in positions:
+                continue
+            position = positions[ski]
+            bitmaps[(column * 2 + 1) * bitmap_size + position // 8] |= 1 << (
+                position % 8
+            )
+    stores_offset = HEADER.size
+    index_offset = stores_offset + STORE.size * len(contexts)
+    bitmaps_offset = index_offset + RECORD.size * len(records)
+    refs_offset = bitmaps_offset + len(bitmaps)
+    ders_offset = refs_offset + len(refs)
+    blobs_offset = ders_offset + len(der_table)
+    path = Path(path)
+    # written beside path then renamed over it, so a reader mapping path never
+    # sees a partly written database
+    descriptor, temporary = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            handle.write(
+                HEADER.pack(
+                    MAGIC,
+                    len(contexts),
+                    len(records),
+                    len(der_numbers),
+                    0,
+                    stores_offset,
+                    index_offset,
+                    bitmaps_offset,
+                    refs_offset,
+                    ders_offset,
+                    blobs_offset,
+                )
+            )
+            for ctx in contexts:
+                handle.write(STORE.pack(ctx))
+            for key in records:
+                handle.write(key)
+            handle.write(bitmaps)
+            handle.write(refs)
+            handle.write(der_table)
+            handle.write(blobs)
+        # mkstemp creates the file readable by its owner only
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return path
@@ -0,0 +1,117 @@
+"""
+Time budgets for fetching a chain
+
+A fetch gets one deadline for all of its work, and each phase (connect,
+handshake) takes the smaller of what remains and a timeout adapted to the
+round trip times seen for the peer's network, so a dead host costs a bounded
+and predictable amount of time
+"""
+
+from ipaddress import ip_network
+from time import monotonic
+from .cache import LRUCache
+
+__module__ = "tlstrust.timing"
+
+# per phase, before anything is known about the network
+DEFAULT_TIMEOUT = 3
+# for the whole fetch, every protocol attempt included
+DEFAULT_DEADLINE = 10
+# a lost SYN is resent after 1s, the minimum RTO of RFC 6298 (2.4), so a fast
+# network never gets less than that, only the deadline cuts a phase shorter
+MIN_TIMEOUT = 1
+# a TLS 1.2 handshake takes two round trips, plus the server's key exchange work
+HANDSHAKE_ROUND_TRIPS = 2
+SERVER_ALLOWANCE = 1
+# RFC 6298 smoothing
+RTT_ALPHA = 1 / 8
+RTT_BETA = 1 / 4
+
+
+class Deadline:
+    """A point in time that phases draw their timeouts from"""
+
+    def __init__(self, seconds: float):
+        if not isinstance(seconds, (int, float)) or seconds <= 0:
+            raise ValueError(f"deadline {seconds} must be a positive number")
+        self.seconds = seconds
+        self.expires = monotonic() + seconds
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.expires - monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining == 0
+
+    def timeout(self, limit: float) -> float:
+        """limit, or less when the deadline is nearer, TimeoutError once it passed"""
+        remaining = self.remaining
+        if remaining == 0:
+            raise TimeoutError(f"deadline of {self.seconds}s exceeded")
+        return min(limit, remaining)
+
+
+def network_of(address: str) -> str:
+    """The /24 (IPv4) or /48 (IPv6) an address is in, RTTs are shared across it"""
+    prefix = 48 if ":" in address else 24
+    return str(ip_network(f"{address.split('%')[0]}/{prefix}", strict=False))
+
+
+class RTTEstimator:
+    """
+    Smoothed round trip time and variation per network, as TCP estimates its
+    retransmission timeout (RFC 6298), from observed connect times
+    """
+
+    def __init__(
+        self,
+        default_timeout: float = DEFAULT_TIMEOUT,
+        min_timeout: float = MIN_TIMEOUT,
+        maxsize: int = 4096,
+    ):
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self._networks = LRUCache(maxsize=maxsize)
+
+    def clear(self) -> None:
+        self._networks.clear()
+
+    def observe(self, address: str, rtt: float) -> None:
+        network = network_of(address)
+        estimate = self._networks.get(network)
+        if estimate is None:
+            estimate = (rtt, rtt / 2)
+        else:
+            smoothed, variation = estimate
+            variation = (1 - RTT_BETA) * variation + RTT_BETA * abs(smoothed - rtt)
+            smoothed = (1 - RTT_ALPHA) * smoothed + RTT_ALPHA * rtt
+            estimate = (smoothed, variation)
+        self._networks.put(network, estimate)
+
+    def rtt(self, address: str) -> tuple[float, float]:
+        """(smoothed RTT, variation) for the address's network, None when unseen"""
+        return self._networks.get(network_of(address))
+
+    def connect_timeout(self, address: str) -> float:
+        estimate = self.rtt(address)
+        if estimate is None:
+            return self.default_timeout
+        smoothed, variation = estimate
+        return self._bounded(smoothed + 4 * variation)
+
+    def handshake_timeout(self, address: str) -> float:
+        estimate = self.rtt(address)
+        if estimate is None:
+            return self.default_timeout
+        smoothed, variation = estimate
+        return self._bounded(
+            HANDSHAKE_ROUND_TRIPS * smoothed + 4 * variation + SERVER_ALLOWANCE
+        )
+
+    def _bounded(self, timeout: float) -> float:
+        return min(self.default_timeout, max(self.min_timeout, timeout))
+
+
+RTT = RTTEstimator()
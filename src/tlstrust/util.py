@@ -1,56 +1,99 @@
-import os
 import ssl
-import tempfile
-from socket import socket, AF_INET, SOCK_STREAM
+import asyncio
+import logging
+from selectors import DefaultSelector, EVENT_READ, EVENT_WRITE
+from time import monotonic
+from collections import deque, namedtuple
+from collections.abc import AsyncIterator, Callable, Iterable
+from socket import socket, gaierror
 from binascii import hexlify
+from hashlib import sha256
 import idna
 import validators
-from certifi import where
 from OpenSSL import SSL, _util
-from OpenSSL.crypto import X509, FILETYPE_PEM, load_certificate, dump_certificate
+from OpenSSL.crypto import X509, FILETYPE_ASN1, Error as CryptoError, load_certificate
 from cryptography import x509
+from cryptography.exceptions import InvalidSignature, UnsupportedAlgorithm
+from cryptography.hazmat.primitives.asymmetric import (
+    dsa,
+    ec,
+    ed448,
+    ed25519,
+    padding,
+    rsa,
+)
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
 from cryptography.x509.base import Certificate
 from cryptography.x509.extensions import (
     Extension,
     SubjectKeyIdentifier,
     AuthorityKeyIdentifier,
 )
-from retry.api import retry
+from .cache import LRUCache
 from .context import *  # noqa: F403
-from .stores import VERSIONS
-from .stores.android_2_2 import PEM_FILES as ANDROID2_2_PEM_FILES
-from .stores.android_2_3 import PEM_FILES as ANDROID2_3_PEM_FILES
-from .stores.android_3 import PEM_FILES as ANDROID3_PEM_FILES
-from .stores.android_4_4 import PEM_FILES as ANDROID4_4_PEM_FILES
-from .stores.android_4 import PEM_FILES as ANDROID4_PEM_FILES
-from .stores.android_7 import PEM_FILES as ANDROID7_PEM_FILES
-from .stores.android_8 import PEM_FILES as ANDROID8_PEM_FILES
-from .stores.android_9 import PEM_FILES as ANDROID9_PEM_FILES
-from .stores.android_10 import PEM_FILES as ANDROID10_PEM_FILES
-from .stores.android_11 import PEM_FILES as ANDROID11_PEM_FILES
-from .stores.android_12 import PEM_FILES as ANDROID12_PEM_FILES
-from .stores.android_13 import PEM_FILES as ANDROID13_PEM_FILES
-from .stores.android_14 import PEM_FILES as ANDROID14_PEM_FILES
-from .stores.android_latest import PEM_FILES as ANDROID_PEM_FILES
-from .stores.ccadb import PEM_FILES as CCADB_PEM_FILES
-from .stores.java import PEM_FILES as JAVA_PEM_FILES
-from .stores.certifi import PEM_FILES as CERTIFI_PEM_FILES
-from .stores.mintsifry_rossii import PEM_FILES as RUSSIA_PEM_FILES
-from .stores.rustls import PEM_FILES as RUST_PEM_FILES
-from .stores.curl import PEM_FILES as CURL_PEM_FILES
-from .stores.dart import PEM_FILES as DART_PEM_FILES
+from .stores import VERSIONS, SUBJECT_KEY_PREFIX, subject_hash
+from .registry import REGISTRY
+from .timing import DEFAULT_DEADLINE, RTT, Deadline
+from .records import ServerFlightParser
+from .resolver import (
+    RESOLVER,
+    address_of,
+    connect_first,
+    open_connection_first_async,
+)
 
 __module__ = "tlstrust.util"
 
+# the package logger, as tlstrust.logger
+logger = logging.getLogger("tlstrust")
+
 MISSING_MESSAGE = "Certificate does not exist"
+CERTIFICATE_CACHE = LRUCache(maxsize=8192)
+SIGNATURE_CACHE = LRUCache(maxsize=4096)
+CHAIN_CACHE = LRUCache(maxsize=4096)
+CONTEXT_CACHE = LRUCache(maxsize=64)
+# (host, port) -> the protocol method that last handshook
+PROTOCOL_CACHE = LRUCache(maxsize=16384)
+DEFAULT_MAX_DEPTH = 10
+DEFAULT_PATH_BUDGET = 256
+DEFAULT_CONCURRENCY = 100
+# tried in order until one handshakes
+PROTOCOL_METHODS = (
+    SSL.SSLv23_METHOD,
+    SSL.TLSv1_2_METHOD,
+    SSL.TLSv1_1_METHOD,
+    SSL.TLSv1_METHOD,
+)
+# OpenSSL 3 bindings may not export the renegotiation flag, it is bit 18
+LEGACY_OPTIONS = (
+    getattr(_util.lib, "SSL_OP_ALLOW_UNSAFE_LEGACY_RENEGOTIATION", 0x00040000)
+    | _util.lib.SSL_OP_LEGACY_SERVER_CONNECT
+)
+FAILURE_DNS = "dns"
+FAILURE_REFUSED = "refused"
+FAILURE_CONNECT = "connect"
+FAILURE_HANDSHAKE = "handshake"
+# handshake failures that only mean the protocol is not supported
+_EXPECTED_SSL_ERRORS = [
+    "no protocols available",
+    "alert protocol",
+    "shutdown while in init",
+    "sslv3 alert handshake failure",
+    "invalid status response",
+]
+_NOT_CACHED = object()
 
 
 class InvalidChainError(ValueError):
     """Raised when the certificate chain is empty or missing a server leaf certificate"""
 
 
+class HandshakeTimeoutError(TimeoutError):
+    """Raised when the deadline passes while handshaking rather than connecting"""
+
+
 def valid_context_type(context_type: int) -> bool:
-    return context_type is None or context_type in [ctx for _, ctx in STORES.items()]
+    return context_type is None or context_type in REGISTRY
 
 
 def get_key_identifier_hex(cert: Certificate, extension: Extension, key: str) -> str:
@@ -60,250 +103,1053 @@ def get_key_identifier_hex(cert: Certificate, extension: Extension, key: str) ->
 
 
 def match_certificate(aki, root_ca: X509) -> bool:
+    return _match_key_identifier(aki, root_ca.to_cryptography())
+
+
+def _match_key_identifier(aki, root_ca: Certificate) -> bool:
     return any(
         isinstance(ext.value, SubjectKeyIdentifier)
         and aki == hexlify(ext.value.key_identifier).decode("utf-8")
-        for ext in root_ca.to_cryptography().extensions
+        for ext in root_ca.extensions
+    )
+
+
+def verify_signature(issuer: Certificate, subject: Certificate) -> bool:
+    """
+    Whether subject is signed by the issuer's key. Results are held in
+    SIGNATURE_CACHE by (issuer SPKI hash, subject TBS hash), so an intermediate
+    shared by many hosts is only verified once
+    """
+    public_key = issuer.public_key()
+    key = (
+        sha256(
+            public_key.public_bytes(Encoding.DER, PublicFormat.SubjectPublicKeyInfo)
+        ).digest(),
+        sha256(subject.tbs_certificate_bytes).digest(),
+    )
+    verified = SIGNATURE_CACHE.get(key)
+    if verified is None:
+        verified = _verify_signature(public_key, subject)
+        SIGNATURE_CACHE.put(key, verified)
+    return verified
+
+
+def _verify_signature(public_key, subject: Certificate) -> bool:
+    try:
+        if isinstance(public_key, rsa.RSAPublicKey):
+            public_key.verify(
+                subject.signature,
+                subject.tbs_certificate_bytes,
+                _rsa_padding(subject),
+                subject.signature_hash_algorithm,
+            )
+        elif isinstance(public_key, ec.EllipticCurvePublicKey):
+            public_key.verify(
+                subject.signature,
+                subject.tbs_certificate_bytes,
+                ec.ECDSA(subject.signature_hash_algorithm),
+            )
+        elif isinstance(public_key, dsa.DSAPublicKey):
+            public_key.verify(
+                subject.signature,
+                subject.tbs_certificate_bytes,
+                subject.signature_hash_algorithm,
+            )
+        elif isinstance(public_key, (ed25519.Ed25519PublicKey, ed448.Ed448PublicKey)):
+            public_key.verify(subject.signature, subject.tbs_certificate_bytes)
+        else:
+            return False
+    except (InvalidSignature, UnsupportedAlgorithm, ValueError, TypeError):
+        return False
+    return True
+
+
+def _rsa_padding(subject: Certificate):
+    parameters = getattr(subject, "signature_algorithm_parameters", None)
+    if isinstance(parameters, padding.PSS):
+        return parameters
+    if subject.signature_algorithm_oid == x509.SignatureAlgorithmOID.RSASSA_PSS:
+        return padding.PSS(
+            mgf=padding.MGF1(subject.signature_hash_algorithm),
+            salt_length=padding.PSS.AUTO,
+        )
+    return padding.PKCS1v15()
+
+
+def ssl_context(method: int, client_cert: X509 = None) -> SSL.Context:
+    """
+    The client context for the protocol method and client certificate, built once
+    and shared by every connection and thread. Peers are never verified so no CA
+    bundle is loaded, and the client certificate is used from memory
+    """
+    key = (
+        method,
+        client_cert.digest("sha256") if isinstance(client_cert, X509) else None,
     )
+    ctx = CONTEXT_CACHE.get(key)
+    if ctx is None:
+        ctx = SSL.Context(method=method)
+        ctx.verify_mode = SSL.VERIFY_NONE
+        ctx.set_options(LEGACY_OPTIONS)
+        if isinstance(client_cert, X509):
+            ctx.use_certificate(client_cert)
+        CONTEXT_CACHE.put(key, ctx)
+    return ctx
+
+
+def classify_failure(ex: BaseException) -> str:
+    """
+    FAILURE_DNS, FAILURE_REFUSED or FAILURE_CONNECT for the transport failures
+    get_certificate_chain raises, anything else failed in the handshake.
+    The deadline passing is a HandshakeTimeoutError once the server accepted the
+    connection, so a server that never answers the handshake is not a connect
+    failure
+    """
+    if isinstance(ex, HandshakeTimeoutError):
+        return FAILURE_HANDSHAKE
+    if isinstance(ex, gaierror):
+        return FAILURE_DNS
+    if isinstance(ex, ConnectionRefusedError):
+        return FAILURE_REFUSED
+    if isinstance(ex, OSError):
+        return FAILURE_CONNECT
+    return FAILURE_HANDSHAKE
+
+
+def _check_handshake_deadline(budget: Deadline, host: str, port: int):
+    """
+    HandshakeTimeoutError when a handshake used up the deadline, the remaining
+    protocols are not tried without any time left to try them in
+    """
+    if budget.expired:
+        raise HandshakeTimeoutError(
+            f"deadline of {budget.seconds}s exceeded handshaking with {host}:{port}"
+        )
+
+
+def protocol_methods(host: str, port: int) -> list[int]:
+    """PROTOCOL_METHODS to try in order, the one that last worked for the host first"""
+    method = PROTOCOL_CACHE.get((host, port))
+    if method is None:
+        return list(PROTOCOL_METHODS)
+    return [method, *(other for other in PROTOCOL_METHODS if other != method)]
 
 
 def get_certificate_chain(
-    host: str, port: int, use_sni: bool = True, client_cert: X509 = None
+    host: str,
+    port: int,
+    use_sni: bool = True,
+    client_cert: X509 = None,
+    address: str = None,
+    deadline: float = DEFAULT_DEADLINE,
+    certificates_only: bool = False,
 ) -> tuple[X509, list[X509], str]:
+    """
+    Handshakes with each protocol in turn until one succeeds, None when none do.
+    Failing to resolve or connect is the same for every protocol, so the OSError
+    is raised at once, see classify_failure.
+
+    The host's addresses are raced and every protocol is tried against the one
+    that answered first, which is the peer address returned. address scans one
+    particular address of the host instead, see get_certificate_chains.
+
+    deadline is the seconds all attempts together may take, TimeoutError once it
+    passes, HandshakeTimeoutError when it passed during a handshake. Connect and
+    handshake timeouts adapt to the round trip times seen for the network
+    (timing.RTT) within what remains of it.
+
+    certificates_only hangs up as soon as the server's certificates arrive rather
+    than completing the handshake, see ChainFetch
+    """
     if not isinstance(port, int):
         raise TypeError(f"provided an invalid type {type(port)} for port, expected int")
     if validators.domain(host) is not True:
         raise ValueError(f"provided an invalid domain {host}")
-    for method in [
-        SSL.SSLv23_METHOD,
-        SSL.TLSv1_2_METHOD,
-        SSL.TLSv1_1_METHOD,
-        SSL.TLSv1_METHOD,
-    ]:
-        ctx = SSL.Context(method=method)
-        ctx.load_verify_locations(cafile=where())
-        ctx.verify_mode = SSL.VERIFY_NONE
-        ctx.set_options(
-            _util.lib.SSL_OP_ALLOW_UNSAFE_LEGACY_RENEGOTIATION
-            | _util.lib.SSL_OP_LEGACY_SERVER_CONNECT
+    addresses = _host_addresses(RESOLVER.resolve(host, port), host, address)
+    budget = Deadline(deadline)
+    fetch_chain = _fetch_certificates if certificates_only else _handshake_chain
+    for method in protocol_methods(host, port):
+        sock = connect_first(
+            addresses, budget.timeout(_connect_timeout(addresses)), observe=RTT.observe
         )
-        tmp = None
-        if isinstance(client_cert, X509):
-            tmp = tempfile.NamedTemporaryFile(delete=False)
-            tmp.write(dump_certificate(FILETYPE_PEM, client_cert))
-            tmp.close()
-            ctx.use_certificate_file(certfile=tmp.name, filetype=FILETYPE_PEM)
-        sock = socket(AF_INET, SOCK_STREAM)
-        sock.settimeout(3)
-        conn = SSL.Connection(context=ctx, socket=sock)
-        if all([use_sni, ssl.HAS_SNI]):
-            conn.set_tlsext_host_name(idna.encode(host))
-        certificate_chain = []
-        peer_address = None
+        peer_address = sock.getpeername()[0]
+        # stay on the address that answered for the remaining protocols
+        addresses = _answered(addresses, peer_address)
+        result = None
         try:
-            conn.connect((host, port))
-            conn.set_connect_state()
-            conn.setblocking(1)
-            do_handshake(conn)
-            peer_address, _ = conn.getpeername()
-            leaf = conn.get_peer_certificate()
-            certificate_chain.append(leaf)
-            for (_, cert) in enumerate(conn.get_peer_cert_chain()):
-                certificate_chain.append(cert)
-            conn.shutdown()
+            result = fetch_chain(
+                sock,
+                host,
+                method,
+                use_sni,
+                client_cert,
+                budget.timeout(RTT.handshake_timeout(peer_address)),
+            )
         except SSL.Error as err:
-            if all(
-                x not in str(err)
-                for x in [
-                    "no protocols available",
-                    "alert protocol",
-                    "shutdown while in init",
-                    "sslv3 alert handshake failure",
-                    "invalid status response",
-                ]
-            ):
-                print(err)
-        except Exception as ex:
-            print(ex)
+            if all(x not in str(err) for x in _EXPECTED_SSL_ERRORS):
+                logger.warning("%s:%s %s", host, port, err)
+        except OSError as ex:
+            logger.info("%s:%s %s", host, port, ex)
         finally:
-            conn.close()
-            if tmp:
-                os.unlink(tmp.name)
-        if certificate_chain and peer_address and leaf:
+            sock.close()
+        if result:
+            PROTOCOL_CACHE.put((host, port), method)
+            leaf, certificate_chain = result
             return leaf, certificate_chain, peer_address
+        _check_handshake_deadline(budget, host, port)
 
 
-def get_certificate_from_store(aki, context_type: int) -> X509:
-    if not valid_context_type(context_type):
-        raise AttributeError(INVALID_CONTEXT.format(context_type))
-    certificate = None
+def _handshake_chain(
+    sock: socket,
+    host: str,
+    method: int,
+    use_sni: bool,
+    client_cert: X509,
+    timeout: float,
+) -> tuple[X509, list[X509]]:
+    conn = SSL.Connection(context=ssl_context(method, client_cert), socket=sock)
+    if all([use_sni, ssl.HAS_SNI]):
+        conn.set_tlsext_host_name(idna.encode(host))
+    sock.setblocking(False)
+    conn.set_connect_state()
+    handshake(conn, timeout)
+    leaf = conn.get_peer_certificate()
+    certificate_chain = [leaf, *(conn.get_peer_cert_chain() or [])]
     try:
-        if context_type == SOURCE_CCADB:
-            certificate = load_certificate(FILETYPE_PEM, CCADB_PEM_FILES[aki].encode())
-        if context_type == SOURCE_ANDROID:
-            certificate = load_certificate(
-                FILETYPE_PEM, ANDROID_PEM_FILES[aki].encode()
-            )
-        if context_type == SOURCE_JAVA:
-            certificate = load_certificate(FILETYPE_PEM, JAVA_PEM_FILES[aki].encode())
-        if context_type == SOURCE_RUSSIA:
-            certificate = load_certificate(FILETYPE_PEM, RUSSIA_PEM_FILES[aki].encode())
-        if context_type == SOURCE_RUSTLS:
-            certificate = load_certificate(FILETYPE_PEM, RUST_PEM_FILES[aki].encode())
-        if context_type == SOURCE_CURL:
-            certificate = load_certificate(FILETYPE_PEM, CURL_PEM_FILES[aki].encode())
-        if context_type == SOURCE_DART:
-            certificate = load_certificate(FILETYPE_PEM, DART_PEM_FILES[aki].encode())
-        if context_type == SOURCE_CERTIFI:
-            certificate = load_certificate(
-                FILETYPE_PEM, CERTIFI_PEM_FILES[aki].encode()
-            )
-        if context_type == PLATFORM_ANDROID2_2:
-            certificate = load_certificate(
-                FILETYPE_PEM, ANDROID2_2_PEM_FILES[aki].encode()
-            )
-        if context_type == PLATFORM_ANDROID2_3:
-            certificate = load_certificate(
-                FILETYPE_PEM, ANDROID2_3_PEM_FILES[aki].encode()
-            )
-        if context_type == PLATFORM_ANDROID3:
-            certificate = load_certificate(
-                FILETYPE_PEM, ANDROID3_PEM_FILES[aki].encode()
-            )
-        if context_type == PLATFORM_ANDROID4:
-            certificate = load_certificate(
-                FILETYPE_PEM, ANDROID4_PEM_FILES[aki].encode()
-            )
-        if context_type == PLATFORM_ANDROID4_4:
-            certificate = load_certificate(
-                FILETYPE_PEM, ANDROID4_4_PEM_FILES[aki].encode()
-            )
-        if context_type == PLATFORM_ANDROID7:
-            certificate = load_certificate(
-                FILETYPE_PEM, ANDROID7_PEM_FILES[aki].encode()
-            )
-        if context_type == PLATFORM_ANDROID8:
-            certificate = load_certificate(
-                FILETYPE_PEM, ANDROID8_PEM_FILES[aki].encode()
-            )
-        if context_type == PLATFORM_ANDROID9:
-            certificate = load_certificate(
-                FILETYPE_PEM, ANDROID9_PEM_FILES[aki].encode()
-            )
-        if context_type == PLATFORM_ANDROID10:
-            certificate = load_certificate(
-                FILETYPE_PEM, ANDROID10_PEM_FILES[aki].encode()
-            )
-        if context_type == PLATFORM_ANDROID11:
-            certificate = load_certificate(
-                FILETYPE_PEM, ANDROID11_PEM_FILES[aki].encode()
+        conn.shutdown()
+    except SSL.Error:
+        pass
+    if leaf:
+        return leaf, certificate_chain
+
+
+def _fetch_certificates(
+    sock: socket,
+    host: str,
+    method: int,
+    use_sni: bool,
+    client_cert: X509,
+    timeout: float,
+) -> tuple[X509, list[X509]]:
+    fetch = ChainFetch(host, method, use_sni, client_cert, certificates_only=True)
+    expires = monotonic() + timeout
+    sock.sendall(fetch.start())
+    while not fetch.done:
+        remaining = expires - monotonic()
+        if remaining <= 0:
+            raise TimeoutError("handshake timed out")
+        sock.settimeout(remaining)
+        data = fetch.receive(sock.recv(16384))
+        if data:
+            sock.sendall(data)
+    if fetch.leaf:
+        return fetch.leaf, fetch.certificate_chain
+
+
+async def get_certificate_chain_async(
+    host: str,
+    port: int,
+    use_sni: bool = True,
+    client_cert: X509 = None,
+    address: str = None,
+    deadline: float = DEFAULT_DEADLINE,
+    certificates_only: bool = False,
+) -> tuple[X509, list[X509], str]:
+    """
+    get_certificate_chain on the running event loop, the TLS records pass through
+    pyOpenSSL memory BIOs so no thread blocks on the socket
+    """
+    if not isinstance(port, int):
+        raise TypeError(f"provided an invalid type {type(port)} for port, expected int")
+    if validators.domain(host) is not True:
+        raise ValueError(f"provided an invalid domain {host}")
+    addresses = _host_addresses(await RESOLVER.resolve_async(host, port), host, address)
+    budget = Deadline(deadline)
+    for method in protocol_methods(host, port):
+        reader, writer = await _open_connection_async(
+            addresses, host, port, budget.timeout(_connect_timeout(addresses))
+        )
+        peer_address = writer.get_extra_info("peername")[0]
+        addresses = _answered(addresses, peer_address)
+        try:
+            result = await asyncio.wait_for(
+                _handshake_chain_async(
+                    reader,
+                    writer,
+                    ChainFetch(host, method, use_sni, client_cert, certificates_only),
+                ),
+                budget.timeout(RTT.handshake_timeout(peer_address)),
             )
-        if context_type == PLATFORM_ANDROID12:
-            certificate = load_certificate(
-                FILETYPE_PEM, ANDROID12_PEM_FILES[aki].encode()
+        except SSL.Error as err:
+            if all(x not in str(err) for x in _EXPECTED_SSL_ERRORS):
+                logger.warning("%s:%s %s", host, port, err)
+            result = None
+        except asyncio.TimeoutError:
+            logger.info("%s:%s handshake timed out", host, port)
+            result = None
+        except OSError as ex:
+            logger.info("%s:%s %s", host, port, ex)
+            result = None
+        if result:
+            PROTOCOL_CACHE.put((host, port), method)
+            return result
+        _check_handshake_deadline(budget, host, port)
+
+
+def get_certificate_chains(
+    host: str,
+    port: int,
+    use_sni: bool = True,
+    client_cert: X509 = None,
+    deadline: float = DEFAULT_DEADLINE,
+    certificates_only: bool = False,
+) -> list[tuple[str, tuple[X509, list[X509], str]]]:
+    """
+    get_certificate_chain for every address of the host, as (address, result)
+    where result is the OSError raised for an address that could not be reached.
+    Load balanced names may present a different chain from each backend
+    """
+    if validators.domain(host) is not True:
+        raise ValueError(f"provided an invalid domain {host}")
+    results = []
+    for address in RESOLVER.resolve(host, port):
+        try:
+            result = get_certificate_chain(
+                host,
+                port,
+                use_sni,
+                client_cert,
+                address=address_of(address),
+                deadline=deadline,
+                certificates_only=certificates_only,
             )
-        if context_type == PLATFORM_ANDROID13:
-            certificate = load_certificate(
-                FILETYPE_PEM, ANDROID13_PEM_FILES[aki].encode()
+        except OSError as ex:
+            result = ex
+        results.append((address_of(address), result))
+    return results
+
+
+async def get_certificate_chains_async(
+    host: str,
+    port: int,
+    use_sni: bool = True,
+    client_cert: X509 = None,
+    deadline: float = DEFAULT_DEADLINE,
+    certificates_only: bool = False,
+) -> list[tuple[str, tuple[X509, list[X509], str]]]:
+    """get_certificate_chains with every address scanned at once"""
+    if validators.domain(host) is not True:
+        raise ValueError(f"provided an invalid domain {host}")
+    addresses = [
+        address_of(address) for address in await RESOLVER.resolve_async(host, port)
+    ]
+    results = await asyncio.gather(
+        *(
+            get_certificate_chain_async(
+                host,
+                port,
+                use_sni,
+                client_cert,
+                address=address,
+                deadline=deadline,
+                certificates_only=certificates_only,
             )
-        if context_type == PLATFORM_ANDROID14:
-            certificate = load_certificate(
-                FILETYPE_PEM, ANDROID14_PEM_FILES[aki].encode()
+            for address in addresses
+        ),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, OSError):
+            raise result
+    return list(zip(addresses, results))
+
+
+def _host_addresses(
+    addresses: list[tuple[int, tuple]], host: str, address: str = None
+) -> list[tuple[int, tuple]]:
+    if address is None:
+        return addresses
+    pinned = [each for each in addresses if address_of(each) == address]
+    if not pinned:
+        raise ValueError(f"{address} is not an address of {host}")
+    return pinned
+
+
+def _connect_timeout(addresses: list[tuple[int, tuple]]) -> float:
+    return max(RTT.connect_timeout(address_of(address)) for address in addresses)
+
+
+class HandshakeDriver:
+    """
+    Drives the handshakes of non-blocking connections, any number at once from
+    one thread. Each connection is stepped only when its socket is ready for
+    what OpenSSL wants next, and fails with TimeoutError once its own timeout
+    passes, so no handshake sleeps or blocks another
+    """
+
+    def __init__(self):
+        self._selector = DefaultSelector()
+        self._expires: dict[SSL.Connection, float] = {}
+        self.results: dict[SSL.Connection, BaseException] = {}
+
+    def add(self, conn: SSL.Connection, timeout: float):
+        """Start the handshake of a connected, non-blocking client connection"""
+        self._expires[conn] = monotonic() + timeout
+        self._step(conn)
+
+    def run(self) -> dict[SSL.Connection, BaseException]:
+        """
+        Drive every handshake to completion, the result of each is None or the
+        exception it failed with
+        """
+        try:
+            while self._expires:
+                now = monotonic()
+                for conn, expires in list(self._expires.items()):
+                    if expires <= now:
+                        self._finish(conn, TimeoutError("handshake timed out"))
+                if not self._expires:
+                    break
+                wait = min(self._expires.values()) - now
+                for key, _ in self._selector.select(wait):
+                    self._step(key.data)
+        finally:
+            self._selector.close()
+        return self.results
+
+    def _step(self, conn: SSL.Connection):
+        try:
+            conn.do_handshake()
+        except SSL.WantReadError:
+            self._wait(conn, EVENT_READ)
+        except SSL.WantWriteError:
+            self._wait(conn, EVENT_WRITE)
+        except (SSL.Error, OSError) as ex:
+            self._finish(conn, ex)
+        else:
+            self._finish(conn, None)
+
+    def _wait(self, conn: SSL.Connection, events: int):
+        try:
+            self._selector.modify(conn, events, conn)
+        except KeyError:
+            self._selector.register(conn, events, conn)
+
+    def _finish(self, conn: SSL.Connection, result: BaseException):
+        self._expires.pop(conn, None)
+        try:
+            self._selector.unregister(conn)
+        except KeyError:
+            pass
+        self.results[conn] = result
+
+
+def handshake(conn: SSL.Connection, timeout: float):
+    """
+    Completes the handshake on a non-blocking connection, raises what it failed
+    with, TimeoutError after timeout seconds
+    """
+    driver = HandshakeDriver()
+    driver.add(conn, timeout)
+    error = driver.run()[conn]
+    if error is not None:
+        raise error
+
+
+class ChainFetch:
+    """
+    The client side of one handshake over pyOpenSSL memory BIOs, for any
+    transport to carry: send what start() returns, then pass each read to
+    receive() and send what it returns until done.
+
+    With certificates_only the fetch is done as soon as the server's
+    certificates are known, nothing more is sent and close() returns no
+    close_notify. Up to TLS 1.2 the Certificate message is read straight from
+    the records (records.ServerFlightParser) and OpenSSL never processes the
+    server's flight, so no key exchange is computed on either end and the
+    client's flight is never sent. TLS 1.3 encrypts it, there OpenSSL handles
+    the server's flight and the fetch ends before the client Finished is sent
+    """
+
+    def __init__(
+        self,
+        host: str,
+        method: int,
+        use_sni: bool = True,
+        client_cert: X509 = None,
+        certificates_only: bool = False,
+    ):
+        self.certificates_only = certificates_only
+        self.leaf: X509 = None
+        self.certificate_chain: list[X509] = None
+        self._parser = ServerFlightParser() if certificates_only else None
+        self._conn = SSL.Connection(
+            context=ssl_context(method, client_cert), socket=None
+        )
+        if all([use_sni, ssl.HAS_SNI]):
+            self._conn.set_tlsext_host_name(idna.encode(host))
+        self._conn.set_connect_state()
+
+    @property
+    def done(self) -> bool:
+        return self.certificate_chain is not None
+
+    def start(self) -> bytes:
+        """The ClientHello"""
+        self._handshake()
+        return self._pending()
+
+    def receive(self, data: bytes) -> bytes:
+        """Takes bytes read from the server, returns the bytes to send it"""
+        if not data:
+            raise SSL.Error("shutdown while in init")
+        self._conn.bio_write(data)
+        if self._parser is not None and self._parser.plaintext:
+            certificates = self._parser.feed(data)
+            if certificates:
+                try:
+                    chain = [
+                        load_certificate(FILETYPE_ASN1, der) for der in certificates
+                    ]
+                except CryptoError:
+                    self._parser.plaintext = False
+                else:
+                    self._finish(chain[0], chain)
+                    return b""
+            if self._parser.plaintext:
+                return b""
+        self._handshake()
+        if self.done and self.certificates_only:
+            return b""
+        return self._pending()
+
+    def close(self) -> bytes:
+        """The rest of the client's flight and close_notify, once done"""
+        if self.certificates_only:
+            return b""
+        try:
+            self._conn.shutdown()
+        except SSL.Error:
+            pass
+        return self._pending()
+
+    def _handshake(self):
+        try:
+            self._conn.do_handshake()
+        except SSL.WantReadError:
+            if self.certificates_only and self._conn.get_peer_cert_chain():
+                self._finish(
+                    self._conn.get_peer_certificate(), self._conn.get_peer_cert_chain()
+                )
+            return
+        self._finish(
+            self._conn.get_peer_certificate(), self._conn.get_peer_cert_chain() or []
+        )
+
+    def _finish(self, leaf: X509, peer_chain: list[X509]):
+        self.leaf = leaf
+        self.certificate_chain = [leaf, *peer_chain]
+
+    def _pending(self) -> bytes:
+        data = b""
+        while True:
+            try:
+                data += self._conn.bio_read(16384)
+            except SSL.WantReadError:
+                return data
+
+
+def _answered(
+    addresses: list[tuple[int, tuple]], peer_address: str
+) -> list[tuple[int, tuple]]:
+    return [each for each in addresses if address_of(each) == peer_address] or addresses
+
+
+async def _open_connection_async(
+    addresses: list[tuple[int, tuple]], host: str, port: int, timeout: float
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    try:
+        return await asyncio.wait_for(
+            open_connection_first_async(addresses, observe=RTT.observe), timeout
+        )
+    except asyncio.TimeoutError as ex:
+        # asyncio.TimeoutError is not an OSError before Python 3.11
+        raise TimeoutError(f"timed out connecting to {host}:{port}") from ex
+
+
+async def _handshake_chain_async(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    fetch: ChainFetch,
+) -> tuple[X509, list[X509], str]:
+    try:
+        writer.write(fetch.start())
+        await writer.drain()
+        while not fetch.done:
+            data = fetch.receive(await reader.read(16384))
+            if data:
+                writer.write(data)
+                await writer.drain()
+        peer_address = writer.get_extra_info("peername")[0]
+        try:
+            writer.write(fetch.close())
+            await writer.drain()
+        except (SSL.Error, OSError):
+            pass
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+    if fetch.leaf and peer_address:
+        return fetch.leaf, fetch.certificate_chain, peer_address
+
+
+async def iter_certificate_chains_async(
+    targets: Iterable[tuple[str, int]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    **kwargs,
+) -> AsyncIterator[tuple[str, int, tuple[X509, list[X509], str]]]:
+    """
+    (host, port, result) for each (host, port) target as its fetch completes, at
+    most concurrency fetches in flight. result is what get_certificate_chain_async
+    returns, or the exception it raised (an OSError when the target could not be
+    reached, ValueError or TypeError for an invalid target), so one bad target
+    never stops the others. kwargs are passed on to it
+    """
+    if not isinstance(concurrency, int) or concurrency < 1:
+        raise ValueError(f"concurrency {concurrency} must be a positive int")
+
+    async def fetch(host: str, port: int):
+        try:
+            return host, port, await get_certificate_chain_async(host, port, **kwargs)
+        except Exception as ex:  # pylint: disable=broad-except
+            return host, port, ex
+
+    targets = iter(targets)
+    pending = set()
+    try:
+        while True:
+            for host, port in targets:
+                pending.add(asyncio.ensure_future(fetch(host, port)))
+                if len(pending) >= concurrency:
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
             )
-    except KeyError:
-        pass
-    if certificate is None or not match_certificate(aki, certificate):
-        raise FileExistsError(MISSING_MESSAGE)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def get_certificate_from_store(aki, context_type: int) -> X509:
+    certificate, _ = load_store_certificate(aki, context_type)
     return certificate
 
 
+def load_store_certificate(aki, context_type: int) -> tuple[X509, Certificate]:
+    """
+    Parsed root certificate for the key identifier in the trust store, along with
+    its cryptography form. Results (including misses) are held in CERTIFICATE_CACHE
+    so each root is decoded at most once per process
+    """
+    if not valid_context_type(context_type):
+        raise AttributeError(INVALID_CONTEXT.format(context_type))
+    # a store registered again under the same context type must not see old roots
+    cache_key = (aki, context_type, REGISTRY.generation)
+    cached = CERTIFICATE_CACHE.get(cache_key, _NOT_CACHED)
+    if cached is _NOT_CACHED:
+        cached = _parse_store_certificate(aki, context_type)
+        CERTIFICATE_CACHE.put(cache_key, cached)
+    if cached is None:
+        raise FileExistsError(MISSING_MESSAGE)
+    return cached
+
+
+def _parse_store_certificate(aki, context_type: int) -> tuple[X509, Certificate]:
+    certificate = REGISTRY[context_type].certificate(aki)
+    if certificate is None:
+        return None
+    parsed = certificate.to_cryptography()
+    if aki.startswith(SUBJECT_KEY_PREFIX):
+        if SUBJECT_KEY_PREFIX + subject_hash(parsed.subject) != aki:
+            return None
+    elif not _match_key_identifier(aki, parsed):
+        return None
+    return certificate, parsed
+
+
 def get_cn_or_org(certificate: X509) -> str:
-    cn_oid = certificate.to_cryptography().subject.get_attributes_for_oid(
-        x509.OID_COMMON_NAME
+    return _cn_or_org(certificate.to_cryptography())
+
+
+def _cn_or_org(certificate: Certificate) -> str:
+    cn_oid = certificate.subject.get_attributes_for_oid(x509.OID_COMMON_NAME)
+    if not cn_oid:
+        cn_oid = certificate.subject.get_attributes_for_oid(x509.OID_ORGANIZATION_NAME)
+    return cn_oid[0]._value  # pylint: disable=protected-access
+
+
+class CertificateRecord(
+    namedtuple(
+        "CertificateRecord",
+        [
+            "certificate",
+            "ski",
+            "aki",
+            "subject",
+            "issuer",
+            "common_name",
+            "subject_hash",
+            "issuer_hash",
+            "parsed",
+        ],
     )
-    if cn_oid:
-        name = cn_oid[0]._value  # pylint: disable=protected-access
-    else:
-        name = (
-            certificate.to_cryptography()
-            .subject.get_attributes_for_oid(x509.OID_ORGANIZATION_NAME)[0]
-            ._value
-        )  # pylint: disable=protected-access
-    return name
-
-
-def build_chains(leaf: X509, certificates: list[X509]) -> dict:
-    roots: list[X509] = []
-    chains = {}
-    leaf_aki = get_key_identifier_hex(
-        leaf.to_cryptography(), extension=AuthorityKeyIdentifier, key="key_identifier"
+):
+    __slots__ = ()
+
+    @property
+    def key(self) -> str:
+        """SKI, or the subject DN hash key when the certificate has none"""
+        return self.ski or SUBJECT_KEY_PREFIX + self.subject_hash
+
+    @property
+    def issuer_key(self) -> str:
+        """AKI, or the issuer DN hash key when the certificate has none"""
+        return self.aki or SUBJECT_KEY_PREFIX + self.issuer_hash
+
+
+def certificate_record(
+    certificate: X509, parsed: Certificate = None
+) -> CertificateRecord:
+    """Everything chain building needs from a certificate, extracted in one parse"""
+    if parsed is None:
+        parsed = certificate.to_cryptography()
+    return CertificateRecord(
+        certificate,
+        get_key_identifier_hex(parsed, extension=SubjectKeyIdentifier, key="digest"),
+        get_key_identifier_hex(
+            parsed, extension=AuthorityKeyIdentifier, key="key_identifier"
+        ),
+        parsed.subject,
+        parsed.issuer,
+        _cn_or_org(parsed),
+        subject_hash(parsed.subject),
+        subject_hash(parsed.issuer),
+        parsed,
     )
-    aki_lookup = {leaf_aki: [leaf]}
-    for cert in certificates:
-        aki = get_key_identifier_hex(
-            cert.to_cryptography(),
-            extension=AuthorityKeyIdentifier,
-            key="key_identifier",
+
+
+def find_root(aki: str, issuer_hash: str = None) -> CertificateRecord:
+    """
+    The root for an AKI from the first store holding it, via the registry root
+    index. With the issuer DN hash, roots keyed by subject DN are matched as well,
+    and when there is no AKI any root with that subject is
+    """
+    keys = [aki] if aki else []
+    if issuer_hash is not None:
+        keys.extend(
+            key
+            for key in REGISTRY.subject_index().get(issuer_hash, ())
+            if not aki or key.startswith(SUBJECT_KEY_PREFIX)
         )
-        if aki == leaf_aki:
-            continue
-        aki_lookup.setdefault(aki, [])
-        aki_lookup[aki].append(cert)
-        for _, context_type in STORES.items():
+    root_index = REGISTRY.root_index()
+    for key in keys:
+        for context_type in root_index.get(key, ()):
             try:
-                ret = get_certificate_from_store(aki, context_type)
+                certificate, parsed = load_store_certificate(key, context_type)
             except FileExistsError:
                 continue
-            root_ski = get_key_identifier_hex(
-                ret.to_cryptography(), extension=SubjectKeyIdentifier, key="digest"
-            )
-            if root_ski not in [
-                get_key_identifier_hex(
-                    c.to_cryptography(), extension=SubjectKeyIdentifier, key="digest"
-                )
-                for c in roots
-            ]:
-                roots.append(ret)
-
-    def next_chain(ski: str, lookup: dict) -> list[dict]:
-        chain = []
-        for next_cert in lookup.get(ski, []):
-            next_common_name = get_cn_or_org(next_cert)
-            next_ski = get_key_identifier_hex(
-                next_cert.to_cryptography(),
-                extension=SubjectKeyIdentifier,
-                key="digest",
-            )
-            next_aki = get_key_identifier_hex(
-                next_cert.to_cryptography(),
-                extension=AuthorityKeyIdentifier,
-                key="key_identifier",
-            )
-            chain.append(
-                {
-                    "certificate": next_cert,
-                    "ski": next_ski,
-                    "aki": next_aki,
-                    "common_name": next_common_name,
-                    "next": next_chain(next_ski, lookup),
-                }
-            )
-        return chain
+            return certificate_record(certificate, parsed)
+    return None
 
-    index = 0
-    for cert in roots:
-        ski = get_key_identifier_hex(
-            cert.to_cryptography(), extension=SubjectKeyIdentifier, key="digest"
-        )
-        common_name = get_cn_or_org(cert)
-        chains[str(index)] = {
-            "certificate": cert,
-            "ski": ski,
-            "common_name": common_name,
-            "next": next_chain(ski, aki_lookup),
+
+class ChainGraph:
+    """
+    Issuer -> subject DAG from the store roots down to the leaf. Subtrees of a
+    certificate SKI are built once and shared by every issuer, edges back to a
+    certificate already on the path (cross-signs, self-issued) are dropped and
+    nothing deeper than max_depth below a root is followed
+    """
+
+    def __init__(
+        self,
+        leaf: CertificateRecord,
+        roots: list[CertificateRecord],
+        issued: dict[str, list[CertificateRecord]],
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        verify: bool = False,
+    ):
+        if not isinstance(max_depth, int) or max_depth < 1:
+            raise ValueError(f"max_depth {max_depth} must be a positive int")
+        self.leaf = leaf
+        self.max_depth = max_depth
+        self.verify = verify
+        self.cycles = 0
+        self.unverified = 0
+        self.truncated = False
+        self.budget_exhausted = False
+        self._issued = issued
+        self._subtrees: dict[str, list[dict]] = {}
+        self.chains = {}
+        for index, root in enumerate(roots):
+            self.chains[str(index)] = {
+                "certificate": root.certificate,
+                "ski": root.key,
+                "common_name": root.common_name,
+                "next": self._subtree(root),
+            }
+
+    @staticmethod
+    def _node(record: CertificateRecord) -> dict:
+        return {
+            "certificate": record.certificate,
+            "ski": record.key,
+            "aki": record.issuer_key,
+            "common_name": record.common_name,
+            "next": [],
+        }
+
+    def _issued_by(self, record: CertificateRecord) -> list[CertificateRecord]:
+        records = self._issued.get(record.key, [])
+        # certificates without an AKI are filed under their issuer DN
+        subject = SUBJECT_KEY_PREFIX + record.subject_hash
+        if record.key != subject and subject in self._issued:
+            records = records + self._issued[subject]
+        return records
+
+    def _subtree(self, root: CertificateRecord) -> list[dict]:
+        if root.key in self._subtrees:
+            return self._subtrees[root.key]
+        # frame: issuer, depth, records it issued, next record, nodes built, complete
+        stack = [[root, 0, self._issued_by(root), 0, [], True]]
+        on_path = {root.key}
+        while True:
+            frame = stack[-1]
+            issuer, depth, records, position, nodes, complete = frame
+            if position == len(records):
+                stack.pop()
+                on_path.discard(issuer.key)
+                # a subtree cut short by the path it was reached on is not shared
+                if complete:
+                    self._subtrees[issuer.key] = nodes
+                if not stack:
+                    return nodes
+                stack[-1][4][-1]["next"] = nodes
+                stack[-1][5] = stack[-1][5] and complete
+                continue
+            frame[3] += 1
+            record = records[position]
+            if record.key in on_path:
+                self.cycles += 1
+                frame[5] = False
+                continue
+            if self.verify and not verify_signature(issuer.parsed, record.parsed):
+                self.unverified += 1
+                continue
+            node = self._node(record)
+            nodes.append(node)
+            if record.key in self._subtrees:
+                node["next"] = self._subtrees[record.key]
+                continue
+            issued = self._issued_by(record)
+            if not issued:
+                continue
+            if depth + 1 >= self.max_depth:
+                self.truncated = True
+                frame[5] = False
+                continue
+            on_path.add(record.key)
+            stack.append([record, depth + 1, issued, 0, [], True])
+
+    def shortest_paths(
+        self,
+        contexts: list[int] = None,
+        trusted: Callable[[str, int], bool] = None,
+        budget: int = DEFAULT_PATH_BUDGET,
+    ) -> dict[int, list[X509]]:
+        """
+        The shortest leaf -> root path per store, found breadth-first upward from
+        the leaf so each certificate is expanded at most once and the search
+        stops as soon as every store has a path or the budget of expanded
+        certificates is spent. trusted(root_key, context_type) decides whether a
+        root counts for the store, by default it only has to be in the store
+        """
+        if not isinstance(budget, int) or budget < 1:
+            raise ValueError(f"budget {budget} must be a positive int")
+        root_index = REGISTRY.root_index()
+        contexts = list(REGISTRY) if contexts is None else list(contexts)
+        wanted = set(contexts)
+        if trusted is None:
+
+            def trusted(_, __) -> bool:
+                return True
+
+        parents, roots = self._parents()
+        found = {}
+        previous = {id(self.leaf.certificate): None}
+        certificates = {id(self.leaf.certificate): self.leaf.certificate}
+        queue = deque([id(self.leaf.certificate)])
+        self.budget_exhausted = False
+        while queue and wanted:
+            if budget == 0:
+                self.budget_exhausted = True
+                break
+            budget -= 1
+            current = queue.popleft()
+            if current in roots:
+                key = roots[current]
+                for context_type in root_index.get(key, ()):
+                    if context_type in wanted and trusted(key, context_type):
+                        wanted.discard(context_type)
+                        found[context_type] = current
+            for parent, certificate in parents.get(current, {}).items():
+                if parent not in previous:
+                    previous[parent] = current
+                    certificates[parent] = certificate
+                    queue.append(parent)
+        paths = {}
+        for context_type in contexts:
+            if context_type not in found:
+                continue
+            path = []
+            node = found[context_type]
+            while node is not None:
+                path.append(certificates[node])
+                node = previous[node]
+            paths[context_type] = path[::-1]
+        return paths
+
+    def _parents(self) -> tuple[dict[int, dict[int, X509]], dict[int, str]]:
+        """Reverse edges over the graph by certificate, and the root certificates"""
+        parents: dict[int, dict[int, X509]] = {}
+        roots = {}
+        seen = set()
+        stack = []
+        for chain in self.chains.values():
+            roots[id(chain["certificate"])] = chain["ski"]
+            stack.append(chain)
+        while stack:
+            node = stack.pop()
+            for child in node["next"]:
+                parents.setdefault(id(child["certificate"]), {})[
+                    id(node["certificate"])
+                ] = node["certificate"]
+                if id(child) not in seen:
+                    seen.add(id(child))
+                    stack.append(child)
+        return parents, roots
+
+    def paths(self, index: str = None) -> list[list[X509]]:
+        """Every leaf -> root path through the graph, or from the one root index"""
+        paths = []
+        chains = self.chains.values() if index is None else [self.chains[index]]
+        for chain in chains:
+            stack = [(chain, [chain["certificate"]])]
+            while stack:
+                node, path = stack.pop()
+                if node["certificate"] is self.leaf.certificate:
+                    paths.append(path[::-1])
+                    continue
+                for child in reversed(node["next"]):
+                    stack.append((child, path + [child["certificate"]]))
+        return paths
+
+
+def build_chain_graph(
+    leaf: X509,
+    certificates: list[X509],
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    verify: bool = False,
+    intermediates=None,
+) -> ChainGraph:
+    """
+    verify checks every issuer -> subject signature and drops the edges that do
+    not verify, otherwise issuers are matched on key identifiers (or DN) alone.
+    intermediates is an intermediates.IntermediateStore to fill the links the
+    presented certificates leave missing, up to max_depth learned certificates deep
+    """
+    leaf_record = certificate_record(leaf)
+    issued = {leaf_record.issuer_key: [leaf_record]}
+    roots: dict[str, CertificateRecord] = {}
+
+    def add(record: CertificateRecord):
+        if record.issuer_key == leaf_record.issuer_key:
+            return
+        issued.setdefault(record.issuer_key, [])
+        issued[record.issuer_key].append(record)
+        if record.issuer_key in roots:
+            return
+        root = find_root(record.aki, record.issuer_hash)
+        if root is None:
+            return
+        if root.key not in roots:
+            roots[root.key] = root
+        if record.issuer_key not in (
+            root.key,
+            SUBJECT_KEY_PREFIX + root.subject_hash,
+        ):
+            # matched on issuer DN to a root keyed by its subject DN
+            issued.setdefault(root.key, []).append(record)
+
+    records = [certificate_record(cert) for cert in certificates]
+    for record in records:
+        add(record)
+    if intermediates is not None:
+        _fill_missing_links(leaf_record, records, intermediates, add, max_depth)
+    return ChainGraph(leaf_record, list(roots.values()), issued, max_depth, verify)
+
+
+def _fill_missing_links(
+    leaf_record: CertificateRecord,
+    records: list[CertificateRecord],
+    intermediates,
+    add: Callable[[CertificateRecord], None],
+    max_depth: int,
+):
+    """Add learned intermediates for every issuer neither presented nor a root"""
+    known = {leaf_record.key, SUBJECT_KEY_PREFIX + leaf_record.subject_hash}
+    seen = {record.certificate.digest("sha256") for record in records}
+    for record in records:
+        known.update((record.key, SUBJECT_KEY_PREFIX + record.subject_hash))
+    pending = [leaf_record, *records]
+    for _ in range(max_depth):
+        missing = {
+            record.issuer_key
+            for record in pending
+            if record.issuer_key not in known
+            and find_root(record.aki, record.issuer_hash) is None
         }
-        index += 1
-    return chains
+        pending = []
+        for issuer_key in missing:
+            known.add(issuer_key)
+            for cert in intermediates.issuers(issuer_key):
+                if cert.digest("sha256") in seen:
+                    continue
+                seen.add(cert.digest("sha256"))
+                record = certificate_record(cert)
+                known.update((record.key, SUBJECT_KEY_PREFIX + record.subject_hash))
+                add(record)
+                pending.append(record)
+        if not pending:
+            return
+
+
+def build_chains(
+    leaf: X509,
+    certificates: list[X509],
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    verify: bool = False,
+    intermediates=None,
+) -> dict:
+    return build_chain_graph(
+        leaf, certificates, max_depth, verify, intermediates
+    ).chains
 
 
 def get_store_result_text(name: str, **kwargs) -> dict:
@@ -321,11 +1167,3 @@ def get_store_result_text(name: str, **kwargs) -> dict:
             trust_status += " EXPIRED"
 
     return trust_status
-
-
-@retry(SSL.WantReadError, tries=3, delay=0.5)
-def do_handshake(conn):
-    try:
-        conn.do_handshake()
-    except SSL.SysCallError:
-        pass